@@ -90,6 +90,9 @@ def runtests():
     if args.bench:
         benchmarks = [
             "wagtail.admin.tests.benches",
+            "wagtail.contrib.frontend_cache.benches",
+            "wagtail.embeds.tests.benches",
+            "wagtail.tests.benches",
         ]
 
         argv = [sys.argv[0], "test", "-v2"] + benchmarks + rest
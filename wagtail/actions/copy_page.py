@@ -1,10 +1,20 @@
 import logging
 import uuid
+from collections import Counter, defaultdict
+from itertools import islice
 
 from django.core.exceptions import PermissionDenied
-from modelcluster.models import get_all_child_relations
-
-from wagtail.log_actions import log
+from django.db import connections, router, transaction
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.utils import timezone
+from modelcluster.models import (
+    ClusterableModel,
+    get_all_child_m2m_relations,
+    get_all_child_relations,
+)
+
+from wagtail.log_actions import get_active_log_context, log
 from wagtail.models.copying import _copy, _copy_m2m_relations
 from wagtail.models.i18n import TranslatableMixin
 from wagtail.signals import page_published
@@ -31,8 +41,19 @@ class CopyPagePermissionError(PermissionDenied):
 class CopyPageAction:
     """
     Copies pages and page trees.
+
+    When ``bulk`` is set on a recursive copy, the descendants of the page are
+    copied ``bulk_batch_size`` at a time, saving each batch with a few queries
+    per page model rather than several per page. Their tree positions are
+    taken from the originals', so no tree operations are needed. ``post_save``
+    and ``page_published`` are sent for the pages of each batch once it is
+    saved, but ``pre_save`` isn't sent, and the pages' ``save`` methods
+    aren't called.
     """
 
+    # The number of descendants copied at a time when copying in bulk
+    bulk_batch_size = 500
+
     def __init__(
         self,
         page,
@@ -46,6 +67,7 @@ class CopyPageAction:
         process_child_object=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
     ):
         # Note: These four parameters don't apply to any copied children
         self.page = page
@@ -60,6 +82,7 @@ class CopyPageAction:
         self.process_child_object = process_child_object
         self.log_action = log_action
         self.reset_translation_key = reset_translation_key
+        self.bulk = bulk
         self._uuid_mapping = {}
 
     def generate_translation_key(self, old_uuid):
@@ -107,10 +130,11 @@ class CopyPageAction:
                         "You do not have permission to publish a page at the destination."
                     )
 
-    def _copy_page(
-        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
-    ):
-        specific_page = page.specific
+    def _get_copy_options(self, specific_page, update_attrs=None, exclude_fields=None):
+        """
+        Returns the fields to exclude from the copy of the page, and the
+        attributes to set on it
+        """
         exclude_fields = (
             specific_page.default_exclude_fields_in_copy
             + specific_page.exclude_fields_in_copy
@@ -140,10 +164,17 @@ class CopyPageAction:
         if update_attrs:
             base_update_attrs.update(update_attrs)
 
+        return exclude_fields, base_update_attrs
+
+    def _make_copy(self, specific_page, exclude_fields, base_update_attrs):
+        """
+        Returns an unsaved copy of the page, and a dict mapping its child
+        objects' relations and original primary keys to their unsaved copies
+        """
         page_copy, child_object_map = _copy(
             specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
         )
-        # Save copied child objects and run process_child_object on them if we need to
+        # Run process_child_object on copied child objects if we need to
         for (child_relation, old_pk), child_object in child_object_map.items():
             if self.process_child_object:
                 self.process_child_object(
@@ -157,6 +188,100 @@ class CopyPageAction:
                     child_object.translation_key
                 )
 
+        return page_copy, child_object_map
+
+    def _copy_revision(
+        self,
+        revision,
+        specific_page,
+        page_copy,
+        child_object_map,
+        exclude_fields,
+        page_copy_data,
+    ):
+        """
+        Turns the revision into an unsaved revision of the page copy
+        """
+        revision.pk = None
+        revision.approved_go_live_at = None
+        revision.object_id = page_copy.id
+
+        # Update ID fields in content
+        revision_content = revision.content
+        revision_content["pk"] = page_copy.pk
+
+        for child_relation in get_all_child_relations(specific_page):
+            accessor_name = child_relation.get_accessor_name()
+            try:
+                child_objects = revision_content[accessor_name]
+            except KeyError:
+                # KeyErrors are possible if the revision was created
+                # before this child relation was added to the database
+                continue
+
+            for child_object in child_objects:
+                child_object[child_relation.field.name] = page_copy.pk
+                # Remap primary key to copied versions
+                # If the primary key is not recognised (eg, the child object has been deleted from the database)
+                # set the primary key to None
+                copied_child_object = child_object_map.get(
+                    (child_relation, child_object["pk"])
+                )
+                child_object["pk"] = (
+                    copied_child_object.pk if copied_child_object else None
+                )
+                if self.reset_translation_key and "translation_key" in child_object:
+                    child_object["translation_key"] = self.generate_translation_key(
+                        child_object["translation_key"]
+                    )
+
+        for field_name in exclude_fields:
+            if field_name in revision_content:
+                revision_content[field_name] = page_copy_data.get(field_name)
+
+        revision.content = revision_content
+        return revision
+
+    def _get_log_data(self, page, page_copy, parent, to):
+        return {
+            "page": {
+                "id": page_copy.id,
+                "title": page_copy.get_admin_display_title(),
+                "locale": {
+                    "id": page_copy.locale_id,
+                    "language_code": page_copy.locale.language_code,
+                },
+            },
+            "source": {
+                "id": parent.id,
+                "title": parent.specific_deferred.get_admin_display_title(),
+            }
+            if parent
+            else None,
+            "destination": {
+                "id": to.id,
+                "title": to.specific_deferred.get_admin_display_title(),
+            }
+            if to
+            else None,
+            "keep_live": page_copy.live and self.keep_live,
+            "source_locale": {
+                "id": page.locale_id,
+                "language_code": page.locale.language_code,
+            },
+        }
+
+    def _copy_page(
+        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
+    ):
+        specific_page = page.specific
+        exclude_fields, base_update_attrs = self._get_copy_options(
+            specific_page, update_attrs, exclude_fields
+        )
+        page_copy, child_object_map = self._make_copy(
+            specific_page, exclude_fields, base_update_attrs
+        )
+
         # Save the new page
         if _mpnode_attrs:
             # We've got a tree position already reserved. Perform a quick save
@@ -188,49 +313,14 @@ class CopyPageAction:
 
             for revision in page.revisions.all():
                 use_as_latest_revision = revision.pk == page.latest_revision_id
-                revision.pk = None
-                revision.approved_go_live_at = None
-                revision.object_id = page_copy.id
-
-                # Update ID fields in content
-                revision_content = revision.content
-                revision_content["pk"] = page_copy.pk
-
-                for child_relation in get_all_child_relations(specific_page):
-                    accessor_name = child_relation.get_accessor_name()
-                    try:
-                        child_objects = revision_content[accessor_name]
-                    except KeyError:
-                        # KeyErrors are possible if the revision was created
-                        # before this child relation was added to the database
-                        continue
-
-                    for child_object in child_objects:
-                        child_object[child_relation.field.name] = page_copy.pk
-                        # Remap primary key to copied versions
-                        # If the primary key is not recognised (eg, the child object has been deleted from the database)
-                        # set the primary key to None
-                        copied_child_object = child_object_map.get(
-                            (child_relation, child_object["pk"])
-                        )
-                        child_object["pk"] = (
-                            copied_child_object.pk if copied_child_object else None
-                        )
-                        if (
-                            self.reset_translation_key
-                            and "translation_key" in child_object
-                        ):
-                            child_object["translation_key"] = (
-                                self.generate_translation_key(
-                                    child_object["translation_key"]
-                                )
-                            )
-
-                for field_name in exclude_fields:
-                    if field_name in revision_content:
-                        revision_content[field_name] = page_copy_data.get(field_name)
-
-                revision.content = revision_content
+                revision = self._copy_revision(
+                    revision,
+                    specific_page,
+                    page_copy,
+                    child_object_map,
+                    exclude_fields,
+                    page_copy_data,
+                )
 
                 # Save
                 revision.save()
@@ -286,33 +376,7 @@ class CopyPageAction:
                 instance=page_copy,
                 action=self.log_action,
                 user=self.user,
-                data={
-                    "page": {
-                        "id": page_copy.id,
-                        "title": page_copy.get_admin_display_title(),
-                        "locale": {
-                            "id": page_copy.locale_id,
-                            "language_code": page_copy.locale.language_code,
-                        },
-                    },
-                    "source": {
-                        "id": parent.id,
-                        "title": parent.specific_deferred.get_admin_display_title(),
-                    }
-                    if parent
-                    else None,
-                    "destination": {
-                        "id": to.id,
-                        "title": to.specific_deferred.get_admin_display_title(),
-                    }
-                    if to
-                    else None,
-                    "keep_live": page_copy.live and self.keep_live,
-                    "source_locale": {
-                        "id": page.locale_id,
-                        "language_code": page.locale.language_code,
-                    },
-                },
+                data=self._get_log_data(page, page_copy, parent, to),
             )
             if page_copy.live and self.keep_live:
                 # Log the publish if the use chose to keep the copied page live
@@ -329,7 +393,10 @@ class CopyPageAction:
         # Copy child pages
         from wagtail.models import Page, PageViewRestriction
 
-        if self.recursive:
+        if self.recursive and self.bulk:
+            self._copy_descendants_in_bulk(page, page_copy)
+
+        elif self.recursive:
             numchild = 0
 
             for child_page in page.get_children().specific().iterator():
@@ -366,6 +433,326 @@ class CopyPageAction:
 
         return page_copy
 
+    def _copy_descendants_in_bulk(self, page, page_copy):
+        """
+        Copies the descendants of ``page`` to ``page_copy`` in batches of
+        ``bulk_batch_size``, each in its own transaction, so that the pages
+        copied by the batches before one that fails are kept.
+        """
+        from wagtail.models import Locale
+
+        # The originals and copies of the pages that pages in later batches
+        # may be children of, keyed by the original's path
+        parents = {page.path: (page, page_copy)}
+        locales = Locale.objects.in_bulk()
+
+        descendants = (
+            page.get_descendants()
+            .order_by("path")
+            .specific(reuse_base_fields=True)
+            .iterator(chunk_size=self.bulk_batch_size)
+        )
+        while batch := list(islice(descendants, self.bulk_batch_size)):
+            with transaction.atomic():
+                self._copy_pages_in_bulk(page, page_copy, batch, parents, locales)
+
+    def _copy_pages_in_bulk(self, page, page_copy, batch, parents, locales):
+        from wagtail.models import Page, ReferenceIndex, Revision
+        from wagtail.models.content_types import get_default_page_content_type
+        from wagtail.signal_handlers import disable_reference_index_auto_update
+
+        copies = []
+        parent_copies = []
+        for specific_page in batch:
+            _, parent_copy = parents[specific_page.path[: -Page.steplen]]
+            exclude_fields, base_update_attrs = self._get_copy_options(specific_page)
+            child_page_copy, child_object_map = self._make_copy(
+                specific_page, exclude_fields, base_update_attrs
+            )
+
+            # Take the copy's position in the tree from the original's,
+            # relative to the page being copied
+            child_page_copy.path = page_copy.path + specific_page.path[len(page.path) :]
+            child_page_copy.depth = specific_page.depth - page.depth + page_copy.depth
+            # Copies are counted as children of their parents as they're
+            # inserted, so that the tree stays consistent if a later batch
+            # fails
+            child_page_copy.numchild = 0
+            child_page_copy.set_url_path(parent_copy)
+            specific_page.locale = locales[specific_page.locale_id]
+            child_page_copy.locale = locales[child_page_copy.locale_id]
+
+            copies.append(
+                (specific_page, child_page_copy, child_object_map, exclude_fields)
+            )
+            parent_copies.append(parent_copy)
+            if specific_page.numchild:
+                parents[specific_page.path] = (specific_page, child_page_copy)
+
+        page_copies = [child_page_copy for _, child_page_copy, _, _ in copies]
+        self._bulk_insert_pages(copies)
+
+        for parent_copy in parent_copies:
+            parent_copy.numchild += 1
+        parents_by_count = defaultdict(list)
+        for pk, count in Counter(parent.pk for parent in parent_copies).items():
+            parents_by_count[count].append(pk)
+        for count, pks in parents_by_count.items():
+            Page.objects.filter(pk__in=pks).update(numchild=F("numchild") + count)
+
+        for specific_page, child_page_copy, _, exclude_fields in copies:
+            _copy_m2m_relations(
+                specific_page, child_page_copy, exclude_fields=exclude_fields
+            )
+
+        # Copy revisions, and create a new one for each page as _copy_page does
+        revisions = []
+        latest_revisions = {}
+        if self.copy_revisions:
+            revisions_by_page = defaultdict(list)
+            for revision in Revision.page_revisions.filter(
+                object_id__in=[str(specific_page.pk) for specific_page in batch]
+            ):
+                revisions_by_page[revision.object_id].append(revision)
+
+            for (
+                specific_page,
+                child_page_copy,
+                child_object_map,
+                exclude_fields,
+            ) in copies:
+                page_copy_data = child_page_copy.serializable_data()
+                for revision in revisions_by_page[str(specific_page.pk)]:
+                    use_as_latest_revision = (
+                        revision.pk == specific_page.latest_revision_id
+                    )
+                    revision = self._copy_revision(
+                        revision,
+                        specific_page,
+                        child_page_copy,
+                        child_object_map,
+                        exclude_fields,
+                        page_copy_data,
+                    )
+                    revisions.append(revision)
+                    if use_as_latest_revision:
+                        latest_revisions[child_page_copy.pk] = revision
+
+        new_revisions = []
+        now = timezone.now()
+        for child_page_copy in page_copies:
+            latest_revision = latest_revisions.get(child_page_copy.pk)
+            if child_page_copy.has_unpublished_changes and latest_revision:
+                latest_revision_as_object = child_page_copy.with_content_json(
+                    latest_revision.content
+                )
+            else:
+                latest_revision_as_object = child_page_copy
+
+            new_revisions.append(
+                Revision(
+                    content_type_id=child_page_copy.content_type_id,
+                    base_content_type=get_default_page_content_type(),
+                    object_id=str(child_page_copy.pk),
+                    created_at=now,
+                    user=self.user,
+                    content=latest_revision_as_object.serializable_data(),
+                    object_str=str(latest_revision_as_object),
+                )
+            )
+            child_page_copy.draft_title = latest_revision_as_object.title
+
+        self._bulk_create(Revision, revisions + new_revisions)
+
+        update_fields = ["latest_revision", "latest_revision_created_at", "draft_title"]
+        if self.keep_live:
+            update_fields += [
+                "live_revision",
+                "first_published_at",
+                "last_published_at",
+            ]
+        for child_page_copy, revision in zip(page_copies, new_revisions):
+            child_page_copy.latest_revision = revision
+            child_page_copy.latest_revision_created_at = revision.created_at
+            if self.keep_live:
+                child_page_copy.live_revision = revision
+                child_page_copy.first_published_at = revision.created_at
+                child_page_copy.last_published_at = revision.created_at
+        Page.objects.bulk_update(page_copies, update_fields)
+
+        # Index the references of all the copies at once, rather than as
+        # each one is saved
+        with disable_reference_index_auto_update():
+            for child_page_copy in page_copies:
+                post_save.send(
+                    sender=type(child_page_copy),
+                    instance=child_page_copy,
+                    created=True,
+                    update_fields=None,
+                    raw=False,
+                    using=child_page_copy._state.db,
+                )
+        ReferenceIndex.create_or_update_for_objects(page_copies)
+
+        for child_page_copy, revision in zip(page_copies, new_revisions):
+            if child_page_copy.live:
+                page_published.send(
+                    sender=child_page_copy.specific_class,
+                    instance=child_page_copy,
+                    revision=revision,
+                )
+
+        self._bulk_log(copies, parents, new_revisions)
+
+        for specific_page, child_page_copy, _, _ in copies:
+            logger.info(
+                'Page copied: "%s" id=%d from=%d',
+                child_page_copy.title,
+                child_page_copy.id,
+                specific_page.id,
+            )
+
+    def _bulk_insert_pages(self, copies):
+        """
+        Saves the page copies with one insert per batch of rows into each of
+        their models' tables, then saves their child objects
+        """
+        from wagtail.models import Page
+
+        db = router.db_for_write(Page)
+        page_copies = [page_copy for _, page_copy, _, _ in copies]
+        Page.objects.using(db).bulk_create(page_copies)
+        if any(page_copy.id is None for page_copy in page_copies):
+            # The database doesn't return the primary keys of inserted rows,
+            # so look them up by path
+            pks = dict(
+                Page.objects.using(db)
+                .filter(path__in=[page_copy.path for page_copy in page_copies])
+                .values_list("path", "pk")
+            )
+            for page_copy in page_copies:
+                page_copy.id = pks[page_copy.path]
+
+        # Insert the rows of the tables of the pages' models, parents first
+        pages_by_model = defaultdict(list)
+        for page_copy in page_copies:
+            # All the primary keys and parent links of the pages' models have
+            # the same value
+            page_pk = page_copy.id
+            for field in page_copy._meta.concrete_fields:
+                if (
+                    field.primary_key
+                    or field.remote_field
+                    and field.remote_field.parent_link
+                ):
+                    setattr(page_copy, field.attname, page_pk)
+
+            concrete_model = page_copy._meta.concrete_model
+            for model in [concrete_model, *concrete_model._meta.get_parent_list()]:
+                if model is not Page:
+                    pages_by_model[model].append(page_copy)
+
+        for model in sorted(
+            pages_by_model, key=lambda model: len(model._meta.get_parent_list())
+        ):
+            objs = pages_by_model[model]
+            fields = model._meta.local_concrete_fields
+            batch_size = connections[db].ops.bulk_batch_size(fields, objs)
+            for start in range(0, len(objs), batch_size):
+                model._base_manager.using(db)._insert(
+                    objs[start : start + batch_size], fields=fields, using=db
+                )
+
+        # Save the pages' child objects and ParentalManyToManyField values, as
+        # ClusterableModel.save does
+        child_objects_by_model = defaultdict(list)
+        for _, page_copy, child_object_map, exclude_fields in copies:
+            for (child_relation, _), child_objects in child_object_map.items():
+                # Copied child objects without primary keys are kept in lists
+                if not isinstance(child_objects, list):
+                    child_objects = [child_objects]
+                for child_object in child_objects:
+                    setattr(child_object, child_relation.field.name, page_copy)
+                    child_objects_by_model[type(child_object)].append(child_object)
+
+            for field in get_all_child_m2m_relations(page_copy):
+                if field.name not in exclude_fields:
+                    getattr(page_copy, field.name).commit()
+
+        can_bulk_create = connections[db].features.can_return_rows_from_bulk_insert
+        for model, child_objects in child_objects_by_model.items():
+            if (
+                can_bulk_create
+                and not model._meta.parents
+                and not issubclass(model, ClusterableModel)
+            ):
+                model._base_manager.using(db).bulk_create(child_objects)
+            else:
+                # Save objects with child objects of their own, multi-table
+                # inheritance or primary keys that can't be found otherwise
+                # one at a time
+                for child_object in child_objects:
+                    child_object.save(using=db)
+
+    def _bulk_create(self, model, objs):
+        db = router.db_for_write(model)
+        if connections[db].features.can_return_rows_from_bulk_insert:
+            model._base_manager.using(db).bulk_create(objs)
+        else:
+            # The primary keys of the objects are needed, but the database
+            # doesn't return them from bulk inserts
+            for obj in objs:
+                obj.save(using=db)
+
+    def _bulk_log(self, copies, parents, revisions):
+        from wagtail.models import Page, PageLogEntry
+
+        log_context = get_active_log_context()
+        user = self.user or log_context.user
+        log_entries = []
+        for (specific_page, page_copy, _, _), revision in zip(copies, revisions):
+            # Page.save logs the creation of new pages
+            log_entries.append(
+                PageLogEntry.objects.build_log_entry(
+                    page_copy,
+                    "wagtail.create",
+                    user=page_copy.owner or log_context.user,
+                    uuid=log_context.uuid,
+                    content_changed=True,
+                )
+            )
+            if not self.log_action:
+                continue
+
+            parent, parent_copy = parents[specific_page.path[: -Page.steplen]]
+            log_entries.append(
+                PageLogEntry.objects.build_log_entry(
+                    page_copy,
+                    self.log_action,
+                    user=user,
+                    uuid=log_context.uuid,
+                    data=self._get_log_data(
+                        specific_page, page_copy, parent, parent_copy
+                    ),
+                )
+            )
+            if page_copy.live and self.keep_live:
+                log_entries.append(
+                    PageLogEntry.objects.build_log_entry(
+                        page_copy,
+                        "wagtail.publish",
+                        user=user,
+                        uuid=log_context.uuid,
+                        revision=revision,
+                    )
+                )
+
+        # bulk_create doesn't validate the log entries, so check that their
+        # actions are registered, as saving them would
+        for log_entry in {entry.action: entry for entry in log_entries}.values():
+            log_entry.clean()
+        PageLogEntry.objects.bulk_create(log_entries)
+
     def execute(self, skip_permission_checks=False):
         self.check(skip_permission_checks=skip_permission_checks)
 
@@ -39,6 +39,7 @@ class MovePageAction:
         # Fetching new object to avoid affecting `page`
         parent_before = page.get_parent()
         old_page = Page.objects.get(id=page.id)
+        old_path = old_page.path
         old_url_path = old_page.url_path
         new_url_path = old_page.set_url_path(parent=parent_after)
         url_path_changed = old_url_path != new_url_path
@@ -76,8 +77,19 @@ class MovePageAction:
             parent_page_after=parent_after,
             url_path_before=old_url_path,
             url_path_after=new_url_path,
+            path_before=old_path,
+            path_after=new_page.path,
         )
 
+        # The descendants are updated for their new location in the background,
+        # a chunk at a time
+        if new_page.numchild and old_path != new_page.path:
+            from wagtail.tasks import update_moved_descendants_task
+
+            update_moved_descendants_task.enqueue(
+                new_page.pk, new_page.path, old_url_path, new_url_path
+            )
+
         # Log
         log(
             instance=page,
@@ -1,5 +1,7 @@
 import logging
 
+from django.conf import settings
+
 from wagtail.actions.publish_revision import (
     PublishPermissionError,
     PublishRevisionAction,
@@ -58,6 +60,14 @@ class PublishPageRevisionAction(PublishRevisionAction):
 
         super()._after_publish()
 
-        self.object.update_aliases(
-            revision=self.revision, _content=self.revision.content
-        )
+        if getattr(settings, "WAGTAIL_DEFER_ALIAS_UPDATES", False):
+            from wagtail.tasks import update_aliases_task
+
+            if self.object.aliases.exists():
+                update_aliases_task.enqueue(self.object.pk, self.revision.pk)
+        else:
+            self.object.update_aliases(
+                revision=self.revision,
+                bulk=getattr(settings, "WAGTAIL_BULK_UPDATE_ALIASES", False),
+                _content=self.revision.content,
+            )
@@ -0,0 +1,422 @@
+import copy
+import uuid
+from collections import defaultdict
+
+from django.db import connections, models, router, transaction
+from django.db.models.signals import post_save
+from modelcluster.fields import ParentalManyToManyField
+from modelcluster.models import ClusterableModel, get_all_child_relations
+
+from wagtail.models.copying import _get_m2m_fields_to_copy
+from wagtail.models.i18n import TranslatableMixin
+from wagtail.signals import page_published
+
+
+class UpdatePageAliasesAction:
+    """
+    Publishes all the aliases that follow the given page, and the aliases of
+    those in turn, with the page's latest content, in bulk.
+
+    Rather than saving each alias in turn, the aliases are found a level of
+    the alias chain at a time and updated with a few queries per level:
+
+    * The parents of all the aliases are fetched at once to set their URL paths
+    * The fields of the aliases are saved with one ``bulk_update``
+    * The child objects of each child relation are compared with those of the
+      page that each alias follows, and only the aliases whose child objects
+      differ have them replaced, with a bulk delete and insert for all of them
+    * Many-to-many relations are updated by adding and removing rows of their
+      through tables for all the aliases at once
+
+    ``post_save`` and ``page_published`` are sent for each alias once they have
+    all been updated, but ``pre_save`` and ``m2m_changed`` aren't sent, and the
+    aliases' ``save`` methods aren't called.
+
+    :param page: The page whose aliases are to be updated
+    :type page: Page
+    :param revision: The revision of the page that the aliases are updated to (used for logging purposes)
+    :type revision: Revision, optional
+    :param content: The content to update the aliases with, defaults to the page's current content
+    :type content: dict, optional
+    :param updated_ids: IDs of pages that shouldn't be updated
+    :type updated_ids: list, optional
+    """
+
+    # Fields that aren't copied from the page's content, so that the values
+    # meaningful to each alias as a whole are preserved, as with_content_json does
+    preserved_fields = [
+        "id",
+        "content_type",
+        "path",
+        "depth",
+        "numchild",
+        "url_path",
+        "slug",
+        "draft_title",
+        "live",
+        "has_unpublished_changes",
+        "owner",
+        "locked",
+        "locked_by",
+        "locked_at",
+        "latest_revision",
+        "latest_revision_created_at",
+        "first_published_at",
+        "translation_key",
+        "locale",
+        "alias_of",
+    ]
+
+    # Fields that aren't copied to the aliases at all, as in Page.update_aliases
+    exclude_fields = [
+        "id",
+        "path",
+        "depth",
+        "numchild",
+        "url_path",
+        "index_entries",
+        "postgres_index_entries",
+    ]
+
+    def __init__(self, page, *, revision=None, content=None, updated_ids=None):
+        self.page = page
+        self.revision = revision
+        self.content = content
+        self.updated_ids = updated_ids or []
+
+    def get_alias_levels(self, specific_page):
+        """
+        Returns a list of the aliases of the page, then the aliases of those,
+        and so on, as lists of (alias, page it follows) tuples
+        """
+        model = specific_page.specific_class
+        visited_ids = {specific_page.id, *self.updated_ids}
+        sources = {specific_page.id: specific_page}
+        levels = []
+
+        while sources:
+            # Pages with an alias loop are only updated once
+            aliases = list(
+                model.objects.filter(alias_of__in=list(sources))
+                .exclude(id__in=visited_ids)
+                .order_by("path")
+            )
+            if not aliases:
+                break
+
+            levels.append([(alias, sources[alias.alias_of_id]) for alias in aliases])
+            visited_ids.update(alias.id for alias in aliases)
+            sources = {alias.id: alias for alias in aliases}
+
+        return levels
+
+    def _update_fields(self, specific_page, aliases):
+        """
+        Copies the fields of the page's content to the aliases, and saves them
+        """
+        from wagtail.models import Page
+
+        # Look up the parents of all the aliases at once, caching them for
+        # get_parent
+        parents = Page.objects.in_bulk(
+            {alias.path[: -Page.steplen] for alias in aliases}, field_name="path"
+        )
+
+        content_fields = [
+            field
+            for field in specific_page.specific_class._meta.concrete_fields
+            if not field.primary_key
+            and not (field.remote_field and field.remote_field.parent_link)
+            and field.name not in self.preserved_fields
+            and field.name not in self.exclude_fields
+        ]
+
+        # The content is only deserialized once, so the aliases share the
+        # values of fields such as StreamFields
+        content_object = self.content_object
+        for alias in aliases:
+            for field in content_fields:
+                setattr(alias, field.attname, getattr(content_object, field.attname))
+
+            if content_object.first_published_at is not None:
+                alias.first_published_at = content_object.first_published_at
+
+            # Publish the alias if it's currently in draft
+            alias.live = True
+            alias.has_unpublished_changes = False
+
+            # Aliases don't have revisions, so update fields that would normally be updated by save_revision
+            alias.draft_title = alias.title
+            alias.latest_revision_created_at = specific_page.latest_revision_created_at
+
+            # Don't change the aliases slug
+            alias._cached_parent_obj = parents[alias.path[: -Page.steplen]]
+            alias.set_url_path(alias._cached_parent_obj)
+
+        specific_page.specific_class._base_manager.bulk_update(
+            aliases,
+            [field.name for field in content_fields]
+            + [
+                "first_published_at",
+                "live",
+                "has_unpublished_changes",
+                "draft_title",
+                "latest_revision_created_at",
+                "url_path",
+            ],
+        )
+
+    def _copy_child_object(self, child_object, child_relation, alias, source):
+        if isinstance(child_object, ClusterableModel):
+            child_object, _ = child_object.copy_cluster()
+        else:
+            child_object = copy.copy(child_object)
+        child_object.pk = None
+        child_object.id = None
+        child_object._state.adding = True
+        setattr(child_object, child_relation.field.attname, alias.id)
+
+        if isinstance(child_object, TranslatableMixin):
+            # Child object's locale must always match the page
+            child_object.locale_id = alias.locale_id
+
+            # If the alias isn't a translation of the page it follows,
+            # change the child object's translation_keys so they are not
+            # either
+            if alias.translation_key != source.translation_key:
+                child_object.translation_key = uuid.uuid4()
+
+        return child_object
+
+    def _child_objects_match(
+        self, child_objects, copies, child_relation, alias, source
+    ):
+        if len(child_objects) != len(copies):
+            return False
+
+        model = child_relation.related_model
+        if issubclass(model, ClusterableModel):
+            # The child objects of the child objects would need comparing too,
+            # so only child relations that are empty on both are matched
+            return not child_objects
+
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+            and not (field.remote_field and field.remote_field.parent_link)
+            and field.attname != child_relation.field.attname
+        ]
+        if (
+            issubclass(model, TranslatableMixin)
+            and alias.translation_key != source.translation_key
+        ):
+            # New translation keys are generated for copies, so the existing
+            # ones are kept if nothing else differs
+            fields = [field for field in fields if field.name != "translation_key"]
+
+        return all(
+            field.get_prep_value(field.value_from_object(child_object))
+            == field.get_prep_value(field.value_from_object(copy))
+            for child_object, copy in zip(child_objects, copies)
+            for field in fields
+        )
+
+    def _update_child_relations(self, level, child_objects_by_page):
+        """
+        Replaces the child objects of the aliases in the level that differ from
+        those of the pages they follow. ``child_objects_by_page`` maps the IDs
+        of pages to the child objects of each of their child relations, and the
+        final child objects of the aliases are added to it.
+        """
+        aliases = [alias for alias, _ in level]
+        db = router.db_for_write(type(aliases[0]))
+
+        for child_relation in get_all_child_relations(type(aliases[0])):
+            accessor_name = child_relation.get_accessor_name()
+            if accessor_name in self.exclude_fields:
+                continue
+
+            model = child_relation.related_model
+            parental_key_name = child_relation.field.attname
+            existing = defaultdict(list)
+            for child_object in (
+                model._base_manager.using(db)
+                .filter(**{f"{parental_key_name}__in": [a.id for a in aliases]})
+                .order_by("pk")
+            ):
+                existing[getattr(child_object, parental_key_name)].append(child_object)
+
+            to_delete = []
+            to_create = []
+            for alias, source in level:
+                source_child_objects = child_objects_by_page[source.id].get(
+                    child_relation
+                )
+                if source_child_objects is None:
+                    source_child_objects = child_objects_by_page[source.id][
+                        child_relation
+                    ] = list(getattr(source, accessor_name).all().order_by("pk"))
+
+                copies = [
+                    self._copy_child_object(child_object, child_relation, alias, source)
+                    for child_object in source_child_objects
+                ]
+                if self._child_objects_match(
+                    existing[alias.id], copies, child_relation, alias, source
+                ):
+                    child_objects_by_page[alias.id][child_relation] = existing[alias.id]
+                else:
+                    to_delete.extend(existing[alias.id])
+                    to_create.extend(copies)
+                    child_objects_by_page[alias.id][child_relation] = copies
+
+            if to_delete:
+                model._base_manager.using(db).filter(
+                    pk__in=[child_object.pk for child_object in to_delete]
+                ).delete()
+
+            if to_create:
+                self._create_child_objects(model, to_create, db)
+
+            # Keep the final child objects on the aliases, so that signal
+            # handlers don't need to fetch them again
+            for alias in aliases:
+                setattr(
+                    alias,
+                    accessor_name,
+                    child_objects_by_page[alias.id][child_relation],
+                )
+
+    def _create_child_objects(self, model, child_objects, db):
+        if (
+            connections[db].features.can_return_rows_from_bulk_insert
+            and not model._meta.parents
+            and not issubclass(model, ClusterableModel)
+        ):
+            model._base_manager.using(db).bulk_create(child_objects)
+        else:
+            # Save objects with child objects of their own, multi-table
+            # inheritance or primary keys that can't be found otherwise
+            # one at a time
+            for child_object in child_objects:
+                child_object.save(using=db)
+
+    def _update_m2m_relations(self, specific_page, aliases):
+        """
+        Sets the many-to-many relations of the aliases to those of the page,
+        taking ParentalManyToManyField values from its content
+        """
+        model = specific_page.specific_class
+        alias_ids = [alias.id for alias in aliases]
+        db = router.db_for_write(model)
+
+        fields = [
+            field
+            for field in model._meta.get_fields()
+            if isinstance(field, ParentalManyToManyField)
+            and field.name not in self.exclude_fields
+            # Values missing from the content are left as they are
+            and field.name in self.content
+        ] + _get_m2m_fields_to_copy(model, self.exclude_fields)
+
+        for field in fields:
+            if isinstance(field, ParentalManyToManyField):
+                values = list(getattr(self.content_object, field.name).all())
+
+                # Keep the values on the aliases, as with child objects
+                for alias in aliases:
+                    setattr(alias, field.name, values)
+            else:
+                values = list(getattr(specific_page, field.name).all())
+
+            if not isinstance(field, models.ManyToManyField):
+                # Update relations that aren't defined by a through table of
+                # their own, such as tags, as _copy_m2m_relations does
+                for alias in aliases:
+                    getattr(alias, field.name).set(values)
+                continue
+
+            through = field.remote_field.through
+            from_name = through._meta.get_field(field.m2m_field_name()).attname
+            to_name = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            target_ids = {value.pk for value in values}
+
+            existing = defaultdict(set)
+            to_delete = []
+            for pk, from_id, to_id in (
+                through._base_manager.using(db)
+                .filter(**{f"{from_name}__in": alias_ids})
+                .values_list("pk", from_name, to_name)
+            ):
+                if to_id in target_ids:
+                    existing[from_id].add(to_id)
+                else:
+                    to_delete.append(pk)
+
+            if to_delete:
+                through._base_manager.using(db).filter(pk__in=to_delete).delete()
+
+            through._base_manager.using(db).bulk_create(
+                [
+                    through(**{from_name: alias.id, to_name: to_id})
+                    for alias in aliases
+                    for to_id in target_ids - existing[alias.id]
+                ]
+            )
+
+    def _update_aliases(self, specific_page, levels):
+        from wagtail.models import ReferenceIndex, Site
+        from wagtail.signal_handlers import disable_reference_index_auto_update
+
+        aliases = [alias for level in levels for alias, _ in level]
+        db = router.db_for_write(type(aliases[0]))
+
+        with transaction.atomic(using=db):
+            self._update_fields(specific_page, aliases)
+
+            child_objects_by_page = defaultdict(dict)
+            for level in levels:
+                self._update_child_relations(level, child_objects_by_page)
+
+            self._update_m2m_relations(specific_page, aliases)
+
+            if Site.objects.filter(root_page__in=aliases).exists():
+                Site.clear_site_root_paths_cache()
+                Site.clear_site_hostname_index()
+
+            # Index the references of all the aliases at once, rather than as
+            # each one is saved
+            with disable_reference_index_auto_update():
+                for alias in aliases:
+                    post_save.send(
+                        sender=type(alias),
+                        instance=alias,
+                        created=False,
+                        update_fields=None,
+                        raw=False,
+                        using=db,
+                    )
+            ReferenceIndex.create_or_update_for_objects(aliases)
+
+            for alias in aliases:
+                page_published.send(
+                    sender=alias.specific_class,
+                    instance=alias,
+                    revision=self.revision,
+                    alias=True,
+                )
+
+    def execute(self):
+        specific_page = self.page.specific
+
+        # Only compute this if necessary since it's quite a heavy operation
+        if self.content is None:
+            self.content = specific_page.serializable_data()
+
+        levels = self.get_alias_levels(specific_page)
+        if levels:
+            self.content_object = specific_page.specific_class.from_serializable_data(
+                self.content
+            )
+            self._update_aliases(specific_page, levels)
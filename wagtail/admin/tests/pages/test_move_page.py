@@ -134,6 +134,8 @@ class TestPageMove(WagtailTestUtils, TestCase):
         pre_page_move.connect(pre_moved_handler)
         post_page_move.connect(post_moved_handler)
 
+        path_before = self.test_page_a.path
+
         # Post to view to move page
         try:
             self.client.post(
@@ -173,6 +175,8 @@ class TestPageMove(WagtailTestUtils, TestCase):
             parent_page_after=self.section_b,
             url_path_before="/home/section-a/hello-world/",
             url_path_after="/home/section-b/hello-world/",
+            path_before=path_before,
+            path_after=Page.objects.get(pk=self.test_page_a.pk).path,
         )
 
     def test_before_move_page_hook(self):
@@ -83,6 +83,11 @@ class OrderingFilter(BaseFilterBackend):
         if not order_param:
             return queryset
 
+        # Cursor pagination orders the results itself, by one of the fields
+        # it supports
+        if "cursor" in request.GET:
+            return queryset
+
         order_by_list = order_param.split(",")
 
         # Handle random ordering separately
@@ -1,22 +1,35 @@
+import base64
+import binascii
+import json
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
 
-from .utils import BadRequestError
+from .utils import BadRequestError, parse_boolean
 
 
 class WagtailPagination(BasePagination):
-    def paginate_queryset(self, queryset, request, view=None):
-        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+    """
+    Paginates listings with the ``offset`` and ``limit`` parameters, or with
+    the ``cursor`` parameter if given.
 
-        try:
-            offset = int(request.GET.get("offset", 0))
-            if offset < 0:
-                raise ValueError()
-        except ValueError as e:
-            raise BadRequestError("offset must be a positive integer") from e
+    With ``cursor``, the results are ordered by one of ``cursor_orderings`` and
+    each page of results starts after the last one of the previous page, so
+    fetching a page takes the same time however deep into the results it is.
+    The ``next`` token in the response's metadata is passed as ``cursor`` to
+    fetch the following page (an empty ``cursor`` fetches the first), and the
+    total count is only found if ``total_count=true`` is given.
+    """
+
+    # The fields that results can be ordered by when paginating with a cursor.
+    # These must be unique, so that each cursor identifies a single position
+    cursor_orderings = ["id", "path"]
+
+    def get_limit(self, request):
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
 
         try:
             limit_default = 20 if not limit_max else min(20, limit_max)
@@ -29,24 +42,114 @@ class WagtailPagination(BasePagination):
         if limit_max and limit > limit_max:
             raise BadRequestError("limit cannot be higher than %d" % limit_max)
 
+        return limit
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.next_cursor = None
+
+        if "cursor" in request.GET:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        self.use_cursor = False
+
+        try:
+            offset = int(request.GET.get("offset", 0))
+            if offset < 0:
+                raise ValueError()
+        except ValueError as e:
+            raise BadRequestError("offset must be a positive integer") from e
+
+        limit = self.get_limit(request)
+
         start = offset
         stop = offset + limit
 
-        self.view = view
         self.total_count = queryset.count()
         return queryset[start:stop]
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.use_cursor = True
+
+        if "offset" in request.GET:
+            raise BadRequestError("cursor cannot be combined with offset")
+
+        if "search" in request.GET:
+            raise BadRequestError("cursor pagination is not supported while searching")
+
+        ordering = request.GET.get("order") or "id"
+        try:
+            if ordering not in self.cursor_orderings:
+                raise FieldDoesNotExist
+            field = queryset.model._meta.get_field(ordering)
+        except FieldDoesNotExist as e:
+            raise BadRequestError(
+                "cannot order by '%s' with cursor pagination" % ordering
+            ) from e
+
+        limit = self.get_limit(request)
+        if limit == 0:
+            raise BadRequestError("limit must be at least 1 with cursor pagination")
+
+        try:
+            self.total_count = (
+                queryset.count()
+                if parse_boolean(request.GET.get("total_count", "false"))
+                else None
+            )
+        except ValueError as e:
+            raise BadRequestError("total_count must be 'true' or 'false'") from e
+
+        queryset = queryset.order_by(ordering)
+        if request.GET["cursor"]:
+            queryset = queryset.filter(
+                **{f"{ordering}__gt": self.decode_cursor(request.GET["cursor"], field)}
+            )
+
+        # Fetch one more result than needed to find whether there is a next page
+        results = list(queryset[: limit + 1])
+        if len(results) > limit:
+            results = results[:limit]
+            self.next_cursor = self.encode_cursor(
+                ordering, getattr(results[-1], ordering)
+            )
+
+        return results
+
+    def encode_cursor(self, ordering, value):
+        return (
+            base64.urlsafe_b64encode(json.dumps([ordering, value]).encode())
+            .decode()
+            .rstrip("=")
+        )
+
+    def decode_cursor(self, cursor, field):
+        try:
+            ordering, value = json.loads(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )
+            if ordering != field.name:
+                raise BadRequestError("cursor was given for a different order")
+            return field.to_python(value)
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ) as e:
+            raise BadRequestError("cursor is invalid") from e
+
     def get_paginated_response(self, data):
+        meta = OrderedDict()
+        if self.total_count is not None:
+            meta["total_count"] = self.total_count
+        if self.use_cursor:
+            meta["next"] = self.next_cursor
+
         data = OrderedDict(
             [
-                (
-                    "meta",
-                    OrderedDict(
-                        [
-                            ("total_count", self.total_count),
-                        ]
-                    ),
-                ),
+                ("meta", meta),
                 ("items", data),
             ]
         )
@@ -6,12 +6,14 @@ from unittest import mock
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
-from django.test import TestCase, TransactionTestCase
+from django.test import RequestFactory, TestCase, TransactionTestCase
 from django.test.utils import override_settings
 from django.urls import reverse
+from rest_framework.request import Request
 from rest_framework.test import APIClient
 
 from wagtail.api.v2 import signal_handlers
+from wagtail.api.v2.pagination import WagtailPagination
 from wagtail.api.v2.views import PagesAPIViewSet
 from wagtail.models import Locale, Page, Site
 from wagtail.models.view_restrictions import BaseViewRestriction
@@ -1084,6 +1086,125 @@ class TestPageListing(WagtailTestUtils, TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(content, {"message": "offset must be a positive integer"})
 
+    # CURSOR
+
+    def get_all_pages_by_cursor(self, **params):
+        page_id_list = []
+        cursor = ""
+        while cursor is not None:
+            response = self.get_response(cursor=cursor, limit=5, **params)
+            self.assertEqual(response.status_code, 200)
+            content = json.loads(response.content.decode("UTF-8"))
+            page_id_list += self.get_page_id_list(content)
+            cursor = content["meta"]["next"]
+        return page_id_list
+
+    def test_cursor(self):
+        response = self.get_response(cursor="", limit=5)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(content["items"]), 5)
+        # The total count isn't found unless asked for
+        self.assertNotIn("total_count", content["meta"])
+        self.assertIsNotNone(content["meta"]["next"])
+
+        response = self.get_response(cursor=content["meta"]["next"], limit=5)
+        next_content = json.loads(response.content.decode("UTF-8"))
+
+        page_id_list = self.get_page_id_list(next_content)
+        self.assertEqual(len(page_id_list), 5)
+        self.assertGreater(page_id_list[0], self.get_page_id_list(content)[-1])
+
+    def test_cursor_all_pages(self):
+        response = self.get_response()
+        total_count = json.loads(response.content.decode("UTF-8"))["meta"][
+            "total_count"
+        ]
+
+        page_id_list = self.get_all_pages_by_cursor()
+
+        self.assertEqual(page_id_list, sorted(set(page_id_list)))
+        self.assertEqual(len(page_id_list), total_count)
+
+    def test_cursor_order_by_path(self):
+        page_id_list = self.get_all_pages_by_cursor(order="path")
+
+        self.assertEqual(
+            page_id_list,
+            list(
+                Page.objects.filter(id__in=page_id_list)
+                .order_by("path")
+                .values_list("id", flat=True)
+            ),
+        )
+
+    def test_cursor_with_filter(self):
+        page_id_list = self.get_all_pages_by_cursor(type="demosite.BlogEntryPage")
+
+        self.assertEqual(
+            page_id_list,
+            list(
+                models.BlogEntryPage.objects.live()
+                .order_by("id")
+                .values_list("id", flat=True)
+            ),
+        )
+
+    def test_cursor_total_count(self):
+        response = self.get_response(cursor="", total_count="true")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        # The same count as without a cursor
+        response = self.get_response()
+        self.assertEqual(
+            content["meta"]["total_count"],
+            json.loads(response.content.decode("UTF-8"))["meta"]["total_count"],
+        )
+
+    def test_cursor_skips_count(self):
+        request = Request(RequestFactory().get("/", {"cursor": "", "limit": 5}))
+
+        with self.assertNumQueries(1):
+            pages = WagtailPagination().paginate_queryset(Page.objects.all(), request)
+
+        self.assertEqual(len(pages), 5)
+
+    def test_cursor_for_other_order_gives_error(self):
+        response = self.get_response(cursor="", limit=5)
+        cursor = json.loads(response.content.decode("UTF-8"))["meta"]["next"]
+
+        response = self.get_response(cursor=cursor, order="path")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor was given for a different order"})
+
+    def test_invalid_cursor_gives_error(self):
+        for cursor in ["abc", "WyJpZCIsICJhYmMiXQ"]:
+            with self.subTest(cursor=cursor):
+                response = self.get_response(cursor=cursor)
+                content = json.loads(response.content.decode("UTF-8"))
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(content, {"message": "cursor is invalid"})
+
+    def test_cursor_unsupported_order_gives_error(self):
+        response = self.get_response(cursor="", order="title")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content, {"message": "cannot order by 'title' with cursor pagination"}
+        )
+
+    def test_cursor_with_offset_gives_error(self):
+        response = self.get_response(cursor="", offset=5)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor cannot be combined with offset"})
+
     # REGRESSION TESTS
 
     def test_issue_3967(self):
@@ -57,6 +57,8 @@ class BaseAPIViewSet(GenericViewSet):
         [
             "limit",
             "offset",
+            "cursor",
+            "total_count",
             "fields",
             "order",
             "search",
@@ -386,6 +386,16 @@ class Block(metaclass=BaseBlock):
     def extract_references(self, value):
         return []
 
+    @cached_property
+    def can_contain_references(self):
+        """
+        Whether values of this block may contain references to other objects,
+        to be returned by ``extract_references``. Blocks that can't are skipped
+        when building the reference index. By default, this is ``True`` for
+        blocks that override ``extract_references``.
+        """
+        return type(self).extract_references is not Block.extract_references
+
     def get_block_by_content_path(self, value, path_elements):
         """
         Given a list of elements from a content path, retrieve the block at that path
@@ -382,7 +382,17 @@ class ListBlock(Block):
 
         return content
 
+    @cached_property
+    def can_contain_references(self):
+        if type(self).extract_references is not ListBlock.extract_references:
+            return True
+
+        return self.child_block.can_contain_references
+
     def extract_references(self, value):
+        if not self.can_contain_references:
+            return
+
         for child in value.bound_blocks:
             for (
                 model,
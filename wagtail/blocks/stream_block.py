@@ -1,5 +1,4 @@
 import itertools
-import json
 import uuid
 from collections import OrderedDict, defaultdict
 from collections.abc import Mapping, MutableSequence
@@ -15,6 +14,7 @@ from django.utils.translation import gettext as _
 
 from wagtail.admin.staticfiles import versioned_static
 from wagtail.admin.telepath import Adapter, register
+from wagtail.utils.json import get_json_codec
 
 from .base import (
     Block,
@@ -237,7 +237,7 @@ class BaseStreamBlock(Block):
             return value
         elif isinstance(value, str) and value:
             try:
-                value = json.loads(value)
+                value = get_json_codec().loads(value)
             except ValueError:
                 # value is not valid JSON; most likely, this field was previously a
                 # rich text field before being migrated to StreamField, and the data
@@ -396,7 +396,16 @@ class BaseStreamBlock(Block):
         return content
 
     def extract_references(self, value):
-        for child in value:
+        if not self.can_contain_references:
+            return
+
+        for i in range(len(value)):
+            # Skip children of block types that can't contain references
+            # without converting them from their raw data
+            if value._get_block_type(i) not in self._block_types_with_references:
+                continue
+
+            child = value[i]
             for (
                 model,
                 object_id,
@@ -466,6 +475,21 @@ class BaseStreamBlock(Block):
     def _has_default(self):
         return self.meta.default is not BaseStreamBlock._meta_class.default
 
+    @cached_property
+    def _block_types_with_references(self):
+        return frozenset(
+            name
+            for name, block in self.child_blocks.items()
+            if block.can_contain_references
+        )
+
+    @cached_property
+    def can_contain_references(self):
+        if type(self).extract_references is not BaseStreamBlock.extract_references:
+            return True
+
+        return bool(self._block_types_with_references)
+
     class Meta:
         # No icon specified here, because that depends on the purpose that the
         # block is being used for. Feel encouraged to specify an icon in your
@@ -678,6 +702,16 @@ class StreamValue(MutableSequence):
             block_def, block_def.normalize(value), id=block_id
         )
 
+    def _get_block_type(self, i):
+        """
+        Returns the block type name of the item at index ``i``, without
+        converting it from its raw data
+        """
+        bound_block = self._bound_blocks[i]
+        if bound_block is None:
+            return self._raw_data[i]["type"]
+        return bound_block.block_type
+
     def __getitem__(self, i):
         if isinstance(i, slice):
             start, stop, step = i.indices(len(self._bound_blocks))
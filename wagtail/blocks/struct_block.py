@@ -278,6 +278,9 @@ class BaseStructBlock(Block):
 
     def extract_references(self, value):
         for name, block in self.child_blocks.items():
+            if not block.can_contain_references:
+                continue
+
             for model, object_id, model_path, content_path in block.extract_references(
                 value.get(name, block.get_default())
             ):
@@ -386,6 +389,13 @@ class BaseStructBlock(Block):
     def _has_default(self):
         return self.meta.default is not BaseStructBlock._meta_class.default
 
+    @cached_property
+    def can_contain_references(self):
+        if type(self).extract_references is not BaseStructBlock.extract_references:
+            return True
+
+        return any(block.can_contain_references for block in self.child_blocks.values())
+
     class Meta:
         default = {}
         form_classname = "struct-block"
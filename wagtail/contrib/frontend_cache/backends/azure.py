@@ -30,6 +30,9 @@ class AzureBaseBackend(BaseBackend):
     def purge(self, url):
         self.purge_batch([url])
 
+    def purge_all(self):
+        self._purge_content(["/*"])
+
     def _get_default_credentials(self):
         try:
             from azure.identity import DefaultAzureCredential
@@ -21,6 +21,13 @@ class BaseBackend:
         for url in urls:
             self.purge(url)
 
+    def purge_all(self) -> None:
+        """
+        Purge everything cached by this backend. Backends that can't do this
+        raise ``NotImplementedError``.
+        """
+        raise NotImplementedError
+
     def invalidates_hostname(self, hostname) -> bool:
         """
         Can `hostname` be invalidated by this backend?
@@ -47,6 +47,9 @@ class CloudflareBackend(BaseBackend):
             )
 
     def _purge_urls(self, urls):
+        self._purge({"files": urls}, urls)
+
+    def _purge(self, data, urls):
         try:
             purge_url = (
                 "https://api.cloudflare.com/client/v4/zones/{}/purge_cache".format(
@@ -62,8 +65,6 @@ class CloudflareBackend(BaseBackend):
                 headers["X-Auth-Email"] = self.cloudflare_email
                 headers["X-Auth-Key"] = self.cloudflare_api_key
 
-            data = {"files": urls}
-
             response = requests.delete(
                 purge_url,
                 json=data,
@@ -112,3 +113,6 @@ class CloudflareBackend(BaseBackend):
 
     def purge(self, url):
         self._purge_urls([url])
+
+    def purge_all(self):
+        self._purge({"purge_everything": True}, ["*"])
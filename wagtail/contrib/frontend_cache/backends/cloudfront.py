@@ -14,6 +14,9 @@ __all__ = ["CloudfrontBackend"]
 
 
 class CloudfrontBackend(BaseBackend):
+    # The maximum number of paths in a single invalidation batch
+    CHUNK_SIZE = 3000
+
     def __init__(self, params):
         import boto3
 
@@ -49,11 +52,18 @@ class CloudfrontBackend(BaseBackend):
                     paths_by_distribution_id[distribution_id].add(path)
 
         for distribution_id, paths in paths_by_distribution_id.items():
-            self._create_invalidation(distribution_id, list(paths))
+            paths = list(paths)
+            for i in range(0, len(paths), self.CHUNK_SIZE):
+                self._create_invalidation(
+                    distribution_id, paths[i : i + self.CHUNK_SIZE]
+                )
 
     def purge(self, url):
         self.purge_batch([url])
 
+    def purge_all(self):
+        self._create_invalidation(self.cloudfront_distribution_id, ["/*"])
+
     def _create_invalidation(self, distribution_id, paths):
         import botocore
 
@@ -1,7 +1,10 @@
 import logging
-from urllib.error import HTTPError, URLError
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlsplit, urlunsplit
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from wagtail import __version__
 
@@ -19,13 +22,43 @@ class PurgeRequest(Request):
 
 
 class HTTPBackend(BaseBackend):
+    """
+    Purges URLs by sending ``PURGE`` requests to each of the caches in
+    ``LOCATION``, which may be a single URL or a list of them.
+
+    Requests are sent concurrently by up to ``WORKERS`` threads, reusing
+    connections to the caches, and each is retried up to ``RETRIES`` times if
+    the cache can't be reached or responds with a server error.
+    """
+
     def __init__(self, params):
         super().__init__(params)
-        location_url_parsed = urlsplit(params.pop("LOCATION"))
-        self.cache_scheme = location_url_parsed.scheme
-        self.cache_netloc = location_url_parsed.netloc
+        locations = params.pop("LOCATION")
+        if isinstance(locations, str):
+            locations = [locations]
 
-    def purge(self, url):
+        self.locations = []
+        for location in locations:
+            location_url_parsed = urlsplit(location)
+            self.locations.append(
+                (location_url_parsed.scheme, location_url_parsed.netloc)
+            )
+        self.cache_scheme, self.cache_netloc = self.locations[0]
+
+        self.workers = params.pop("WORKERS", 8)
+        self.retries = params.pop("RETRIES", 2)
+        self.timeout = params.pop("TIMEOUT", 10)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(self.locations), pool_maxsize=self.workers
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "Wagtail-frontendcache/" + __version__
+
+    def _purge_url(self, location, url):
+        cache_scheme, cache_netloc = location
         url_parsed = urlsplit(url)
         host = url_parsed.hostname
 
@@ -33,32 +66,56 @@ class HTTPBackend(BaseBackend):
         if url_parsed.port:
             host += ":" + str(url_parsed.port)
 
-        request = PurgeRequest(
-            url=urlunsplit(
-                [
-                    self.cache_scheme,
-                    self.cache_netloc,
-                    url_parsed.path,
-                    url_parsed.query,
-                    url_parsed.fragment,
-                ]
-            ),
-            headers={
-                "Host": host,
-                "User-Agent": "Wagtail-frontendcache/" + __version__,
-            },
+        purge_url = urlunsplit(
+            [
+                cache_scheme,
+                cache_netloc,
+                url_parsed.path,
+                url_parsed.query,
+                url_parsed.fragment,
+            ]
         )
 
-        try:
-            urlopen(request)
-        except HTTPError as e:
-            logger.error(
-                "Couldn't purge '%s' from HTTP cache. HTTPError: %d %s",
-                url,
-                e.code,
-                e.reason,
-            )
-        except URLError as e:
-            logger.error(
-                "Couldn't purge '%s' from HTTP cache. URLError: %s", url, e.reason
-            )
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.request(
+                    "PURGE", purge_url, headers={"Host": host}, timeout=self.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                if attempt < self.retries:
+                    continue
+                logger.error(
+                    "Couldn't purge '%s' from HTTP cache at '%s'. %s: %s",
+                    url,
+                    cache_netloc,
+                    type(e).__name__,
+                    e,
+                )
+                return
+
+            if response.status_code >= 500 and attempt < self.retries:
+                continue
+
+            if response.status_code >= 400:
+                logger.error(
+                    "Couldn't purge '%s' from HTTP cache at '%s'. HTTPError: %d %s",
+                    url,
+                    cache_netloc,
+                    response.status_code,
+                    response.reason,
+                )
+            return
+
+    def purge(self, url):
+        for location in self.locations:
+            self._purge_url(location, url)
+
+    def purge_batch(self, urls):
+        if len(urls) <= 1 or self.workers <= 1:
+            for url in urls:
+                self.purge(url)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(urls), self.workers)) as executor:
+            # Consume the results so that any unexpected errors are raised
+            list(executor.map(self.purge, urls))
@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from wagtail.contrib.frontend_cache.backends import HTTPBackend
+from wagtail.contrib.frontend_cache.tests import PurgeServer
+from wagtail.test.benchmark import Benchmark
+
+
+class BenchHTTPBackendPurgeBatch(Benchmark, SimpleTestCase):
+    """
+    Purges 200 URLs from two local stand-in cache servers, each taking 5ms to
+    respond to a request.
+    """
+
+    urls = [f"http://www.example.com/page-{i}/" for i in range(200)]
+
+    def setUp(self):
+        self.servers = [PurgeServer(delay=0.005).__enter__() for i in range(2)]
+        self.backend = HTTPBackend(
+            {"LOCATION": [server.location for server in self.servers]}
+        )
+
+    def tearDown(self):
+        for server in self.servers:
+            server.__exit__()
+
+    def bench(self):
+        self.backend.purge_batch(self.urls)
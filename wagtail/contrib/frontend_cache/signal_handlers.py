@@ -1,7 +1,22 @@
+import copy
+from functools import lru_cache
+
 from django.apps import apps
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
-from wagtail.signals import page_published, page_unpublished
+from wagtail.contrib.frontend_cache.utils import PurgeBatch, purge_page_from_cache
+from wagtail.signals import (
+    page_descendants_moved,
+    page_published,
+    page_unpublished,
+    post_page_move,
+    published,
+    snippet_registered,
+    unpublished,
+)
 
 
 def page_published_signal_handler(instance, **kwargs):
@@ -12,6 +27,135 @@ def page_unpublished_signal_handler(instance, **kwargs):
     purge_page_from_cache(instance)
 
 
+def has_frontend_cache_backends():
+    return (
+        getattr(settings, "WAGTAILFRONTENDCACHE", None) is not None
+        or getattr(settings, "WAGTAILFRONTENDCACHE_LOCATION", None) is not None
+    )
+
+
+def purge_moved_pages(pages, url_path_before, url_path_after):
+    """
+    Purges the URLs of the live ``pages`` within a section of the tree moved
+    from ``url_path_before`` to ``url_path_after``, both from before and after
+    the move.
+    """
+    batch = PurgeBatch()
+    for page in pages:
+        if not page.live:
+            continue
+
+        batch.add_page(page)
+
+        old_page = copy.copy(page)
+        old_page.url_path = url_path_before + page.url_path[len(url_path_after) :]
+        batch.add_page(old_page)
+
+    batch.purge()
+
+
+def post_page_move_signal_handler(instance, url_path_before, url_path_after, **kwargs):
+    # Reordering pages doesn't change their URLs
+    if url_path_before != url_path_after and has_frontend_cache_backends():
+        purge_moved_pages([instance], url_path_before, url_path_after)
+
+
+def page_descendants_moved_signal_handler(
+    pages, url_path_before, url_path_after, **kwargs
+):
+    if url_path_before != url_path_after and has_frontend_cache_backends():
+        purge_moved_pages(pages, url_path_before, url_path_after)
+
+
+@lru_cache(maxsize=None)
+def get_purge_references_media_models():
+    models = set()
+    if apps.is_installed("wagtail.images"):
+        from wagtail.images import get_image_model
+
+        models.add(get_image_model())
+
+    if apps.is_installed("wagtail.documents"):
+        from wagtail.documents import get_document_model
+
+        models.add(get_document_model())
+
+    return frozenset(models)
+
+
+@receiver(setting_changed)
+def reset_purge_references_media_models(*, setting, **kwargs):
+    if setting in ("WAGTAILIMAGES_IMAGE_MODEL", "WAGTAILDOCS_DOCUMENT_MODEL"):
+        get_purge_references_media_models.cache_clear()
+
+
+def should_purge_references(model):
+    """
+    Returns whether changes to objects of ``model`` should purge the pages
+    referencing them. This is the case for snippets, images and documents.
+    """
+    if not getattr(settings, "WAGTAILFRONTENDCACHE_PURGE_REFERENCES", True):
+        return False
+
+    # No need to look for references if there are no backends to purge them from
+    if not has_frontend_cache_backends():
+        return False
+
+    if model in get_purge_references_media_models():
+        return True
+
+    if apps.is_installed("wagtail.snippets"):
+        from wagtail.snippets.models import get_snippet_models
+
+        return model in get_snippet_models()
+
+    return False
+
+
+def purge_references(instances):
+    from wagtail.contrib.frontend_cache.tasks import purge_references_from_cache_task
+
+    pks_by_model = {}
+    for instance in instances:
+        pks_by_model.setdefault(type(instance), []).append(str(instance.pk))
+
+    for model, pks in pks_by_model.items():
+        purge_references_from_cache_task.enqueue(
+            model._meta.app_label, model._meta.model_name, pks
+        )
+
+
+def object_saved_signal_handler(sender, instance, raw=False, **kwargs):
+    from wagtail.models import DraftStateMixin
+
+    # Objects with draft states are purged when published or unpublished instead
+    if raw or isinstance(instance, DraftStateMixin):
+        return
+
+    if should_purge_references(sender):
+        purge_references([instance])
+
+
+def object_deleted_signal_handler(sender, instance, **kwargs):
+    if should_purge_references(sender):
+        purge_references([instance])
+
+
+def object_published_signal_handler(sender, instance, **kwargs):
+    if should_purge_references(sender):
+        purge_references([instance])
+
+
+def connect_purge_references_signal_handlers(model):
+    post_save.connect(object_saved_signal_handler, sender=model)
+    published.connect(object_published_signal_handler, sender=model)
+    unpublished.connect(object_published_signal_handler, sender=model)
+
+
+def snippet_registered_signal_handler(sender, **kwargs):
+    connect_purge_references_signal_handlers(sender)
+
+
 def register_signal_handlers():
     # Get list of models that are page types
     Page = apps.get_model("wagtailcore", "Page")
@@ -21,3 +165,27 @@ def register_signal_handlers():
     for model in indexed_models:
         page_published.connect(page_published_signal_handler, sender=model)
         page_unpublished.connect(page_unpublished_signal_handler, sender=model)
+        post_page_move.connect(post_page_move_signal_handler, sender=model)
+        page_descendants_moved.connect(
+            page_descendants_moved_signal_handler, sender=model
+        )
+
+    # Purge the pages referencing snippets, images and documents when they
+    # change. Snippets may be registered after this app is ready, so the
+    # handlers for those are connected as each one is registered
+    for model in get_purge_references_media_models():
+        connect_purge_references_signal_handlers(model)
+
+    if apps.is_installed("wagtail.snippets"):
+        from wagtail.snippets.models import SNIPPET_MODELS
+
+        for model in SNIPPET_MODELS:
+            connect_purge_references_signal_handlers(model)
+        snippet_registered.connect(snippet_registered_signal_handler)
+
+    # A pre_delete receiver for all models would prevent Django from deleting
+    # objects of any model without fetching them first, so this is connected
+    # for images and documents only. Snippets deleted in the admin are purged
+    # by the before_delete_snippet hook
+    for model in get_purge_references_media_models():
+        pre_delete.connect(object_deleted_signal_handler, sender=model)
@@ -3,6 +3,7 @@ import re
 from collections import defaultdict
 from urllib.parse import urlsplit, urlunsplit
 
+from django.apps import apps
 from django.conf import settings
 from django_tasks import task
 
@@ -81,3 +82,34 @@ def purge_urls_from_cache_task(urls, backend_settings=None, backends=None):
                 logger.info("[%s] Purging URL: %s", backend_name, url)
 
             backend.purge_batch(urls)
+
+
+@task()
+def purge_all_from_cache_task(backend_settings=None, backends=None):
+    backends = get_backends(backend_settings, backends)
+
+    for backend_name, backend in backends.items():
+        logger.info("[%s] Purging everything", backend_name)
+        try:
+            backend.purge_all()
+        except NotImplementedError:
+            logger.warning(
+                "[%s] Unable to purge everything, as %s does not support it",
+                backend_name,
+                type(backend).__name__,
+            )
+
+
+@task()
+def purge_references_from_cache_task(
+    app_label, model_name, pks, backend_settings=None, backends=None
+):
+    from .utils import purge_references_from_cache
+
+    model = apps.get_model(app_label, model_name)
+
+    # The objects may since have been deleted, but their references are still
+    # recorded, so only their primary keys are needed
+    purge_references_from_cache(
+        [model(pk=pk) for pk in pks], backend_settings, backends
+    )
@@ -1,12 +1,18 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
-from urllib.error import HTTPError, URLError
 
 import requests
 from azure.mgmt.cdn import CdnManagementClient
 from azure.mgmt.frontdoor import FrontDoorManagementClient
+from django.contrib.admin.utils import quote
 from django.core.exceptions import ImproperlyConfigured
-from django.test import SimpleTestCase, TestCase
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
 from django.test.utils import override_settings
+from django.urls import reverse
 
 from wagtail.contrib.frontend_cache.backends import (
     AzureCdnBackend,
@@ -16,9 +22,24 @@ from wagtail.contrib.frontend_cache.backends import (
     CloudfrontBackend,
     HTTPBackend,
 )
-from wagtail.contrib.frontend_cache.utils import get_backends
-from wagtail.models import Page
-from wagtail.test.testapp.models import EventIndex, EventPage
+from wagtail.contrib.frontend_cache.signal_handlers import (
+    object_published_signal_handler,
+    object_saved_signal_handler,
+)
+from wagtail.contrib.frontend_cache.utils import get_backends, get_purge_queue
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Page, ReferenceIndex, Site
+from wagtail.signals import published, snippet_registered, unpublished
+from wagtail.test.testapp.models import (
+    Advert,
+    AdvertPlacement,
+    EventIndex,
+    EventPage,
+    GenericSnippetPage,
+    VariousOnDeleteModel,
+)
+from wagtail.test.utils import WagtailTestUtils
 
 from .utils import (
     PurgeBatch,
@@ -271,64 +292,6 @@ class TestBackendConfiguration(SimpleTestCase):
         self.assertIsInstance(call_args[0], FrontDoorManagementClient)
         self.assertEqual(call_args[1], ["/home/events/christmas/?test=1", "/blog/"])
 
-    def test_http(self):
-        """Test that `HTTPBackend.purge` works when urlopen succeeds"""
-        self._test_http_with_side_effect(urlopen_side_effect=None)
-
-    def test_http_httperror(self):
-        """Test that `HTTPBackend.purge` can handle `HTTPError`"""
-        http_error = HTTPError(
-            url="http://localhost:8000/home/events/christmas/",
-            code=500,
-            msg="Internal Server Error",
-            hdrs={},
-            fp=None,
-        )
-        with self.assertLogs(level="ERROR") as log_output:
-            self._test_http_with_side_effect(urlopen_side_effect=http_error)
-
-        self.assertIn(
-            "Couldn't purge 'http://www.wagtail.org/home/events/christmas/' from HTTP cache. HTTPError: 500 Internal Server Error",
-            log_output.output[0],
-        )
-
-    def test_http_urlerror(self):
-        """Test that `HTTPBackend.purge` can handle `URLError`"""
-        url_error = URLError(reason="just for tests")
-        with self.assertLogs(level="ERROR") as log_output:
-            self._test_http_with_side_effect(urlopen_side_effect=url_error)
-        self.assertIn(
-            "Couldn't purge 'http://www.wagtail.org/home/events/christmas/' from HTTP cache. URLError: just for tests",
-            log_output.output[0],
-        )
-
-    @mock.patch("wagtail.contrib.frontend_cache.backends.http.urlopen")
-    def _test_http_with_side_effect(self, urlopen_mock, urlopen_side_effect):
-        # given a backends configuration with one HTTP backend
-        backends = get_backends(
-            backend_settings={
-                "varnish": {
-                    "BACKEND": "wagtail.contrib.frontend_cache.backends.HTTPBackend",
-                    "LOCATION": "http://localhost:8000",
-                },
-            }
-        )
-        self.assertEqual(set(backends.keys()), {"varnish"})
-        self.assertIsInstance(backends["varnish"], HTTPBackend)
-        # and mocked urlopen that may or may not raise network-related exception
-        urlopen_mock.side_effect = urlopen_side_effect
-
-        # when making a purge request
-        backends.get("varnish").purge("http://www.wagtail.org/home/events/christmas/")
-
-        # then no exception is raised
-        # and mocked urlopen is called with a proper purge request
-        self.assertEqual(urlopen_mock.call_count, 1)
-        (purge_request,), _call_kwargs = urlopen_mock.call_args
-        self.assertEqual(
-            purge_request.full_url, "http://localhost:8000/home/events/christmas/"
-        )
-
     def test_cloudfront_validate_distribution_id(self):
         with self.assertRaises(ImproperlyConfigured):
             get_backends(
@@ -411,6 +374,66 @@ class TestBackendConfiguration(SimpleTestCase):
             ["/?root=query", "/another/path", "/path/to/page?query=value"],
         )
 
+    @mock.patch(
+        "wagtail.contrib.frontend_cache.backends.cloudfront.CloudfrontBackend._create_invalidation"
+    )
+    def test_cloudfront_purge_batch_chunked(self, mock_create_invalidation):
+        backends = get_backends(
+            backend_settings={
+                "cloudfront": {
+                    "BACKEND": "wagtail.contrib.frontend_cache.backends.CloudfrontBackend",
+                    "DISTRIBUTION_ID": "frontend",
+                    "AWS_ACCESS_KEY_ID": "test-access-key",
+                    "AWS_SECRET_ACCESS_KEY": "test-secret-key",
+                },
+            }
+        )
+
+        backends["cloudfront"].purge_batch(
+            [f"http://www.example.com/page-{i}/" for i in range(3001)]
+        )
+
+        self.assertEqual(mock_create_invalidation.call_count, 2)
+        paths = [call.args[1] for call in mock_create_invalidation.call_args_list]
+        self.assertEqual([len(chunk) for chunk in paths], [3000, 1])
+        self.assertEqual(len(set(paths[0] + paths[1])), 3001)
+
+    @mock.patch(
+        "wagtail.contrib.frontend_cache.backends.cloudfront.CloudfrontBackend._create_invalidation"
+    )
+    def test_cloudfront_purge_all(self, mock_create_invalidation):
+        backends = get_backends(
+            backend_settings={
+                "cloudfront": {
+                    "BACKEND": "wagtail.contrib.frontend_cache.backends.CloudfrontBackend",
+                    "DISTRIBUTION_ID": "frontend",
+                    "AWS_ACCESS_KEY_ID": "test-access-key",
+                    "AWS_SECRET_ACCESS_KEY": "test-secret-key",
+                },
+            }
+        )
+
+        backends["cloudfront"].purge_all()
+        mock_create_invalidation.assert_called_once_with("frontend", ["/*"])
+
+    @mock.patch("wagtail.contrib.frontend_cache.backends.cloudflare.requests.delete")
+    def test_cloudflare_purge_all(self, requests_delete_mock):
+        requests_delete_mock.return_value.json.return_value = {"success": True}
+        backends = get_backends(
+            backend_settings={
+                "cloudflare": {
+                    "BACKEND": "wagtail.contrib.frontend_cache.backends.CloudflareBackend",
+                    "ZONEID": "zone",
+                    "BEARER_TOKEN": "token",
+                },
+            }
+        )
+
+        backends["cloudflare"].purge_all()
+        self.assertEqual(
+            requests_delete_mock.call_args.kwargs["json"], {"purge_everything": True}
+        )
+
     def test_multiple(self):
         backends = get_backends(
             backend_settings={
@@ -461,10 +484,20 @@ class TestBackendConfiguration(SimpleTestCase):
 PURGED_URLS = set()
 
 
+def clear_purged_urls():
+    PURGED_URLS.clear()
+    # Discard any URLs queued by earlier tests, as their transactions were
+    # rolled back rather than committed
+    get_purge_queue().batches.clear()
+
+
 class MockBackend(BaseBackend):
     def purge(self, url):
         PURGED_URLS.add(url)
 
+    def purge_all(self):
+        PURGED_URLS.add("*")
+
 
 class MockCloudflareBackend(CloudflareBackend):
     def _purge_urls(self, urls):
@@ -490,7 +523,7 @@ class TestCachePurgingFunctions(TestCase):
     fixtures = ["test.json"]
 
     def setUp(self):
-        PURGED_URLS.clear()
+        clear_purged_urls()
 
     def test_purge_url_from_cache(self):
         with self.captureOnCommitCallbacks(execute=True):
@@ -502,6 +535,78 @@ class TestCachePurgingFunctions(TestCase):
             purge_urls_from_cache(["http://localhost/foo", "http://localhost/bar"])
         self.assertEqual(PURGED_URLS, {"http://localhost/foo", "http://localhost/bar"})
 
+    def test_purges_in_transaction_coalesced(self):
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task"
+        ) as task:
+            enqueue = task.enqueue
+            with self.captureOnCommitCallbacks(execute=True):
+                purge_url_from_cache("http://localhost/foo")
+                purge_urls_from_cache(["http://localhost/bar", "http://localhost/foo"])
+                purge_url_from_cache("http://localhost/baz")
+
+                # Nothing is purged until the transaction is committed
+                enqueue.assert_not_called()
+
+        enqueue.assert_called_once_with(
+            ["http://localhost/foo", "http://localhost/bar", "http://localhost/baz"],
+            None,
+            None,
+        )
+
+    def test_purges_coalesced_per_backend(self):
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task"
+        ) as task:
+            enqueue = task.enqueue
+            with self.captureOnCommitCallbacks(execute=True):
+                purge_url_from_cache("http://localhost/foo")
+                purge_url_from_cache("http://localhost/bar", backends=["varnish"])
+                purge_url_from_cache("http://localhost/baz")
+
+        self.assertEqual(
+            enqueue.call_args_list,
+            [
+                mock.call(["http://localhost/foo", "http://localhost/baz"], None, None),
+                mock.call(["http://localhost/bar"], None, ["varnish"]),
+            ],
+        )
+
+    def test_purges_in_rolled_back_savepoint_kept(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    purge_url_from_cache("http://localhost/foo")
+                    raise ValueError
+            except ValueError:
+                pass
+
+            # The flush registered in the savepoint was dropped, so it's
+            # registered again with the next URL
+            purge_url_from_cache("http://localhost/bar")
+
+        self.assertEqual(PURGED_URLS, {"http://localhost/foo", "http://localhost/bar"})
+
+    def test_purges_in_rolled_back_inner_savepoint_kept(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_url_from_cache("http://localhost/foo")
+            try:
+                with transaction.atomic():
+                    purge_url_from_cache("http://localhost/bar")
+                    raise ValueError
+            except ValueError:
+                pass
+
+            # The queue is still flushed on commit, along with the URL purged
+            # in the savepoint
+            self.assertTrue(get_purge_queue().is_flush_pending())
+            purge_url_from_cache("http://localhost/baz")
+
+        self.assertEqual(
+            PURGED_URLS,
+            {"http://localhost/foo", "http://localhost/bar", "http://localhost/baz"},
+        )
+
     def test_purge_page_from_cache(self):
         page = EventIndex.objects.get(url_path="/home/events/")
         with self.captureOnCommitCallbacks(execute=True):
@@ -646,6 +751,44 @@ class TestCachePurgingFunctions(TestCase):
         self.assertEqual(PURGED_URLS, {"http://example.com/foo"})
 
 
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "varnish": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+        },
+    },
+)
+class TestPurgeQueueTransactions(TransactionTestCase):
+    def setUp(self):
+        clear_purged_urls()
+
+    def test_purges_outside_transaction(self):
+        purge_url_from_cache("http://localhost/foo")
+        self.assertEqual(PURGED_URLS, {"http://localhost/foo"})
+        self.assertFalse(get_purge_queue().is_flush_pending())
+
+    def test_purges_in_transaction(self):
+        with transaction.atomic():
+            purge_url_from_cache("http://localhost/foo")
+            self.assertTrue(get_purge_queue().is_flush_pending())
+            self.assertEqual(PURGED_URLS, set())
+
+        self.assertEqual(PURGED_URLS, {"http://localhost/foo"})
+        self.assertFalse(get_purge_queue().is_flush_pending())
+
+    def test_purges_in_rolled_back_transaction_discarded(self):
+        try:
+            with transaction.atomic():
+                purge_url_from_cache("http://localhost/foo")
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertFalse(get_purge_queue().is_flush_pending())
+        purge_url_from_cache("http://localhost/bar")
+        self.assertEqual(PURGED_URLS, {"http://localhost/bar"})
+
+
 @override_settings(
     WAGTAILFRONTENDCACHE={
         "cloudflare": {
@@ -658,7 +801,7 @@ class TestCachePurgingFunctions(TestCase):
 class TestCloudflareCachePurgingFunctions(TestCase):
     def setUp(self):
         # Reset PURGED_URLS to an empty list
-        PURGED_URLS.clear()
+        clear_purged_urls()
 
     def test_cloudflare_purge_batch_chunked(self):
         with self.captureOnCommitCallbacks(execute=True):
@@ -682,7 +825,7 @@ class TestCachePurgingSignals(TestCase):
 
     def setUp(self):
         # Reset PURGED_URLS to an empty list
-        PURGED_URLS.clear()
+        clear_purged_urls()
 
     def test_purge_on_publish(self):
         with self.captureOnCommitCallbacks(execute=True):
@@ -700,6 +843,52 @@ class TestCachePurgingSignals(TestCase):
             PURGED_URLS, {"http://localhost/events/", "http://localhost/events/past/"}
         )
 
+    def test_purge_on_bulk_publish_coalesced(self):
+        pages = list(EventPage.objects.live().specific())
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task"
+        ) as task:
+            enqueue = task.enqueue
+            with self.captureOnCommitCallbacks(execute=True):
+                for page in pages:
+                    page.save_revision().publish()
+
+        enqueue.assert_called_once()
+        self.assertEqual(
+            set(enqueue.call_args.args[0]),
+            {page.get_full_url() for page in pages},
+        )
+
+    def test_purge_on_move(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        with self.captureOnCommitCallbacks(execute=True):
+            events_index.move(about_us, pos="last-child")
+
+        # The old and new URLs of the page and its live descendants are purged
+        self.assertEqual(
+            PURGED_URLS,
+            {
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/events/christmas/",
+                "http://localhost/events/saint-patrick/pointless-suffix/",
+                "http://localhost/events/final-event/",
+                "http://localhost/about-us/events/",
+                "http://localhost/about-us/events/past/",
+                "http://localhost/about-us/events/christmas/",
+                "http://localhost/about-us/events/saint-patrick/pointless-suffix/",
+                "http://localhost/about-us/events/final-event/",
+            },
+        )
+
+    def test_no_purge_on_reorder(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        with self.captureOnCommitCallbacks(execute=True):
+            events_index.move(about_us, pos="right")
+        self.assertEqual(PURGED_URLS, set())
+
     def test_purge_with_unroutable_page(self):
         with self.captureOnCommitCallbacks(execute=True):
             root = Page.objects.get(url_path="/")
@@ -767,6 +956,168 @@ class TestCachePurgingSignals(TestCase):
         )
 
 
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "varnish": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+        },
+    }
+)
+class TestPurgeReferences(WagtailTestUtils, TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        clear_purged_urls()
+        self.home_page = Page.objects.get(url_path="/home/")
+
+        self.advert = Advert.objects.create(text="An advert")
+        self.event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        AdvertPlacement.objects.create(
+            page=self.event_page, advert=self.advert, colour="red"
+        )
+        ReferenceIndex.create_or_update_for_object(self.event_page)
+
+    def test_purge_on_snippet_save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.advert.text = "An updated advert"
+            self.advert.save()
+
+        self.assertEqual(PURGED_URLS, {"http://localhost/events/christmas/"})
+
+    def test_purge_on_snippet_delete_in_admin(self):
+        self.login()
+        delete_url = reverse(
+            "wagtailsnippets_tests_advert:delete", args=[quote(self.advert.pk)]
+        )
+
+        # Showing the confirmation page doesn't purge anything
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(delete_url)
+        self.assertEqual(PURGED_URLS, set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(delete_url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Advert.objects.filter(pk=self.advert.pk).exists())
+        self.assertEqual(PURGED_URLS, {"http://localhost/events/christmas/"})
+
+    def test_purge_on_image_delete(self):
+        image = Image.objects.create(title="Test image", file=get_test_image_file())
+        self.event_page.feed_image = image
+        self.event_page.save()
+        ReferenceIndex.create_or_update_for_object(self.event_page)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.delete()
+
+        self.assertEqual(PURGED_URLS, {"http://localhost/events/christmas/"})
+
+    def test_purge_through_snippets(self):
+        image = Image.objects.create(title="Test image", file=get_test_image_file())
+        snippet = VariousOnDeleteModel.objects.create(
+            text="A snippet", protected_image=image
+        )
+        ReferenceIndex.create_or_update_for_object(snippet)
+        page = GenericSnippetPage(
+            title="Generic snippet page", snippet_content_object=snippet
+        )
+        self.home_page.add_child(instance=page)
+        ReferenceIndex.create_or_update_for_object(page)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.title = "Updated image"
+            image.save()
+
+        self.assertEqual(PURGED_URLS, {"http://localhost/generic-snippet-page/"})
+
+    def test_other_models_not_handled(self):
+        site = Site.objects.get(is_default_site=True)
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.signal_handlers.should_purge_references"
+        ) as should_purge_references:
+            site.save()
+            self.advert.save()
+
+        should_purge_references.assert_called_once_with(Advert)
+
+    def test_snippets_registered_later_handled(self):
+        site = Site.objects.get(is_default_site=True)
+        snippet_registered.send(sender=Site)
+        self.addCleanup(post_save.disconnect, object_saved_signal_handler, Site)
+        self.addCleanup(published.disconnect, object_published_signal_handler, Site)
+        self.addCleanup(unpublished.disconnect, object_published_signal_handler, Site)
+
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.signal_handlers.should_purge_references"
+        ) as should_purge_references:
+            site.save()
+
+        should_purge_references.assert_called_once_with(Site)
+
+    def test_unreferenced_object(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Advert.objects.create(text="Another advert")
+
+        self.assertEqual(PURGED_URLS, set())
+
+    def test_draft_pages_not_purged(self):
+        self.event_page.unpublish()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.advert.save()
+
+        self.assertEqual(PURGED_URLS, set())
+
+    @override_settings(WAGTAILFRONTENDCACHE_PURGE_REFERENCES_LIMIT=0)
+    def test_purge_all_over_limit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.advert.save()
+
+        self.assertEqual(PURGED_URLS, {"*"})
+
+    @override_settings(WAGTAILFRONTENDCACHE_PURGE_REFERENCES_LIMIT=1)
+    def test_purge_pages_over_limit_for_backends_without_purge_all(self):
+        other_event_page = EventPage.objects.get(url_path="/home/events/final-event/")
+        AdvertPlacement.objects.create(
+            page=other_event_page, advert=self.advert, colour="blue"
+        )
+        ReferenceIndex.create_or_update_for_object(other_event_page)
+
+        with PurgeServer() as server:
+            with self.settings(
+                WAGTAILFRONTENDCACHE={
+                    "varnish": {
+                        "BACKEND": "wagtail.contrib.frontend_cache.backends.HTTPBackend",
+                        "LOCATION": server.location,
+                    },
+                    "mock": {
+                        "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBackend",
+                    },
+                }
+            ):
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.advert.save()
+
+        # Backends that can purge everything do so...
+        self.assertEqual(PURGED_URLS, {"*"})
+        # ...and the others are sent the URLs of all the referencing pages
+        self.assertCountEqual(
+            server.purges,
+            [
+                ("/events/christmas/", "localhost"),
+                ("/events/final-event/", "localhost"),
+            ],
+        )
+
+    @override_settings(WAGTAILFRONTENDCACHE_PURGE_REFERENCES=False)
+    def test_disabled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.advert.save()
+
+        self.assertEqual(PURGED_URLS, set())
+
+
 class TestPurgeBatchClass(TestCase):
     # Tests the .add_*() methods on PurgeBatch. The .purge() method is tested
     # by TestCachePurgingFunctions.test_purge_batch above
@@ -851,3 +1202,143 @@ class TestPurgeBatchClass(TestCase):
             "Couldn't purge 'http://localhost/events/' from Cloudflare. HTTPError: 500",
             log_output.output[0],
         )
+
+
+class PurgeRequestHandler(BaseHTTPRequestHandler):
+    # Keep connections alive, as a cache server would
+    protocol_version = "HTTP/1.1"
+
+    def do_PURGE(self):
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        with self.server.lock:
+            self.server.purges.append((self.path, self.headers["Host"]))
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PurgeServer(ThreadingHTTPServer):
+    """
+    A local stand-in for a cache server, recording the PURGE requests it
+    receives and the number of connections they're made over. Responses may be
+    delayed by ``delay`` seconds, to simulate a remote server
+    """
+
+    daemon_threads = True
+
+    def __init__(self, statuses=None, delay=0):
+        super().__init__(("127.0.0.1", 0), PurgeRequestHandler)
+        self.lock = threading.Lock()
+        self.purges = []
+        self.statuses = list(statuses or [])
+        self.connection_count = 0
+        self.delay = delay
+
+    @property
+    def location(self):
+        return "http://127.0.0.1:%d" % self.server_address[1]
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connection_count += 1
+        super().process_request(request, client_address)
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class TestHTTPBackend(SimpleTestCase):
+    def get_backend(self, location, **params):
+        return HTTPBackend({"LOCATION": location, **params})
+
+    def test_purge(self):
+        with PurgeServer() as server:
+            self.get_backend(server.location).purge(
+                "http://www.wagtail.org:8000/home/events/christmas/?test=1"
+            )
+
+        self.assertEqual(
+            server.purges,
+            [("/home/events/christmas/?test=1", "www.wagtail.org:8000")],
+        )
+
+    def test_purge_batch(self):
+        urls = [f"http://www.wagtail.org/page-{i}/" for i in range(100)]
+        with PurgeServer() as server:
+            self.get_backend(server.location, WORKERS=4).purge_batch(urls)
+
+        self.assertCountEqual(
+            server.purges,
+            [(f"/page-{i}/", "www.wagtail.org") for i in range(100)],
+        )
+        # Connections to the cache are kept alive and reused
+        self.assertLessEqual(server.connection_count, 4)
+
+    def test_purge_batch_multiple_locations(self):
+        urls = [f"http://www.wagtail.org/page-{i}/" for i in range(20)]
+        with PurgeServer() as server_1, PurgeServer() as server_2:
+            backend = self.get_backend([server_1.location, server_2.location])
+            backend.purge_batch(urls)
+
+        for server in (server_1, server_2):
+            self.assertCountEqual(
+                [path for path, host in server.purges],
+                [f"/page-{i}/" for i in range(20)],
+            )
+
+    def test_retry_on_server_error(self):
+        with PurgeServer(statuses=[503, 502]) as server:
+            with self.assertNoLogs("wagtail.frontendcache", level="ERROR"):
+                self.get_backend(server.location).purge("http://www.wagtail.org/")
+
+        self.assertEqual(len(server.purges), 3)
+
+    def test_http_error(self):
+        with PurgeServer(statuses=[500, 500]) as server:
+            with self.assertLogs("wagtail.frontendcache", level="ERROR") as logs:
+                self.get_backend(server.location, RETRIES=1).purge(
+                    "http://www.wagtail.org/home/events/christmas/"
+                )
+
+        self.assertEqual(len(server.purges), 2)
+        self.assertIn(
+            "Couldn't purge 'http://www.wagtail.org/home/events/christmas/' from HTTP cache at '127.0.0.1:%d'. HTTPError: 500 Internal Server Error"
+            % server.server_address[1],
+            logs.output[0],
+        )
+
+    def test_client_error_not_retried(self):
+        with PurgeServer(statuses=[405]) as server:
+            with self.assertLogs("wagtail.frontendcache", level="ERROR") as logs:
+                self.get_backend(server.location).purge("http://www.wagtail.org/")
+
+        self.assertEqual(len(server.purges), 1)
+        self.assertIn("HTTPError: 405 Method Not Allowed", logs.output[0])
+
+    def test_connection_error(self):
+        # Find a port with nothing listening on it
+        with PurgeServer() as server:
+            location = server.location
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR") as logs:
+            self.get_backend(location, RETRIES=0).purge(
+                "http://www.wagtail.org/home/events/christmas/"
+            )
+
+        self.assertIn(
+            "Couldn't purge 'http://www.wagtail.org/home/events/christmas/' from HTTP cache",
+            logs.output[0],
+        )
+        self.assertIn("ConnectionError", logs.output[0])
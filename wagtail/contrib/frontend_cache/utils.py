@@ -1,9 +1,15 @@
 import logging
+import threading
+from collections import defaultdict
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Q
 from django.utils.module_loading import import_string
 
+from .backends.base import BaseBackend
+
 logger = logging.getLogger("wagtail.frontendcache")
 
 
@@ -96,13 +102,93 @@ def purge_urls_from_cache(urls, backend_settings=None, backends=None):
 
     NOTE: This function also handles internationalization, creating language-specific URLs if
     ``WAGTAILFRONTENDCACHE_LANGUAGES`` is set and ``USE_I18N`` is ``True``.
-    """
-    from .tasks import purge_urls_from_cache_task
 
+    URLs purged within a database transaction are added to the thread's ``PurgeQueue``,
+    and purged together once the transaction is committed.
+    """
     if not urls:
         return
 
-    purge_urls_from_cache_task.enqueue(list(urls), backend_settings, backends)
+    get_purge_queue().add_urls(urls, backend_settings, backends)
+
+
+class PurgeQueue:
+    """
+    Collects the URLs purged during a database transaction, so that they can be
+    deduplicated and purged with a single task once the transaction is committed,
+    rather than with one task for each call to ``purge_urls_from_cache``.
+
+    Outside a transaction, the URLs are purged immediately. URLs added in a
+    transaction or savepoint that is rolled back are purged along with those of
+    the next transaction to be committed, unless a URL is added outside a
+    transaction first.
+    """
+
+    def __init__(self):
+        # A list of (backend_settings, backends, urls) tuples, where urls is a
+        # dict used as an ordered set
+        self.batches = []
+        self.flush_registered = False
+
+    def add_urls(self, urls, backend_settings=None, backends=None):
+        if not self.is_flush_pending():
+            # Any URLs left in the queue were added in a transaction that was
+            # rolled back
+            self.batches = []
+
+        for batch_settings, batch_backends, batch_urls in self.batches:
+            if batch_settings == backend_settings and batch_backends == backends:
+                batch_urls.update(dict.fromkeys(urls))
+                break
+        else:
+            self.batches.append((backend_settings, backends, dict.fromkeys(urls)))
+
+        # The flush is registered again for each call, as one registered in a
+        # savepoint is dropped if the savepoint is rolled back. Once the queue
+        # has been flushed, the other registrations find it empty. Outside a
+        # transaction, this flushes the queue immediately
+        self.flush_registered = True
+        transaction.on_commit(self.flush)
+
+    def is_flush_pending(self):
+        """
+        Returns whether the queue is to be flushed when the current transaction
+        is committed
+        """
+        # A committed transaction flushes the queue, so a flush still
+        # registered outside a transaction was for one that was rolled back
+        return self.flush_registered and not transaction.get_autocommit()
+
+    def __len__(self):
+        return sum(len(urls) for _, _, urls in self.batches)
+
+    def flush(self):
+        """
+        Enqueue a task to purge the URLs in the queue for each set of backends
+        """
+        from .tasks import purge_urls_from_cache_task
+
+        batches, self.batches = self.batches, []
+        self.flush_registered = False
+        for backend_settings, backends, urls in batches:
+            if urls:
+                purge_urls_from_cache_task.enqueue(
+                    list(urls), backend_settings, backends
+                )
+
+
+_purge_queues = threading.local()
+
+
+def get_purge_queue():
+    """
+    Returns the ``PurgeQueue`` for the current thread.
+    """
+    try:
+        return _purge_queues.queue
+    except AttributeError:
+        _purge_queues.queue = PurgeQueue()
+        return _purge_queues.queue
 
 
 def _get_page_cached_urls(page, cache_object=None):
@@ -175,6 +261,132 @@ def purge_pages_from_cache(
     batch.purge(backend_settings, backends)
 
 
+def purge_all_from_cache(backend_settings=None, backends=None):
+    """
+    Purge everything from the frontend cache.
+
+    :param backend_settings: Optional custom backend settings to use instead of those defined in ``settings.WAGTAILFRONTENDCACHE``.
+    :type backend_settings: dict, optional
+    :param backends: Optional list of strings referencing specific backends from ``settings.WAGTAILFRONTENDCACHE`` or provided as ``backend_settings``. Can be used to limit purge operations to specific backends.
+    :type backends: list, optional
+
+    Backends that are unable to purge everything, such as ``HTTPBackend``, log a warning instead.
+    """
+    from .tasks import purge_all_from_cache_task
+
+    transaction.on_commit(
+        lambda: purge_all_from_cache_task.enqueue(backend_settings, backends)
+    )
+
+
+def _get_referencing_page_ids(objects, limit=None):
+    """
+    Returns the IDs of the pages referencing any of ``objects``, directly or
+    through other objects (such as snippets) referencing them, according to the
+    reference index. Returns ``None`` if there are more than ``limit`` pages.
+    """
+    from wagtail.models import Page, ReferenceIndex
+
+    page_content_type_id = ReferenceIndex._get_base_content_type(Page).pk
+    seen = {
+        (ReferenceIndex._get_base_content_type(obj).pk, str(obj.pk)) for obj in objects
+    }
+    to_find = seen.copy()
+    page_ids = set()
+
+    while to_find:
+        object_ids_by_content_type = defaultdict(list)
+        for content_type_id, object_id in to_find:
+            object_ids_by_content_type[content_type_id].append(object_id)
+
+        condition = Q()
+        for content_type_id, object_ids in object_ids_by_content_type.items():
+            condition |= Q(
+                to_content_type_id=content_type_id, to_object_id__in=object_ids
+            )
+
+        to_find = set()
+        for key in (
+            ReferenceIndex.objects.filter(condition)
+            .values_list("base_content_type_id", "object_id")
+            .distinct()
+        ):
+            if key[0] == page_content_type_id:
+                page_ids.add(int(key[1]))
+                if limit is not None and len(page_ids) > limit:
+                    return None
+            elif key not in seen:
+                # Follow the references to other objects, which may be shown
+                # on the pages referencing them
+                seen.add(key)
+                to_find.add(key)
+
+    return page_ids
+
+
+def purge_references_from_cache(objects, backend_settings=None, backends=None):
+    """
+    Purge the live pages referencing any of the given objects from the frontend cache.
+
+    :param objects: An iterable of model instances, such as snippets, images or documents.
+    :type objects: iterable of Model
+    :param backend_settings: Optional custom backend settings to use instead of those defined in ``settings.WAGTAILFRONTENDCACHE``.
+    :type backend_settings: dict, optional
+    :param backends: Optional list of strings referencing specific backends from ``settings.WAGTAILFRONTENDCACHE`` or provided as ``backend_settings``. Can be used to limit purge operations to specific backends.
+    :type backends: list, optional
+
+    This function uses the reference index to find the pages referencing the objects,
+    including through other objects such as snippets that reference them.
+
+    If more pages than the ``WAGTAILFRONTENDCACHE_PURGE_REFERENCES_LIMIT`` setting
+    (1000 by default) are found, everything is purged from the backends that
+    support it instead. The other backends, such as ``HTTPBackend``, are sent
+    the URLs of all the pages, in batches of that many pages.
+    """
+    from wagtail.models import Page
+
+    limit = getattr(settings, "WAGTAILFRONTENDCACHE_PURGE_REFERENCES_LIMIT", 1000)
+    page_ids = _get_referencing_page_ids(objects, limit)
+
+    if page_ids is None:
+        logger.info(
+            "More than %d pages to purge for references, purging everything", limit
+        )
+        backend_objects = get_backends(backend_settings, backends)
+        purge_all_backends = [
+            name
+            for name, backend in backend_objects.items()
+            if _supports_purge_all(backend)
+        ]
+        if purge_all_backends:
+            purge_all_from_cache(backend_settings, purge_all_backends)
+
+        backends = [name for name in backend_objects if name not in purge_all_backends]
+        if not backends:
+            return
+        page_ids = _get_referencing_page_ids(objects)
+    else:
+        limit = None
+
+    if not page_ids:
+        return
+
+    page_ids = sorted(page_ids)
+    batch_size = limit or len(page_ids)
+    for start in range(0, len(page_ids), batch_size):
+        purge_pages_from_cache(
+            Page.objects.live()
+            .filter(pk__in=page_ids[start : start + batch_size])
+            .specific(defer=True),
+            backend_settings,
+            backends,
+        )
+
+
+def _supports_purge_all(backend):
+    return type(backend).purge_all is not BaseBackend.purge_all
+
+
 class PurgeBatch:
     """Represents a list of URLs to be purged in a single request"""
 
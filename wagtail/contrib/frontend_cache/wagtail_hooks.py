@@ -0,0 +1,18 @@
+from wagtail import hooks
+from wagtail.contrib.frontend_cache.signal_handlers import (
+    purge_references,
+    should_purge_references,
+)
+
+
+@hooks.register("before_delete_snippet")
+def purge_references_before_delete_snippet(request, instances):
+    # The hook also runs when the confirmation page is shown
+    if request.method == "POST":
+        purge_references(
+            [
+                instance
+                for instance in instances
+                if should_purge_references(type(instance))
+            ]
+        )
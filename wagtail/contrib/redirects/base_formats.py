@@ -28,7 +28,10 @@ class Dataset(list):
             "| ".join(f"{{{idx}:{width}}}" for idx, width in enumerate(widths))
         ).format
 
-        return "\n".join(row_formatter(*row) for row in result)
+        # Pad out short rows, such as blank lines in csv files
+        return "\n".join(
+            row_formatter(*row, *[""] * (len(widths) - len(row))) for row in result
+        )
 
 
 class CSV:
@@ -44,6 +47,13 @@ class CSV:
         """
         return Dataset(csv.reader(StringIO(data), delimiter=delimiter))
 
+    def iter_rows(self, fh, delimiter=","):
+        """
+        Iterate over the rows of an open csv file, without reading it all into
+        memory.
+        """
+        return csv.reader(fh, delimiter=delimiter)
+
 
 class TSV(CSV):
     def create_dataset(self, data):
@@ -52,6 +62,13 @@ class TSV(CSV):
         """
         return super().create_dataset(data, delimiter="\t")
 
+    def iter_rows(self, fh):
+        """
+        Iterate over the rows of an open tsv file, without reading it all into
+        memory.
+        """
+        return super().iter_rows(fh, delimiter="\t")
+
 
 class XLSX:
     def is_binary(self):
@@ -73,6 +90,21 @@ class XLSX:
         finally:
             workbook.close()
 
+    def iter_rows(self, fh):
+        """
+        Iterate over the rows of the first sheet of an open xlsx workbook,
+        reading them from the file as they are needed.
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(fh, read_only=True, data_only=True)
+        sheet = workbook.worksheets[0]
+        try:
+            for row in sheet.rows:
+                yield tuple(cell.value for cell in row)
+        finally:
+            workbook.close()
+
 
 DEFAULT_FORMATS = [
     CSV,
@@ -0,0 +1,151 @@
+import time
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from wagtail.compat import URLField
+from wagtail.coreutils import BatchProcessor
+
+from .lookup import invalidate_redirect_table
+from .models import Redirect
+
+
+class BulkRedirectImporter(BatchProcessor):
+    """
+    Imports redirects from ``(row_number, from_link, to_link)`` rows in
+    chunks of ``max_size``, validating the rows as ``RedirectForm`` would,
+    finding any clashing redirects with one query per chunk, and saving the
+    new redirects with ``bulk_create()``.
+
+    Rows clashing with an existing redirect for the same path and site are
+    reported as errors, unless ``update_existing`` is ``True``, in which case
+    the existing redirects are changed to point at the new links with
+    ``bulk_update()``.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        *,
+        site=None,
+        is_permanent=True,
+        update_existing=False,
+        dry_run=False,
+    ):
+        super().__init__(max_size)
+        self.site = site
+        self.is_permanent = is_permanent
+        self.update_existing = update_existing
+        self.dry_run = dry_run
+
+        self.old_path_field = forms.CharField(
+            max_length=Redirect._meta.get_field("old_path").max_length
+        )
+        self.redirect_link_field = URLField(
+            max_length=Redirect._meta.get_field("redirect_link").max_length,
+            required=False,
+        )
+
+        # The paths of all the valid rows so far, to catch duplicates in later
+        # chunks. These can't be left to the clash query, as with dry_run the
+        # earlier rows aren't saved, and with update_existing they'd be
+        # updated rather than reported
+        self.seen_paths = set()
+        self.created_count = 0
+        self.updated_count = 0
+        self.errors = []
+        self.started_at = time.monotonic()
+
+    def clean_row(self, from_link, to_link):
+        """
+        Returns the normalised ``(old_path, redirect_link)`` for a row, or
+        raises ``ValidationError``.
+        """
+        old_path = Redirect.normalise_path(self.old_path_field.clean(from_link))
+        redirect_link = self.redirect_link_field.clean(to_link)
+        return old_path, redirect_link
+
+    def _do_processing(self):
+        redirect_links = {}
+        for row_number, from_link, to_link in self.items:
+            try:
+                old_path, redirect_link = self.clean_row(from_link, to_link)
+            except ValidationError as e:
+                self.add_error(row_number, from_link, to_link, " ".join(e.messages))
+                continue
+
+            if old_path in self.seen_paths:
+                self.add_error(
+                    row_number, from_link, to_link, "Duplicate of an earlier row."
+                )
+                continue
+
+            self.seen_paths.add(old_path)
+            redirect_links[old_path] = (row_number, from_link, to_link, redirect_link)
+
+        if not redirect_links:
+            return
+
+        # Find the existing redirects clashing with any in this chunk in a
+        # single query
+        existing_redirects = {
+            redirect.old_path: redirect
+            for redirect in Redirect.objects.filter(
+                site=self.site, old_path__in=list(redirect_links)
+            )
+        }
+
+        new_redirects = []
+        updated_redirects = []
+        for old_path, row in redirect_links.items():
+            row_number, from_link, to_link, redirect_link = row
+            redirect = existing_redirects.get(old_path)
+            if redirect is None:
+                new_redirects.append(
+                    Redirect(
+                        old_path=old_path,
+                        site=self.site,
+                        redirect_link=redirect_link,
+                        is_permanent=self.is_permanent,
+                    )
+                )
+            elif self.update_existing:
+                redirect.redirect_link = redirect_link
+                redirect.redirect_page = None
+                redirect.redirect_page_route_path = ""
+                redirect.is_permanent = self.is_permanent
+                updated_redirects.append(redirect)
+            else:
+                self.add_error(
+                    row_number,
+                    from_link,
+                    to_link,
+                    "A redirect with this path already exists.",
+                )
+
+        if not self.dry_run:
+            with transaction.atomic():
+                Redirect.objects.bulk_create(new_redirects)
+                Redirect.objects.bulk_update(
+                    updated_redirects,
+                    [
+                        "redirect_link",
+                        "redirect_page",
+                        "redirect_page_route_path",
+                        "is_permanent",
+                    ],
+                )
+                # Redirects saved in bulk don't send post_save signals
+                invalidate_redirect_table()
+
+        self.created_count += len(new_redirects)
+        self.updated_count += len(updated_redirects)
+
+    def add_error(self, row_number, from_link, to_link, message):
+        self.errors.append((row_number, from_link, to_link, message))
+
+    @property
+    def rows_per_second(self):
+        elapsed = time.monotonic() - self.started_at
+        return self.added_count / elapsed if elapsed else 0
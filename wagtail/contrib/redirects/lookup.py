@@ -0,0 +1,116 @@
+"""
+An in-memory table of redirected paths, used by ``RedirectMiddleware`` in
+place of database queries when the ``WAGTAILREDIRECTS_LOOKUP_TABLE`` setting
+is enabled.
+
+Each process builds the table from the database when first needed, and
+rebuilds it when the version stored in the cache changes. The version is
+changed whenever redirects are saved or deleted, so that every process picks
+up the change.
+"""
+
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Redirect
+
+REDIRECT_TABLE_VERSION_CACHE_KEY = "wagtail-redirect-table-version"
+
+_lock = threading.Lock()
+_table = None
+
+
+def is_redirect_table_enabled():
+    return getattr(settings, "WAGTAILREDIRECTS_LOOKUP_TABLE", False)
+
+
+class RedirectTable:
+    """
+    Maps each redirected path to the ids of its redirects, keyed by the site
+    they apply to (or ``None`` for redirects applying to all sites).
+
+    As paths are looked up before sites, a path that isn't redirected for any
+    site is ruled out with a single dict lookup.
+    """
+
+    def __init__(self, version, redirects):
+        self.version = version
+        self.redirect_ids = {}
+        for redirect_id, site_id, old_path in redirects:
+            self.redirect_ids.setdefault(old_path, {}).setdefault(site_id, redirect_id)
+
+    @classmethod
+    def build(cls, version):
+        return cls(
+            version,
+            Redirect.objects.order_by("pk").values_list("pk", "site_id", "old_path"),
+        )
+
+    def __contains__(self, path):
+        return path in self.redirect_ids
+
+    def __len__(self):
+        return len(self.redirect_ids)
+
+    def get_redirect_id(self, path, site_id=None):
+        """
+        Returns the id of the redirect for ``path`` on the site with id
+        ``site_id``, preferring a site-specific redirect to one for all sites.
+        If ``site_id`` is ``None``, a redirect for any site may be returned.
+        """
+        redirect_ids = self.redirect_ids.get(path)
+        if not redirect_ids:
+            return None
+
+        if site_id is not None:
+            return redirect_ids.get(site_id, redirect_ids.get(None))
+
+        if len(redirect_ids) == 1:
+            return next(iter(redirect_ids.values()))
+        return redirect_ids.get(None)
+
+
+def get_redirect_table_version():
+    version = cache.get(REDIRECT_TABLE_VERSION_CACHE_KEY)
+    if version is None:
+        # The version was never set, or has been evicted from the cache
+        cache.add(REDIRECT_TABLE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        version = cache.get(REDIRECT_TABLE_VERSION_CACHE_KEY)
+    return version
+
+
+def get_redirect_table():
+    """
+    Returns this process's ``RedirectTable``, rebuilding it if redirects have
+    changed since it was built.
+    """
+    global _table
+
+    version = get_redirect_table_version()
+    table = _table
+    if table is not None and table.version == version:
+        return table
+
+    with _lock:
+        if _table is None or _table.version != version:
+            _table = RedirectTable.build(version)
+        return _table
+
+
+def _change_redirect_table_version():
+    global _table
+
+    cache.set(REDIRECT_TABLE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _table = None
+
+
+def invalidate_redirect_table():
+    """
+    Mark the redirect tables of all processes as out of date once the current
+    transaction is committed, so they are rebuilt with the committed changes.
+    """
+    transaction.on_commit(_change_redirect_table_version)
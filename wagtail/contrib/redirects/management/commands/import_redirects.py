@@ -1,8 +1,10 @@
 import os
+from itertools import chain, islice
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from wagtail.contrib.redirects.base_formats import Dataset
+from wagtail.contrib.redirects.bulk_import import BulkRedirectImporter
 from wagtail.contrib.redirects.forms import RedirectForm
 from wagtail.contrib.redirects.utils import (
     get_format_cls_by_extension,
@@ -71,6 +73,28 @@ class Command(BaseCommand):
         parser.add_argument(
             "--limit", help="Limit import to num items", type=int, default=None
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help=(
+                "Stream rows from the file and save redirects in bulk, for "
+                "importing large files quickly"
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            help="Number of rows to validate and save at once in bulk mode",
+            type=int,
+            default=1000,
+        )
+        parser.add_argument(
+            "--update-existing",
+            action="store_true",
+            help=(
+                "In bulk mode, change existing redirects for the same paths to "
+                "the new links, rather than skipping those rows"
+            ),
+        )
 
     def handle(self, *args, **options):
         src = options["src"]
@@ -84,6 +108,12 @@ class Command(BaseCommand):
         ask = options.pop("ask")
         offset = options.pop("offset")
         limit = options.pop("limit")
+        bulk = options.pop("bulk")
+        chunk_size = options.pop("chunk_size")
+        update_existing = options.pop("update_existing")
+
+        if bulk and ask:
+            raise CommandError("--ask can't be used with --bulk")
 
         errors = []
         successes = 0
@@ -116,6 +146,22 @@ class Command(BaseCommand):
         else:
             mode = "r"
 
+        if bulk:
+            with open(src, mode) as fh:
+                self.bulk_import(
+                    input_format.iter_rows(fh),
+                    from_index=from_index,
+                    to_index=to_index,
+                    site=site,
+                    permanent=permanent,
+                    dry_run=dry_run,
+                    offset=offset,
+                    limit=limit,
+                    chunk_size=chunk_size,
+                    update_existing=update_existing,
+                )
+            return
+
         with open(src, mode) as fh:
             imported_data = input_format.create_dataset(fh.read())
             sample_data = Dataset(imported_data[:4], imported_data.headers)
@@ -198,6 +244,80 @@ class Command(BaseCommand):
         self.stdout.write(f"Skipped : {skipped}")
         self.stdout.write(f"Errors: {len(errors)}")
 
+    def bulk_import(
+        self,
+        rows,
+        *,
+        from_index,
+        to_index,
+        site,
+        permanent,
+        dry_run,
+        offset,
+        limit,
+        chunk_size,
+        update_existing,
+    ):
+        headers = next(rows, [])
+        sample_rows = list(islice(rows, 4))
+
+        self.stdout.write("Sample data:")
+        self.stdout.write(str(Dataset(sample_rows, headers)))
+        self.stdout.write("--------------")
+
+        if site:
+            self.stdout.write(f"Using site: {site.hostname}")
+
+        self.stdout.write("Importing redirects in bulk:")
+
+        rows = chain(sample_rows, rows)
+        if offset or limit:
+            start = offset or 0
+            rows = islice(rows, start, start + limit if limit else None)
+
+        importer = BulkRedirectImporter(
+            chunk_size,
+            site=site,
+            is_permanent=permanent,
+            update_existing=update_existing,
+            dry_run=dry_run,
+        )
+        reported_errors = 0
+        for total, row in enumerate(rows, start=1):
+            if len(row) > max(from_index, to_index):
+                importer.add((total, row[from_index], row[to_index]))
+            else:
+                # Blank or short rows, which csv files can have
+                importer.add_error(
+                    total,
+                    row[from_index] if len(row) > from_index else "",
+                    row[to_index] if len(row) > to_index else "",
+                    "Missing the from or to column.",
+                )
+
+            if total % chunk_size == 0:
+                reported_errors = self.report_bulk_errors(importer, reported_errors)
+                self.stdout.write(
+                    f"{total} rows processed ({importer.rows_per_second:.0f} rows/s)"
+                )
+
+        importer.process()
+        self.report_bulk_errors(importer, reported_errors)
+
+        self.stdout.write("\n")
+        self.stdout.write(f"Found: {importer.added_count}")
+        self.stdout.write(f"Created: {importer.created_count}")
+        self.stdout.write(f"Updated: {importer.updated_count}")
+        self.stdout.write(f"Errors: {len(importer.errors)}")
+        self.stdout.write(f"Rows per second: {importer.rows_per_second:.0f}")
+
+    def report_bulk_errors(self, importer, reported_errors):
+        for row_number, from_link, to_link, error in importer.errors[reported_errors:]:
+            self.stdout.write(
+                f"{row_number}. Error: {from_link} -> {to_link} (Reason: {error})"
+            )
+        return len(importer.errors)
+
 
 def get_input(msg):  # pragma: no cover
     return input(msg)
@@ -5,15 +5,42 @@ from django.utils.deprecation import MiddlewareMixin
 from django.utils.encoding import uri_to_iri
 
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.lookup import (
+    get_redirect_table,
+    is_redirect_table_enabled,
+)
 from wagtail.models import Site
 
 
+def _get_redirect_from_table(request, path):
+    table = get_redirect_table()
+
+    # Rule out paths that aren't redirected for any site before finding the
+    # site, so that most 404s need no database queries
+    if path not in table:
+        return None
+
+    site = Site.find_for_request(request)
+    redirect_id = table.get_redirect_id(path, site.pk if site else None)
+    if redirect_id is None:
+        return None
+
+    try:
+        return models.Redirect.objects.get(pk=redirect_id)
+    except models.Redirect.DoesNotExist:
+        # Deleted since the table was built
+        return None
+
+
 def _get_redirect(request, path):
     if (
         "\0" in path
     ):  # reject URLs with null characters, which crash on Postgres (#4496)
         return None
 
+    if is_redirect_table_enabled():
+        return _get_redirect_from_table(request, path)
+
     site = Site.find_for_request(request)
     try:
         return models.Redirect.get_for_site(site).get(old_path=path)
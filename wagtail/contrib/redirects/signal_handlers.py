@@ -9,6 +9,7 @@ from wagtail.contrib.frontend_cache.utils import PurgeBatch
 from wagtail.coreutils import BatchCreator, get_dummy_request
 from wagtail.models import Page, Site
 
+from .lookup import invalidate_redirect_table
 from .models import Redirect
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,9 @@ class BatchRedirectCreator(BatchCreator):
         Redirect.objects.filter(automatically_created=True).filter(clashes_q).delete()
 
     def post_process(self):
+        # Redirects created in bulk don't send post_save signals
+        invalidate_redirect_table()
+
         if not apps.is_installed("wagtail.contrib.frontend_cache"):
             return
 
@@ -43,6 +47,10 @@ class BatchRedirectCreator(BatchCreator):
         batch.purge()
 
 
+def invalidate_redirect_table_on_change(**kwargs):
+    invalidate_redirect_table()
+
+
 def autocreate_redirects_on_slug_change(
     instance_before: Page, instance: Page, **kwargs
 ):
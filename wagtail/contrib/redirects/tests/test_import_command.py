@@ -348,3 +348,210 @@ class TestImportCommand(TestCase):
         self.assertEqual(redirects[0].old_path, "/one")
         self.assertEqual(redirects[0].redirect_link, "http://one.test/")
         self.assertIs(redirects[0].is_permanent, True)
+
+
+class TestBulkImportCommand(TestCase):
+    def write_file(self, *rows):
+        file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
+        file.write("from,to\n")
+        file.write("\n".join(rows))
+        file.seek(0)
+        return file
+
+    def call_command(self, file, **options):
+        out = StringIO()
+        call_command(
+            "import_redirects",
+            src=file.name,
+            format="csv",
+            bulk=True,
+            stdout=out,
+            **options,
+        )
+        return out.getvalue()
+
+    def test_redirects_get_imported(self):
+        file = self.write_file(
+            "/alpha/,http://alpha.test/",
+            "http://example.com/beta?b=2&a=1,http://beta.test/",
+            "/gamma,http://gamma.test/",
+        )
+
+        output = self.call_command(file, chunk_size=2)
+
+        self.assertIn("Created: 3", output)
+        self.assertEqual(
+            set(Redirect.objects.values_list("old_path", "redirect_link", "site")),
+            {
+                ("/alpha", "http://alpha.test/", None),
+                ("/beta?a=1&b=2", "http://beta.test/", None),
+                ("/gamma", "http://gamma.test/", None),
+            },
+        )
+        self.assertTrue(all(Redirect.objects.values_list("is_permanent", flat=True)))
+
+    def test_binary_formats_are_supported(self):
+        out = StringIO()
+        call_command(
+            "import_redirects",
+            src=f"{TEST_ROOT}/files/example.xlsx",
+            bulk=True,
+            stdout=out,
+        )
+        self.assertEqual(Redirect.objects.count(), 3)
+
+    def test_redirects_get_added_to_site(self):
+        site = Site.objects.get(is_default_site=True)
+        file = self.write_file("/alpha,http://alpha.test/")
+
+        self.call_command(file, site=site.pk, permanent=False)
+
+        redirect = Redirect.objects.get()
+        self.assertEqual(redirect.site, site)
+        self.assertIs(redirect.is_permanent, False)
+
+    def test_invalid_rows_are_reported(self):
+        file = self.write_file(
+            "/alpha,/not-absolute/",
+            ",http://empty.test/",
+            "/beta,http://beta.test/",
+        )
+
+        output = self.call_command(file)
+
+        self.assertEqual(Redirect.objects.count(), 1)
+        self.assertIn("Errors: 2", output)
+        self.assertIn("1. Error: /alpha -> /not-absolute/", output)
+
+    def test_blank_and_short_rows_are_reported(self):
+        file = self.write_file(
+            "",
+            "/alpha",
+            "",
+            "/beta,http://beta.test/",
+        )
+
+        output = self.call_command(file, chunk_size=2)
+
+        self.assertEqual(Redirect.objects.get().old_path, "/beta")
+        self.assertIn("Errors: 3", output)
+        self.assertIn("1. Error:  ->  (Reason: Missing the from or to column.)", output)
+        self.assertIn(
+            "2. Error: /alpha ->  (Reason: Missing the from or to column.)", output
+        )
+
+    def test_duplicates_get_skipped_across_chunks(self):
+        Redirect.objects.create(old_path="/existing", redirect_link="http://old.test/")
+        file = self.write_file(
+            "/alpha,http://alpha.test/",
+            "/alpha/,http://alpha2.test/",
+            "/existing,http://new.test/",
+            "/alpha,http://alpha3.test/",
+        )
+
+        output = self.call_command(file, chunk_size=2)
+
+        self.assertIn("Errors: 3", output)
+        self.assertIn(
+            "4. Error: /alpha -> http://alpha3.test/ (Reason: Duplicate of an earlier row.)",
+            output,
+        )
+        self.assertEqual(
+            Redirect.objects.get(old_path="/alpha").redirect_link,
+            "http://alpha.test/",
+        )
+        self.assertEqual(
+            Redirect.objects.get(old_path="/existing").redirect_link,
+            "http://old.test/",
+        )
+
+    def test_duplicates_across_chunks_in_dry_run(self):
+        file = self.write_file(
+            "/alpha,http://alpha.test/",
+            "/beta,http://beta.test/",
+            "/alpha,http://alpha2.test/",
+        )
+
+        output = self.call_command(file, chunk_size=2, dry_run=True)
+
+        self.assertIn("Created: 2", output)
+        self.assertIn("Errors: 1", output)
+        self.assertIn("3. Error: /alpha -> http://alpha2.test/", output)
+        self.assertFalse(Redirect.objects.exists())
+
+    def test_duplicates_across_chunks_with_update_existing(self):
+        file = self.write_file(
+            "/alpha,http://alpha.test/",
+            "/beta,http://beta.test/",
+            "/alpha,http://alpha2.test/",
+        )
+
+        output = self.call_command(file, chunk_size=2, update_existing=True)
+
+        self.assertIn("Created: 2", output)
+        self.assertIn("Updated: 0", output)
+        self.assertIn("Errors: 1", output)
+        self.assertEqual(
+            Redirect.objects.get(old_path="/alpha").redirect_link,
+            "http://alpha.test/",
+        )
+
+    def test_update_existing(self):
+        Redirect.objects.create(
+            old_path="/existing", redirect_link="http://old.test/", is_permanent=False
+        )
+        file = self.write_file(
+            "/existing,http://new.test/",
+            "/alpha,http://alpha.test/",
+        )
+
+        output = self.call_command(file, update_existing=True)
+
+        self.assertIn("Created: 1", output)
+        self.assertIn("Updated: 1", output)
+        redirect = Redirect.objects.get(old_path="/existing")
+        self.assertEqual(redirect.redirect_link, "http://new.test/")
+        self.assertIs(redirect.is_permanent, True)
+
+    def test_queries_per_chunk(self):
+        file = self.write_file(
+            *(f"/path-{i},http://example.test/{i}" for i in range(10))
+        )
+
+        # Each chunk is checked for clashes with one query and saved with one
+        # more, with a savepoint around the save
+        with self.assertNumQueries(8):
+            self.call_command(file, chunk_size=5)
+
+        self.assertEqual(Redirect.objects.count(), 10)
+
+    def test_offset_and_limit(self):
+        file = self.write_file(
+            "/one,http://one.test/",
+            "/two,http://two.test/",
+            "/three,http://three.test/",
+            "/four,http://four.test/",
+            "/five,http://five.test/",
+            "/six,http://six.test/",
+        )
+
+        self.call_command(file, offset=1, limit=4)
+
+        self.assertEqual(
+            list(Redirect.objects.order_by("pk").values_list("old_path", flat=True)),
+            ["/two", "/three", "/four", "/five"],
+        )
+
+    def test_nothing_gets_saved_on_dry_run(self):
+        file = self.write_file("/alpha,http://alpha.test/")
+
+        output = self.call_command(file, dry_run=True)
+
+        self.assertIn("Created: 1", output)
+        self.assertEqual(Redirect.objects.count(), 0)
+
+    def test_ask_cannot_be_used(self):
+        file = self.write_file("/alpha,http://alpha.test/")
+
+        with self.assertRaises(CommandError):
+            self.call_command(file, ask=True)
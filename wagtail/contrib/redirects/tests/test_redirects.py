@@ -1,14 +1,25 @@
 from io import BytesIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import Permission
-from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.http import HttpResponseNotFound
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from openpyxl.reader.excel import load_workbook
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
 from wagtail.contrib.frontend_cache.tests import PURGED_URLS
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.lookup import (
+    REDIRECT_TABLE_VERSION_CACHE_KEY,
+    RedirectTable,
+    _change_redirect_table_version,
+    get_redirect_table,
+    invalidate_redirect_table,
+)
+from wagtail.contrib.redirects.middleware import RedirectMiddleware
 from wagtail.log_actions import registry as log_registry
 from wagtail.models import Page, Site
 from wagtail.test.routablepage.models import RoutablePageTest
@@ -597,6 +608,116 @@ class TestRedirects(TestCase):
         self.assertIs(redirect.is_permanent, True)
 
 
+@override_settings(
+    ALLOWED_HOSTS=["testserver", "localhost", "test.example.com", "other.example.com"],
+    WAGTAILREDIRECTS_LOOKUP_TABLE=True,
+)
+class TestRedirectsWithLookupTable(TestRedirects):
+    """
+    Runs the redirect tests with redirects looked up in the in-memory table
+    """
+
+    def setUp(self):
+        # Start each test with a table built from its own redirects, and
+        # update the table as soon as redirects change, as the test case's
+        # transaction is never committed
+        _change_redirect_table_version()
+        patcher = mock.patch(
+            "wagtail.contrib.redirects.signal_handlers.invalidate_redirect_table",
+            _change_redirect_table_version,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@override_settings(
+    ALLOWED_HOSTS=["testserver", "localhost", "test.example.com", "other.example.com"],
+    WAGTAILREDIRECTS_LOOKUP_TABLE=True,
+)
+class TestRedirectLookupTable(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_redirect_table()
+
+    def test_table_lookup(self):
+        site = Site.objects.get(is_default_site=True)
+        other_site = Site.objects.create(
+            hostname="other.example.com", port=80, root_page=site.root_page
+        )
+        generic = models.Redirect.objects.create(
+            old_path="/redirectme", redirect_link="/generic"
+        )
+        specific = models.Redirect.objects.create(
+            old_path="/redirectme", site=other_site, redirect_link="/specific"
+        )
+        only_specific = models.Redirect.objects.create(
+            old_path="/other", site=other_site, redirect_link="/specific"
+        )
+
+        table = RedirectTable.build("test")
+        self.assertIn("/redirectme", table)
+        self.assertNotIn("/missing", table)
+        self.assertEqual(table.get_redirect_id("/redirectme", site.pk), generic.pk)
+        self.assertEqual(
+            table.get_redirect_id("/redirectme", other_site.pk), specific.pk
+        )
+        self.assertIsNone(table.get_redirect_id("/other", site.pk))
+        self.assertEqual(table.get_redirect_id("/other"), only_specific.pk)
+        self.assertEqual(table.get_redirect_id("/redirectme"), generic.pk)
+        self.assertIsNone(table.get_redirect_id("/missing"))
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_miss_makes_no_queries(self):
+        models.Redirect.objects.create(old_path="/redirectme", redirect_link="/to")
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_redirect_table()
+        get_redirect_table()
+
+        request = RequestFactory().get("/missing/?foo=bar")
+        with self.assertNumQueries(0):
+            response = RedirectMiddleware(lambda request: HttpResponseNotFound())(
+                request
+            )
+        self.assertEqual(response.status_code, 404)
+
+    def test_saving_and_deleting_redirects_updates_table(self):
+        self.assertEqual(self.client.get("/redirectme/").status_code, 404)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect = models.Redirect.objects.create(
+                old_path="/redirectme", redirect_link="/redirectto"
+            )
+        self.assertRedirects(
+            self.client.get("/redirectme/"),
+            "/redirectto",
+            status_code=301,
+            fetch_redirect_response=False,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect.old_path = "/moved"
+            redirect.save()
+        self.assertEqual(self.client.get("/redirectme/").status_code, 404)
+        self.assertEqual(self.client.get("/moved/").status_code, 301)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect.delete()
+        self.assertEqual(self.client.get("/moved/").status_code, 404)
+
+    def test_table_rebuilt_when_version_changes(self):
+        table = get_redirect_table()
+        self.assertIs(get_redirect_table(), table)
+
+        # Another process changes the redirects
+        cache.set(REDIRECT_TABLE_VERSION_CACHE_KEY, "changed", None)
+        self.assertIsNot(get_redirect_table(), table)
+        self.assertEqual(get_redirect_table().version, "changed")
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 )
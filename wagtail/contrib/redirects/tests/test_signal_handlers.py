@@ -206,6 +206,9 @@ class TestAutocreateRedirects(WagtailTestUtils, TestCase):
                 "http://localhost/routable-page",
                 "http://localhost/routable-page/not-a-valid-route",
                 "http://localhost/routable-page/render-method-test",
+                # The page's old and new URLs are purged for the move
+                "http://localhost/routable-page/",
+                "http://localhost/events/routable-page/",
             },
         )
 
@@ -231,7 +234,22 @@ class TestAutocreateRedirects(WagtailTestUtils, TestCase):
 
         # No redirects should have been created
         self.assertFalse(Redirect.objects.exists())
-        self.assertEqual(len(PURGED_URLS), 0)
+
+        # Only the pages' old and new URLs are purged, for the move itself
+        self.assertEqual(
+            PURGED_URLS,
+            {
+                f"http://{hostname}/events/{path}"
+                for hostname in ["localhost", "newsite.com"]
+                for path in [
+                    "",
+                    "past/",
+                    "christmas/",
+                    "final-event/",
+                    "saint-patrick/pointless-suffix/",
+                ]
+            },
+        )
 
     @override_settings(WAGTAILREDIRECTS_AUTO_CREATE=False)
     def test_no_redirects_created_if_disabled(self):
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from wagtail.contrib.sitemaps.pregenerated import PregeneratedSitemap
+from wagtail.models import Site
+
+
+class Command(BaseCommand):
+    help = "Write the sitemap of each site to storage, to be served by the pregenerated sitemap views"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            action="append",
+            dest="site_ids",
+            type=int,
+            help="The ID of a site to generate the sitemap of. Defaults to all sites",
+        )
+
+    def handle(self, **options):
+        sites = Site.objects.select_related("root_page").order_by("pk")
+        if options["site_ids"]:
+            sites = sites.filter(pk__in=options["site_ids"])
+
+        for site in sites:
+            manifest = PregeneratedSitemap(site).generate()
+            if options["verbosity"] > 0:
+                self.stdout.write(
+                    "%s: %d URLs in %d files"
+                    % (
+                        site,
+                        sum(chunk["urls"] for chunk in manifest["chunks"]),
+                        len(manifest["chunks"]),
+                    )
+                )
@@ -0,0 +1,326 @@
+"""
+Sitemaps written to storage ahead of time, for sites with too many pages to
+build the sitemap on every request.
+
+The sitemap of each site is split into gzipped files of up to 50,000 URLs, in
+the order of the page tree, and listed in a manifest recording the tree path
+of the first page in each file. When pages are published, unpublished or
+moved, only the files covering them and their descendants are written again.
+"""
+
+import gzip
+import json
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import InvalidStorageError, default_storage, storages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.module_loading import import_string
+
+from .sitemap_generator import Sitemap
+
+
+def get_sitemap_storage():
+    """
+    Returns the storage that pregenerated sitemaps are written to, as configured
+    by the ``WAGTAILSITEMAPS_STORAGE`` setting, or the default storage.
+    """
+    storage = getattr(settings, "WAGTAILSITEMAPS_STORAGE", default_storage)
+    if isinstance(storage, str):
+        try:
+            # First see if the string is a storage alias
+            storage = storages[storage]
+        except InvalidStorageError:
+            # Otherwise treat the string as a dotted path
+            try:
+                storage = import_string(storage)()
+            except ImportError as e:
+                raise ImproperlyConfigured(
+                    "WAGTAILSITEMAPS_STORAGE must be either a valid storage alias or dotted module path."
+                ) from e
+
+    return storage
+
+
+def is_pregenerated_sitemaps_enabled():
+    return getattr(settings, "WAGTAILSITEMAPS_PREGENERATED", False)
+
+
+class PregeneratedSitemap:
+    """
+    The pregenerated sitemap of a Wagtail site, containing the URLs returned by
+    ``get_sitemap_urls`` for the pages in ``sitemap_class.items()``.
+    """
+
+    # The maximum number of URLs in each file, as allowed by the sitemap protocol
+    limit = 50000
+
+    # The number of pages fetched from the database at a time
+    batch_size = 1000
+
+    # The directory in storage to write sitemaps to, within which each site's
+    # files are kept in a directory named after its ID
+    directory = "sitemaps"
+
+    def __init__(self, site, sitemap_class=Sitemap, storage=None):
+        self.site = site
+        self.sitemap = sitemap_class(site=site)
+        self.storage = storage or get_sitemap_storage()
+
+    @property
+    def manifest_name(self):
+        return f"{self.directory}/{self.site.pk}/manifest.json"
+
+    def get_chunk_name(self, number):
+        return f"{self.directory}/{self.site.pk}/sitemap-{number}.xml.gz"
+
+    def read_manifest(self):
+        """
+        Returns the manifest of the sitemap, or ``None`` if it hasn't been
+        generated. The manifest is a dict with these keys:
+
+        ``chunks``: A list of dicts describing each file of the sitemap in
+            order, with its ``number``, the storage ``name`` it was saved as,
+            the tree ``first_path`` of the first page in it, the number of
+            ``urls`` in it and their latest ``lastmod``.
+
+        ``next_number``: The number to give to the next file written.
+        """
+        if not self.storage.exists(self.manifest_name):
+            return None
+
+        with self.storage.open(self.manifest_name) as f:
+            return json.load(f)
+
+    def write_manifest(self, manifest):
+        content = json.dumps(manifest, cls=DjangoJSONEncoder).encode()
+        if self.storage.exists(self.manifest_name):
+            # Overwrite the manifest in place, so that it can be read throughout
+            with self.storage.open(self.manifest_name, "wb") as f:
+                f.write(content)
+        else:
+            self.storage.save(self.manifest_name, ContentFile(content))
+
+    @contextmanager
+    def lock(self):
+        """
+        Lock the site's database row for the duration of the block, so that
+        only one task writes the site's sitemap at a time. Otherwise, tasks
+        writing it at once would overwrite each other's manifests, losing the
+        files that they wrote and listing those that they deleted.
+        """
+        from wagtail.models import Site
+
+        with transaction.atomic():
+            list(
+                Site.objects.select_for_update()
+                .filter(pk=self.site.pk)
+                .values_list("pk", flat=True)
+            )
+            yield
+
+    def get_chunk(self, number):
+        """
+        Returns the manifest entry for the file with the given number, or
+        ``None`` if there is no such file.
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            return None
+
+        for chunk in manifest["chunks"]:
+            if chunk["number"] == number:
+                return chunk
+
+    def get_chunk_lastmod(self, chunk):
+        if not chunk["lastmod"]:
+            return None
+        return parse_datetime(chunk["lastmod"]) or parse_date(chunk["lastmod"])
+
+    def iter_pages(self, from_path=None, to_path=None):
+        """
+        Yields the pages in the sitemap from the tree path ``from_path`` up to
+        (but not including) ``to_path``, in tree order, fetching them
+        ``batch_size`` at a time.
+        """
+        queryset = self.sitemap.items()
+        if from_path is not None:
+            queryset = queryset.filter(path__gte=from_path)
+        if to_path is not None:
+            queryset = queryset.filter(path__lt=to_path)
+
+        last_path = None
+        while True:
+            batch_queryset = queryset
+            if last_path is not None:
+                batch_queryset = queryset.filter(path__gt=last_path)
+
+            pages = list(batch_queryset[: self.batch_size])
+            if not pages:
+                return
+
+            yield from pages
+            last_path = pages[-1].path
+
+    def iter_chunks(self, pages):
+        """
+        Groups the URLs of ``pages`` into lists of up to ``limit`` URLs, without
+        splitting the URLs of a page across lists. Yields a tuple of the tree
+        path of the first page and the URLs for each list.
+        """
+        first_path = None
+        urls = []
+        for page in pages:
+            page_urls = page.get_sitemap_urls(self.sitemap.request)
+            if urls and len(urls) + len(page_urls) > self.limit:
+                yield first_path, urls
+                first_path = None
+                urls = []
+
+            if first_path is None:
+                first_path = page.path
+            urls.extend(page_urls)
+
+        if urls:
+            yield first_path, urls
+
+    def write_chunk(self, number, first_path, urls):
+        """
+        Write a file of the sitemap containing ``urls``, returning its
+        manifest entry
+        """
+        content = render_to_string("sitemap.xml", {"urlset": urls})
+        name = self.storage.save(
+            self.get_chunk_name(number),
+            ContentFile(gzip.compress(content.encode())),
+        )
+
+        last_mods = {url.get("lastmod") for url in urls}
+        return {
+            "number": number,
+            "name": name,
+            "first_path": first_path,
+            "urls": len(urls),
+            # The latest modification, unless any of the URLs don't have one
+            "lastmod": max(last_mods) if None not in last_mods else None,
+        }
+
+    def write_chunks(self, manifest, pages):
+        chunks = []
+        for first_path, urls in self.iter_chunks(pages):
+            chunks.append(self.write_chunk(manifest["next_number"], first_path, urls))
+            manifest["next_number"] += 1
+        return chunks
+
+    def delete_chunks(self, chunks):
+        for chunk in chunks:
+            self.storage.delete(chunk["name"])
+
+    def generate(self):
+        """
+        Write the whole sitemap, replacing any written before
+        """
+        with self.lock():
+            return self._generate()
+
+    def _generate(self):
+        manifest = self.read_manifest()
+        old_chunks = manifest["chunks"] if manifest else []
+
+        manifest = {
+            "chunks": [],
+            "next_number": manifest["next_number"] if manifest else 1,
+        }
+        manifest["chunks"] = self.write_chunks(manifest, self.iter_pages())
+
+        # Only delete the old files once the manifest no longer lists them, so
+        # that they can be served until then
+        self.write_manifest(manifest)
+        self.delete_chunks(old_chunks)
+
+        return manifest
+
+    def update(self, paths):
+        """
+        Write the files of the sitemap covering the pages at the given tree
+        paths, and their descendants, again. Does nothing if the sitemap hasn't
+        been generated.
+        """
+        with self.lock():
+            return self._update(paths)
+
+    def _update(self, paths):
+        manifest = self.read_manifest()
+        if manifest is None:
+            return None
+
+        chunks = manifest["chunks"]
+        if not chunks:
+            # The sitemap was empty, so any pages would be in a new first file
+            manifest["chunks"] = self.write_chunks(manifest, self.iter_pages())
+            self.write_manifest(manifest)
+            return manifest
+
+        # Each file covers the pages from its first path, up to the first path
+        # of the next file. The first file also covers any pages before it
+        affected = set()
+        for path in paths:
+            # Descendants' paths start with their ancestors', and "~" sorts
+            # after all the characters in paths
+            subtree_end = path + "~"
+            for index, chunk in enumerate(chunks):
+                start = chunk["first_path"] if index > 0 else ""
+                end = (
+                    chunks[index + 1]["first_path"] if index + 1 < len(chunks) else None
+                )
+                if start < subtree_end and (end is None or path < end):
+                    affected.add(index)
+
+        # Write each run of consecutive affected files again
+        new_chunks = []
+        old_chunks = []
+        index = 0
+        while index < len(chunks):
+            if index not in affected:
+                new_chunks.append(chunks[index])
+                index += 1
+                continue
+
+            run_start = index
+            while index < len(chunks) and index in affected:
+                index += 1
+
+            from_path = chunks[run_start]["first_path"] if run_start > 0 else None
+            to_path = chunks[index]["first_path"] if index < len(chunks) else None
+            new_chunks.extend(
+                self.write_chunks(manifest, self.iter_pages(from_path, to_path))
+            )
+            old_chunks.extend(chunks[run_start:index])
+
+        manifest["chunks"] = new_chunks
+        self.write_manifest(manifest)
+        self.delete_chunks(old_chunks)
+
+        return manifest
+
+
+def get_sites_for_paths(paths):
+    """
+    Returns the sites containing the pages at the given tree paths or any of
+    their descendants
+    """
+    from wagtail.models import Site
+
+    return [
+        site
+        for site in Site.objects.select_related("root_page")
+        if any(
+            path.startswith(site.root_page.path) or site.root_page.path.startswith(path)
+            for path in paths
+        )
+    ]
@@ -0,0 +1,29 @@
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from .pregenerated import is_pregenerated_sitemaps_enabled
+
+
+def page_published_signal_handler(instance, **kwargs):
+    from .tasks import update_sitemaps_task
+
+    if is_pregenerated_sitemaps_enabled():
+        update_sitemaps_task.enqueue([instance.path])
+
+
+def post_page_move_signal_handler(
+    instance, parent_page_before, path_before=None, **kwargs
+):
+    from .tasks import update_sitemaps_task
+
+    if is_pregenerated_sitemaps_enabled():
+        # Without the page's previous path, its previous location is somewhere
+        # under its previous parent
+        update_sitemaps_task.enqueue(
+            [path_before or parent_page_before.path, instance.path]
+        )
+
+
+def register_signal_handlers():
+    page_published.connect(page_published_signal_handler)
+    page_unpublished.connect(page_published_signal_handler)
+    post_page_move.connect(post_page_move_signal_handler)
@@ -7,8 +7,9 @@ from django.contrib.sitemaps import Sitemap as DjangoSitemap
 
 
 class Sitemap(DjangoSitemap):
-    def __init__(self, request=None):
+    def __init__(self, request=None, site=None):
         self.request = request
+        self.site = site
 
     def location(self, obj):
         return obj.get_full_url(self.request)
@@ -21,6 +22,9 @@ class Sitemap(DjangoSitemap):
     def get_wagtail_site(self):
         from wagtail.models import Site
 
+        if self.site is not None:
+            return self.site
+
         site = Site.find_for_request(self.request)
         if site is None:
             return Site.objects.select_related("root_page").get(is_default_site=True)
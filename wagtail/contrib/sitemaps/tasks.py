@@ -0,0 +1,21 @@
+from django_tasks import task
+
+from .pregenerated import PregeneratedSitemap, get_sites_for_paths
+
+
+@task()
+def generate_sitemaps_task(site_ids=None):
+    from wagtail.models import Site
+
+    sites = Site.objects.select_related("root_page")
+    if site_ids is not None:
+        sites = sites.filter(pk__in=site_ids)
+
+    for site in sites:
+        PregeneratedSitemap(site).generate()
+
+
+@task()
+def update_sitemaps_task(paths):
+    for site in get_sites_for_paths(paths):
+        PregeneratedSitemap(site).update(paths)
@@ -1,14 +1,23 @@
 import datetime
+import gzip
+import re
+import tempfile
+from contextlib import contextmanager
+from io import StringIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.core import management
+from django.core.files.storage import FileSystemStorage
 from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
 from wagtail.models import Page, PageViewRestriction, Site
 from wagtail.test.testapp.models import EventIndex, SimplePage
 
+from .pregenerated import PregeneratedSitemap
 from .sitemap_generator import Sitemap
 
 
@@ -284,3 +293,253 @@ class TestSitemapView(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml")
+
+
+class TestPregeneratedSitemap(TestCase):
+    def setUp(self):
+        self.home_page = Page.objects.get(id=2)
+        self.site = Site.objects.get(is_default_site=True)
+
+        self.index_page = self.home_page.add_child(
+            instance=SimplePage(title="Index", slug="index", content="hello")
+        )
+        self.pages = [
+            self.index_page.add_child(
+                instance=SimplePage(title=f"Page {i}", slug=f"page-{i}", content="hi")
+            )
+            for i in range(4)
+        ]
+        self.other_page = self.home_page.add_child(
+            instance=SimplePage(title="Other", slug="other", content="hello")
+        )
+
+        media_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(media_dir.cleanup)
+        self.storage = FileSystemStorage(location=media_dir.name)
+
+        settings_override = override_settings(WAGTAILSITEMAPS_STORAGE=self.storage)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        # Put two URLs in each file
+        limit_patch = mock.patch.object(PregeneratedSitemap, "limit", 2)
+        limit_patch.start()
+        self.addCleanup(limit_patch.stop)
+
+    def get_chunk_urls(self, chunk):
+        with self.storage.open(chunk["name"]) as f:
+            content = gzip.decompress(f.read()).decode()
+        return re.findall(r"<loc>(.*?)</loc>", content)
+
+    def get_urls(self, manifest):
+        return [
+            url for chunk in manifest["chunks"] for url in self.get_chunk_urls(chunk)
+        ]
+
+    def test_generate(self):
+        manifest = PregeneratedSitemap(self.site).generate()
+
+        self.assertEqual(
+            self.get_urls(manifest),
+            [
+                "http://localhost/",
+                "http://localhost/index/",
+                "http://localhost/index/page-0/",
+                "http://localhost/index/page-1/",
+                "http://localhost/index/page-2/",
+                "http://localhost/index/page-3/",
+                "http://localhost/other/",
+            ],
+        )
+        self.assertEqual([chunk["urls"] for chunk in manifest["chunks"]], [2, 2, 2, 1])
+        self.assertEqual(
+            [chunk["first_path"] for chunk in manifest["chunks"]],
+            [
+                self.home_page.path,
+                self.pages[0].path,
+                self.pages[2].path,
+                self.other_page.path,
+            ],
+        )
+        self.assertEqual(PregeneratedSitemap(self.site).read_manifest(), manifest)
+
+    def test_generate_replaces_previous_files(self):
+        old_manifest = PregeneratedSitemap(self.site).generate()
+        manifest = PregeneratedSitemap(self.site).generate()
+
+        self.assertEqual(
+            [chunk["number"] for chunk in manifest["chunks"]], [5, 6, 7, 8]
+        )
+        for chunk in old_manifest["chunks"]:
+            self.assertFalse(self.storage.exists(chunk["name"]))
+
+    def test_update(self):
+        old_manifest = PregeneratedSitemap(self.site).generate()
+
+        self.pages[1].unpublish()
+        new_page = self.index_page.add_child(
+            instance=SimplePage(title="New", slug="new", content="hello")
+        )
+        manifest = PregeneratedSitemap(self.site).update(
+            [self.pages[1].path, new_page.path]
+        )
+
+        self.assertEqual(
+            self.get_urls(manifest),
+            [
+                "http://localhost/",
+                "http://localhost/index/",
+                "http://localhost/index/page-0/",
+                "http://localhost/index/page-2/",
+                "http://localhost/index/page-3/",
+                "http://localhost/index/new/",
+                "http://localhost/other/",
+            ],
+        )
+        # Only the files covering the changed pages are written again
+        self.assertEqual(manifest["chunks"][0], old_manifest["chunks"][0])
+        self.assertEqual(manifest["chunks"][-1], old_manifest["chunks"][-1])
+        self.assertEqual(
+            [chunk["number"] for chunk in manifest["chunks"]], [1, 5, 6, 4]
+        )
+        for chunk in old_manifest["chunks"][1:3]:
+            self.assertFalse(self.storage.exists(chunk["name"]))
+
+    def test_update_subtree(self):
+        old_manifest = PregeneratedSitemap(self.site).generate()
+
+        self.index_page.slug = "renamed"
+        self.index_page.save_revision().publish()
+        manifest = PregeneratedSitemap(self.site).update([self.index_page.path])
+
+        self.assertEqual(
+            self.get_urls(manifest),
+            [
+                "http://localhost/",
+                "http://localhost/renamed/",
+                "http://localhost/renamed/page-0/",
+                "http://localhost/renamed/page-1/",
+                "http://localhost/renamed/page-2/",
+                "http://localhost/renamed/page-3/",
+                "http://localhost/other/",
+            ],
+        )
+        self.assertEqual(manifest["chunks"][-1], old_manifest["chunks"][-1])
+
+    def test_update_is_locked(self):
+        PregeneratedSitemap(self.site).generate()
+        sitemap = PregeneratedSitemap(self.site)
+        events = []
+
+        lock = sitemap.lock
+
+        @contextmanager
+        def recording_lock():
+            with lock():
+                events.append("lock")
+                yield
+                events.append("unlock")
+
+        read_manifest = sitemap.read_manifest
+        write_manifest = sitemap.write_manifest
+        with mock.patch.multiple(
+            sitemap,
+            lock=recording_lock,
+            read_manifest=lambda: events.append("read") or read_manifest(),
+            write_manifest=lambda manifest: (
+                events.append("write") or write_manifest(manifest)
+            ),
+        ):
+            sitemap.update([self.pages[0].path])
+
+        # The manifest is read and written again while no other task can
+        self.assertEqual(events, ["lock", "read", "write", "unlock"])
+
+    def test_manifest_overwritten_in_place(self):
+        sitemap = PregeneratedSitemap(self.site)
+        sitemap.generate()
+
+        with mock.patch.object(
+            self.storage, "delete", wraps=self.storage.delete
+        ) as delete:
+            manifest = sitemap.update([self.pages[0].path])
+
+        self.assertNotIn(mock.call(sitemap.manifest_name), delete.call_args_list)
+        self.assertEqual(sitemap.read_manifest(), manifest)
+
+    def test_update_not_generated(self):
+        self.assertIsNone(PregeneratedSitemap(self.site).update([self.pages[0].path]))
+        self.assertIsNone(PregeneratedSitemap(self.site).read_manifest())
+
+    @override_settings(WAGTAILSITEMAPS_PREGENERATED=True)
+    def test_updated_on_unpublish(self):
+        PregeneratedSitemap(self.site).generate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[0].unpublish()
+
+        manifest = PregeneratedSitemap(self.site).read_manifest()
+        self.assertNotIn("http://localhost/index/page-0/", self.get_urls(manifest))
+
+    @override_settings(WAGTAILSITEMAPS_PREGENERATED=True)
+    def test_updated_on_move(self):
+        PregeneratedSitemap(self.site).generate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[0].move(self.other_page, pos="last-child")
+
+        manifest = PregeneratedSitemap(self.site).read_manifest()
+        urls = self.get_urls(manifest)
+        self.assertNotIn("http://localhost/index/page-0/", urls)
+        self.assertIn("http://localhost/other/page-0/", urls)
+
+    def test_not_updated_when_disabled(self):
+        manifest = PregeneratedSitemap(self.site).generate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[0].unpublish()
+
+        self.assertEqual(PregeneratedSitemap(self.site).read_manifest(), manifest)
+
+    def test_generate_sitemaps_command(self):
+        stdout = StringIO()
+        management.call_command("generate_sitemaps", site=[self.site.pk], stdout=stdout)
+
+        self.assertIn("7 URLs in 4 files", stdout.getvalue())
+        self.assertIsNotNone(PregeneratedSitemap(self.site).read_manifest())
+
+    def test_index_view(self):
+        PregeneratedSitemap(self.site).generate()
+
+        response = self.client.get("/pregenerated-sitemap.xml")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertEqual(
+            re.findall(r"<loc>(.*?)</loc>", response.content.decode()),
+            [
+                f"http://testserver/pregenerated-sitemap-{number}.xml.gz"
+                for number in range(1, 5)
+            ],
+        )
+
+    def test_index_view_not_generated(self):
+        response = self.client.get("/pregenerated-sitemap.xml")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_sitemap_view(self):
+        manifest = PregeneratedSitemap(self.site).generate()
+
+        response = self.client.get("/pregenerated-sitemap-2.xml.gz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(
+            re.findall(r"<loc>(.*?)</loc>", content),
+            self.get_chunk_urls(manifest["chunks"][1]),
+        )
+
+        response = self.client.get("/pregenerated-sitemap-5.xml.gz")
+        self.assertEqual(response.status_code, 404)
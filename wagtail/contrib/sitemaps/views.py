@@ -1,6 +1,9 @@
 import inspect
 
 from django.contrib.sitemaps import views as sitemap_views
+from django.http import FileResponse, Http404
+from django.template.response import TemplateResponse
+from django.urls import reverse
 
 from .sitemap_generator import Sitemap
 
@@ -26,3 +29,59 @@ def prepare_sitemaps(request, sitemaps):
         else:
             initialised_sitemaps[name] = sitemap_cls
     return initialised_sitemaps
+
+
+def get_pregenerated_sitemap(request):
+    from .pregenerated import PregeneratedSitemap
+
+    return PregeneratedSitemap(Sitemap(request).get_wagtail_site())
+
+
+def pregenerated_index(
+    request,
+    template_name="sitemap_index.xml",
+    content_type="application/xml",
+    sitemap_url_name="wagtail.contrib.sitemaps.views.pregenerated_sitemap",
+):
+    """
+    Serves the index of the sitemap of the request's site written by the
+    ``generate_sitemaps`` management command, listing its files
+    """
+    pregenerated_sitemap = get_pregenerated_sitemap(request)
+    manifest = pregenerated_sitemap.read_manifest()
+    if manifest is None:
+        raise Http404("The sitemap hasn't been generated")
+
+    sitemaps = [
+        {
+            "location": request.build_absolute_uri(
+                reverse(sitemap_url_name, kwargs={"section": chunk["number"]})
+            ),
+            "last_mod": pregenerated_sitemap.get_chunk_lastmod(chunk),
+        }
+        for chunk in manifest["chunks"]
+    ]
+
+    return TemplateResponse(
+        request, template_name, {"sitemaps": sitemaps}, content_type=content_type
+    )
+
+
+def pregenerated_sitemap(request, section):
+    """
+    Serves a gzipped file of the sitemap of the request's site written by the
+    ``generate_sitemaps`` management command
+    """
+    pregenerated_sitemap = get_pregenerated_sitemap(request)
+    try:
+        chunk = pregenerated_sitemap.get_chunk(int(section))
+    except ValueError:
+        chunk = None
+
+    if chunk is None:
+        raise Http404(f"No sitemap available for section: {section!r}")
+
+    return FileResponse(
+        pregenerated_sitemap.storage.open(chunk["name"]),
+        content_type="application/gzip",
+    )
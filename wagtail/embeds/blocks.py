@@ -3,7 +3,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from wagtail import blocks
-from wagtail.embeds.format import embed_to_frontend_html
+from wagtail.embeds.format import embed_to_frontend_html, embeds_to_frontend_html
 
 
 class EmbedValue:
@@ -20,10 +20,40 @@ class EmbedValue:
         self.max_width = max_width
         self.max_height = max_height
 
+        # Values loaded alongside this one by EmbedBlock.bulk_to_python, whose
+        # embeds are found together when the first of them is rendered
+        self.batch = None
+
     @cached_property
     def html(self):
+        if self.batch is not None:
+            self.prefetch_html(self.batch)
+            if "html" in self.__dict__:
+                return self.__dict__["html"]
         return embed_to_frontend_html(self.url, self.max_width, self.max_height)
 
+    @staticmethod
+    def prefetch_html(values):
+        """
+        Find the embed HTML for all the given values together, with one cache
+        lookup and one database query, and fetching any embeds not found
+        before concurrently.
+        """
+        values_by_size = {}
+        for value in values:
+            value.batch = None
+            if "html" not in value.__dict__:
+                values_by_size.setdefault(
+                    (value.max_width, value.max_height), []
+                ).append(value)
+
+        for (max_width, max_height), size_values in values_by_size.items():
+            html = embeds_to_frontend_html(
+                [value.url for value in size_values], max_width, max_height
+            )
+            for value in size_values:
+                value.__dict__["html"] = html[value.url]
+
     def __str__(self):
         return self.html
 
@@ -56,6 +86,16 @@ class EmbedBlock(blocks.URLBlock):
                 getattr(self.meta, "max_height", None),
             )
 
+    def bulk_to_python(self, values):
+        embed_values = [self.to_python(value) for value in values]
+
+        batch = [value for value in embed_values if value is not None]
+        if len(batch) > 1:
+            for value in batch:
+                value.batch = batch
+
+        return embed_values
+
     def get_prep_value(self, value):
         # serialisable value should be a URL string
         if value is None:
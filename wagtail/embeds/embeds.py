@@ -1,10 +1,13 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.utils.timezone import now
 
 from wagtail.coreutils import accepts_kwarg, safe_md5
 
-from .exceptions import EmbedUnsupportedProviderException
+from .exceptions import EmbedException, EmbedUnsupportedProviderException
 from .finders import get_finders
 from .models import Embed
 
@@ -26,14 +29,97 @@ def get_embed(url, max_width=None, max_height=None):
     """
     embed_hash = get_embed_hash(url, max_width, max_height)
 
+    # Check the cache
+    embed = get_embed_cache().get(get_embed_cache_key(embed_hash))
+    if embed is not None:
+        return embed
+
     # Check database
     try:
-        return Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
+        embed = Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
     except Embed.DoesNotExist:
         pass
+    else:
+        cache_embed(embed)
+        return embed
 
     embed_dict = get_finder_for_embed(url, max_width, max_height)
+    return save_embed(url, max_width, embed_hash, embed_dict)
+
+
+def get_embeds(urls, max_width=None, max_height=None):
+    """
+    Retrieve the embeds for several URLs at once, with one cache lookup and one
+    database query for those found before, and fetching the rest from their
+    providers concurrently.
+
+    Returns a dict mapping each URL to its embed. URLs that no embed could be
+    found for are left out.
+    """
+    urls_by_hash = {get_embed_hash(url, max_width, max_height): url for url in urls}
+    embeds = {}
 
+    # Check the cache
+    cache = get_embed_cache()
+    cache_keys = {
+        get_embed_cache_key(embed_hash): embed_hash for embed_hash in urls_by_hash
+    }
+    for cache_key, embed in cache.get_many(list(cache_keys)).items():
+        embeds[cache_keys[cache_key]] = embed
+
+    # Check database
+    missing_hashes = [
+        embed_hash for embed_hash in urls_by_hash if embed_hash not in embeds
+    ]
+    if missing_hashes:
+        for embed in Embed.objects.exclude(cache_until__lte=now()).filter(
+            hash__in=missing_hashes
+        ):
+            embeds[embed.hash] = embed
+            cache_embed(embed)
+
+    # Fetch the rest from their providers
+    missing_hashes = [
+        embed_hash for embed_hash in urls_by_hash if embed_hash not in embeds
+    ]
+    if missing_hashes:
+
+        def find_embed(embed_hash):
+            try:
+                return get_finder_for_embed(
+                    urls_by_hash[embed_hash], max_width, max_height
+                )
+            except EmbedException:
+                return None
+
+        max_workers = min(
+            len(missing_hashes), getattr(settings, "WAGTAILEMBEDS_FETCH_WORKERS", 8)
+        )
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                embed_dicts = list(executor.map(find_embed, missing_hashes))
+        else:
+            embed_dicts = list(map(find_embed, missing_hashes))
+
+        # Save the results from this thread, as database connections aren't
+        # shared between threads
+        for embed_hash, embed_dict in zip(missing_hashes, embed_dicts):
+            if embed_dict is not None:
+                embeds[embed_hash] = save_embed(
+                    urls_by_hash[embed_hash], max_width, embed_hash, embed_dict
+                )
+
+    return {
+        url: embeds[embed_hash]
+        for embed_hash, url in urls_by_hash.items()
+        if embed_hash in embeds
+    }
+
+
+def save_embed(url, max_width, embed_hash, embed_dict):
+    """
+    Create or update the database record for an embed returned by a finder.
+    """
     # Make sure width and height are valid integers before inserting into database
     try:
         embed_dict["width"] = int(embed_dict["width"])
@@ -53,18 +139,39 @@ def get_embed(url, max_width=None, max_height=None):
     if "thumbnail_url" not in embed_dict or not embed_dict["thumbnail_url"]:
         embed_dict["thumbnail_url"] = ""
 
-    # Create database record
+    # Create database record. last_updated is set automatically on save
     embed, created = Embed.objects.update_or_create(
         hash=embed_hash, defaults=dict(url=url, max_width=max_width, **embed_dict)
     )
-
-    # Save
-    embed.last_updated = datetime.now()
-    embed.save()
+    cache_embed(embed)
 
     return embed
 
 
+def get_embed_cache():
+    try:
+        return caches["embeds"]
+    except InvalidCacheBackendError:
+        return caches[DEFAULT_CACHE_ALIAS]
+
+
+def get_embed_cache_key(embed_hash):
+    return f"wagtail-embed-{embed_hash}"
+
+
+def cache_embed(embed):
+    """
+    Add an embed to the cache, until its ``cache_until`` time if it has one.
+    """
+    timeout = DEFAULT_TIMEOUT
+    if embed.cache_until is not None:
+        timeout = (embed.cache_until - now()).total_seconds()
+        if timeout <= 0:
+            return
+
+    get_embed_cache().set(get_embed_cache_key(embed.hash), embed, timeout)
+
+
 def get_embed_hash(url, max_width=None, max_height=None):
     h = safe_md5(url.encode("utf-8"), usedforsecurity=False)
     if max_width is not None:
@@ -9,6 +9,114 @@ from wagtail.embeds.oembed_providers import all_providers
 
 from .base import EmbedFinder
 
+# Matches provider URL patterns whose host is a literal domain, optionally
+# preceded by subdomain wildcards that can't match anything but a hostname, so
+# that the pattern only needs to be tried against URLs on that domain
+PROVIDER_DOMAIN_RE = re.compile(
+    r"^\^(?:https\?|https|http)://"
+    r"(?:\(\?:(?:\[-\\w\]\+|[-a-z0-9]+)\\\.\)\?|\[-\\w\]\+\\\.)*"
+    r"(?P<domain>(?:[-a-z0-9]+\\\.)+[-a-z0-9]+)/"
+)
+
+# Patterns using backreferences can't be combined, as their group numbers
+# would change
+BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class ProviderPatternGroup:
+    """
+    A list of ``(index, endpoint, pattern)`` tuples, matched with a single
+    regex where possible.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self.combined = None
+
+        flags = {pattern.flags for _, _, pattern in patterns}
+        if len(flags) == 1 and not any(
+            BACKREFERENCE_RE.search(pattern.pattern) for _, _, pattern in patterns
+        ):
+            try:
+                self.combined = re.compile(
+                    "|".join(
+                        f"(?P<_{index}>{pattern.pattern})"
+                        for index, _, pattern in patterns
+                    ),
+                    flags.pop(),
+                )
+            except re.error:
+                pass
+
+        self.endpoints = {index: endpoint for index, endpoint, _ in patterns}
+
+    def match(self, url):
+        """
+        Returns the ``(index, endpoint)`` of the first pattern matching ``url``,
+        or ``None``.
+        """
+        if self.combined is not None:
+            match = self.combined.match(url)
+            if match is None:
+                return None
+            # The group wrapping the matching pattern is the last to close
+            index = int(match.lastgroup[1:])
+            return index, self.endpoints[index]
+
+        for index, endpoint, pattern in self.patterns:
+            if pattern.match(url):
+                return index, endpoint
+
+
+class ProviderMatcher:
+    """
+    Finds the endpoint of the first provider with a URL pattern matching a
+    URL, as if trying each provider's patterns in turn.
+
+    Patterns are grouped by the domain they match, so only the patterns for the
+    URL's domain (and those that don't have a domain to group them by) are
+    tried, each group with a single combined regex.
+    """
+
+    def __init__(self, endpoints):
+        patterns_by_domain = {}
+        other_patterns = []
+
+        index = 0
+        for endpoint, patterns in endpoints.items():
+            for pattern in patterns:
+                match = PROVIDER_DOMAIN_RE.match(pattern.pattern)
+                if match:
+                    domain = match["domain"].replace("\\.", ".").lower()
+                    patterns_by_domain.setdefault(domain, []).append(
+                        (index, endpoint, pattern)
+                    )
+                else:
+                    other_patterns.append((index, endpoint, pattern))
+                index += 1
+
+        self.groups_by_domain = {
+            domain: ProviderPatternGroup(patterns)
+            for domain, patterns in patterns_by_domain.items()
+        }
+        self.other_group = ProviderPatternGroup(other_patterns)
+
+    def match(self, url):
+        groups = [self.other_group]
+
+        # Find the groups for the domain the URL is on, and its parent domains
+        _, separator, rest = url.partition("://")
+        if separator:
+            labels = rest.split("/", 1)[0].lower().split(".")
+            for i in range(len(labels) - 1):
+                group = self.groups_by_domain.get(".".join(labels[i:]))
+                if group is not None:
+                    groups.append(group)
+
+        matches = [match for group in groups if (match := group.match(url))]
+        if matches:
+            return min(matches)[1]
+
 
 class OEmbedFinder(EmbedFinder):
     options = {}
@@ -27,15 +135,18 @@ class OEmbedFinder(EmbedFinder):
 
             self._endpoints[endpoint] = patterns
 
+        self._matcher = ProviderMatcher(self._endpoints)
+
         if options:
             self.options = self.options.copy()
             self.options.update(options)
 
+        # Reuse connections to providers across requests, including those made
+        # concurrently by get_embeds
+        self.session = requests.Session()
+
     def _get_endpoint(self, url):
-        for endpoint, patterns in self._endpoints.items():
-            for pattern in patterns:
-                if re.match(pattern, url):
-                    return endpoint
+        return self._matcher.match(url)
 
     def accept(self, url):
         return self._get_endpoint(url) is not None
@@ -57,7 +168,7 @@ class OEmbedFinder(EmbedFinder):
 
         # Perform request
         try:
-            r = requests.get(
+            r = self.session.get(
                 endpoint, params=params, headers={"User-agent": "Mozilla/5.0"}
             )
             r.raise_for_status()
@@ -20,6 +20,27 @@ def embed_to_frontend_html(url, max_width=None, max_height=None):
         return ""
 
 
+def embeds_to_frontend_html(urls, max_width=None, max_height=None):
+    """
+    Returns a dict mapping each of the given URLs to its embed HTML, finding
+    the embeds together with ``get_embeds``.
+    """
+    found_embeds = embeds.get_embeds(urls, max_width, max_height)
+
+    # Failed embeds are silently ignored, as in embed_to_frontend_html
+    return {
+        url: render_to_string(
+            "wagtailembeds/embed_frontend.html",
+            {
+                "embed": found_embeds[url],
+            },
+        )
+        if url in found_embeds
+        else ""
+        for url in urls
+    }
+
+
 def embed_to_editor_html(url):
     embed = embeds.get_embed(url)
     # catching EmbedException is the responsibility of the caller
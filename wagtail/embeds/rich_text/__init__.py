@@ -24,3 +24,20 @@ class MediaEmbedHandler(EmbedHandler):
         representation for use on the front-end.
         """
         return format.embed_to_frontend_html(attrs["url"])
+
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list: list[dict]) -> list[str]:
+        """
+        Given a list of attribute dicts from <embed> tags, return the real HTML
+        representation of each one, finding all the embeds together.
+        """
+        if (
+            len(attrs_list) == 1
+            or cls.expand_db_attributes is not MediaEmbedHandler.expand_db_attributes
+        ):
+            # Subclasses that customise expand_db_attributes render each embed
+            # through it, rather than the batched lookup
+            return [cls.expand_db_attributes(attrs) for attrs in attrs_list]
+
+        html = format.embeds_to_frontend_html([attrs["url"] for attrs in attrs_list])
+        return [html[attrs["url"]] for attrs in attrs_list]
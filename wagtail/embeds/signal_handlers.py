@@ -1,7 +1,10 @@
 from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from .embeds import get_embed_cache, get_embed_cache_key
 from .finders import get_finders
+from .models import Embed
 
 
 @receiver(setting_changed)
@@ -11,3 +14,13 @@ def clear_embed_caches(*, setting: str, **kwargs: dict) -> None:
     """
     if setting == "WAGTAILEMBEDS_FINDERS":
         get_finders.cache_clear()
+
+
+@receiver(post_save, sender=Embed)
+@receiver(post_delete, sender=Embed)
+def purge_embed_from_cache(*, instance: Embed, **kwargs: dict) -> None:
+    """
+    Remove a changed or deleted embed from the cache, so that it isn't used in
+    place of the database record
+    """
+    get_embed_cache().delete(get_embed_cache_key(instance.hash))
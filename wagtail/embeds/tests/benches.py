@@ -0,0 +1,34 @@
+from django.test import SimpleTestCase
+
+from wagtail.embeds.finders.oembed import OEmbedFinder
+from wagtail.test.benchmark import Benchmark
+
+
+class BenchOEmbedProviderMatching(Benchmark, SimpleTestCase):
+    """
+    Matches URLs for providers throughout the default list, and URLs matching
+    none of them, against the OEmbedFinder's provider patterns.
+    """
+
+    urls = [
+        "https://animoto.com/play/abc",
+        "https://www.flickr.com/photos/foo/123",
+        "https://www.instagram.com/p/abc/",
+        "https://www.pinterest.com/pin/123/",
+        "https://poll.fm/123",
+        "https://soundcloud.com/foo/bar",
+        "https://twitter.com/foo/status/123",
+        "https://vimeo.com/217403396",
+        "https://fast.wistia.com/embed/medias/abc",
+        "https://www.youtube.com/watch?v=O7D-1RG-VRk",
+        "https://www.example.com/foo",
+        "https://docs.wagtail.org/en/latest/",
+    ]
+
+    def setUp(self):
+        self.finder = OEmbedFinder()
+
+    def bench(self):
+        for i in range(1000):
+            for url in self.urls:
+                self.finder.accept(url)
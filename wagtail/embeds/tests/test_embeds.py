@@ -1,5 +1,6 @@
 import datetime
 import json
+import re
 import unittest
 import urllib.request
 from unittest.mock import patch
@@ -7,6 +8,7 @@ from urllib.error import HTTPError, URLError
 
 import responses
 from django import template
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -16,7 +18,7 @@ from responses import matchers
 from wagtail import blocks
 from wagtail.embeds import oembed_providers
 from wagtail.embeds.blocks import EmbedBlock, EmbedValue
-from wagtail.embeds.embeds import get_embed, get_embed_hash
+from wagtail.embeds.embeds import get_embed, get_embed_hash, get_embeds
 from wagtail.embeds.exceptions import (
     EmbedNotFoundException,
     EmbedUnsupportedProviderException,
@@ -36,6 +38,7 @@ from wagtail.embeds.finders.instagram import (
 from wagtail.embeds.finders.oembed import OEmbedFinder as OEmbedFinder
 from wagtail.embeds.models import Embed
 from wagtail.embeds.templatetags.wagtailembeds_tags import embed_tag
+from wagtail.rich_text import expand_db_html
 from wagtail.test.utils import WagtailTestUtils
 
 try:
@@ -292,6 +295,109 @@ class TestEmbeds(TestCase):
             get_embed("www.test.com/1234", max_width=400)
 
 
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TestGetEmbeds(TestCase):
+    def setUp(self):
+        self.hit_urls = []
+        cache.clear()
+
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        self.hit_urls.append(url)
+        if "missing" in url:
+            raise EmbedNotFoundException
+
+        return {
+            "title": "Test: " + url,
+            "type": "video",
+            "width": max_width if max_width else 640,
+            "height": 480,
+            "html": f"<p>{url}</p>",
+        }
+
+    def get_embeds(self, urls, max_width=None):
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(self.dummy_finder)]
+            return get_embeds(urls, max_width)
+
+    def test_get_embeds(self):
+        urls = ["www.test.com/1", "www.test.com/2", "www.test.com/missing"]
+        embeds = self.get_embeds(urls, max_width=400)
+
+        self.assertEqual(list(embeds), urls[:2])
+        self.assertEqual(embeds["www.test.com/1"].html, "<p>www.test.com/1</p>")
+        self.assertEqual(embeds["www.test.com/2"].width, 400)
+        self.assertCountEqual(self.hit_urls, urls)
+        self.assertEqual(Embed.objects.count(), 2)
+
+    def test_get_embeds_uses_cache(self):
+        urls = ["www.test.com/1", "www.test.com/2"]
+        self.get_embeds(urls)
+        self.hit_urls.clear()
+
+        with self.assertNumQueries(0):
+            embeds = self.get_embeds(urls)
+
+        self.assertEqual(embeds["www.test.com/2"].html, "<p>www.test.com/2</p>")
+        self.assertEqual(self.hit_urls, [])
+
+    def test_get_embeds_uses_database_in_one_query(self):
+        urls = ["www.test.com/1", "www.test.com/2"]
+        self.get_embeds(urls)
+        self.hit_urls.clear()
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            embeds = self.get_embeds(urls)
+
+        self.assertEqual(list(embeds), urls)
+        self.assertEqual(self.hit_urls, [])
+
+    def test_get_embeds_refetches_expired(self):
+        self.get_embeds(["www.test.com/1"])
+        Embed.objects.update(cache_until=make_aware(datetime.datetime(2001, 2, 3)))
+        cache.clear()
+        self.hit_urls.clear()
+
+        self.get_embeds(["www.test.com/1"])
+        self.assertEqual(self.hit_urls, ["www.test.com/1"])
+
+    def test_saving_embed_purges_cache(self):
+        embed = self.get_embeds(["www.test.com/1"])["www.test.com/1"]
+        embed.html = "<p>Changed</p>"
+        embed.save()
+
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(self.dummy_finder)]
+            self.assertEqual(get_embed("www.test.com/1").html, "<p>Changed</p>")
+
+    def test_deleting_embed_purges_cache(self):
+        self.get_embeds(["www.test.com/1"])
+        Embed.objects.get().delete()
+        self.hit_urls.clear()
+
+        self.get_embeds(["www.test.com/1"])
+        self.assertEqual(self.hit_urls, ["www.test.com/1"])
+
+    def test_rich_text_finds_embeds_together(self):
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(self.dummy_finder)]
+            with patch(
+                "wagtail.embeds.embeds.get_embeds", wraps=get_embeds
+            ) as get_embeds_mock:
+                result = expand_db_html(
+                    '<embed embedtype="media" url="www.test.com/1" />'
+                    '<embed embedtype="media" url="www.test.com/2" />'
+                )
+
+        get_embeds_mock.assert_called_once_with(
+            ["www.test.com/1", "www.test.com/2"], None, None
+        )
+        self.assertIn("<p>www.test.com/1</p>", result)
+        self.assertIn("<p>www.test.com/2</p>", result)
+
+
 class TestEmbedHash(TestCase):
     def test_get_embed_hash(self):
         url = "www.test.com/1234"
@@ -650,6 +756,78 @@ class TestOembed(TestCase):
         finder = OEmbedFinder(providers=[oembed_providers.twitter])
         self.assertFalse(finder.accept("https://www.youtube.com/watch/"))
 
+    def test_oembed_matches_first_provider(self):
+        # The first provider with a matching pattern is used, whether or not
+        # its patterns can be grouped by domain
+        any_subdomain = {
+            "endpoint": "https://any.example.com/oembed",
+            "urls": [r"^https?://.+?\.example\.com/.+$"],
+        }
+        www_subdomain = {
+            "endpoint": "https://www.example.com/oembed",
+            "urls": [r"^https?://www\.example\.com/.+$"],
+        }
+
+        finder = OEmbedFinder(providers=[any_subdomain, www_subdomain])
+        self.assertEqual(
+            finder._get_endpoint("https://www.example.com/foo"),
+            "https://any.example.com/oembed",
+        )
+
+        finder = OEmbedFinder(providers=[www_subdomain, any_subdomain])
+        self.assertEqual(
+            finder._get_endpoint("https://www.example.com/foo"),
+            "https://www.example.com/oembed",
+        )
+        self.assertEqual(
+            finder._get_endpoint("https://foo.example.com/foo"),
+            "https://any.example.com/oembed",
+        )
+        self.assertIsNone(finder._get_endpoint("https://example.com/foo"))
+
+    def test_oembed_matches_same_providers_as_each_pattern(self):
+        finder = OEmbedFinder()
+        urls = [
+            "https://www.youtube.com/watch?v=O7D-1RG-VRk",
+            "https://youtu.be/O7D-1RG-VRk",
+            "https://YOUTUBE.com/watch?v=O7D-1RG-VRk",
+            "https://vimeo.com/217403396",
+            "https://poll.fm/123",
+            "https://fast.wistia.com/embed/medias/abc",
+            "https://www.pinterest.co.uk/pin/123/",
+            "http://demo.clikthrough.com/theater/video/1",
+            "https://www.flickr.com/photos/foo/123",
+            "https://www.example.com/foo",
+            "www.youtube.com/watch?v=O7D-1RG-VRk",
+            "foo",
+        ]
+
+        for url in urls:
+            expected = None
+            for endpoint, patterns in finder._endpoints.items():
+                if any(pattern.match(url) for pattern in patterns):
+                    expected = endpoint
+                    break
+
+            with self.subTest(url=url):
+                self.assertEqual(finder._get_endpoint(url), expected)
+
+    def test_oembed_matches_uncombinable_patterns(self):
+        finder = OEmbedFinder(
+            providers=[
+                {
+                    "endpoint": "https://www.example.com/oembed",
+                    "urls": [
+                        re.compile(r"^https?://www\.example\.com/foo/.+$", re.I),
+                        r"^https?://www\.example\.com/(\w+)/\1$",
+                    ],
+                }
+            ]
+        )
+        self.assertTrue(finder.accept("https://WWW.EXAMPLE.COM/FOO/bar"))
+        self.assertTrue(finder.accept("https://www.example.com/bar/bar"))
+        self.assertFalse(finder.accept("https://www.example.com/bar/baz"))
+
     @responses.activate
     def test_endpoint_with_format_param(self):
         responses.get(
@@ -987,6 +1165,40 @@ class TestEmbedBlock(TestCase):
         # Check that the embed was in the returned HTML
         self.assertIn("<h1>Hello world!</h1>", result)
 
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_bulk_to_python_finds_embeds_together(self):
+        cache.clear()
+        block = blocks.StreamBlock([("embed", EmbedBlock())])
+        value = block.to_python(
+            [
+                {"type": "embed", "value": "www.test.com/1"},
+                {"type": "embed", "value": "www.test.com/2"},
+            ]
+        )
+
+        def finder(url, max_width=None, max_height=None):
+            return {
+                "type": "video",
+                "width": 640,
+                "height": 480,
+                "html": f"<p>{url}</p>",
+            }
+
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(finder)]
+            with patch(
+                "wagtail.embeds.embeds.get_embeds", wraps=get_embeds
+            ) as get_embeds_mock:
+                result = value.render_as_block()
+
+        get_embeds_mock.assert_called_once_with(
+            ["www.test.com/1", "www.test.com/2"], None, None
+        )
+        self.assertIn("<p>www.test.com/1</p>", result)
+        self.assertIn("<p>www.test.com/2</p>", result)
+
     @responses.activate
     def test_render_within_structblock(self):
         """
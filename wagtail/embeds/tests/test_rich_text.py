@@ -146,6 +146,25 @@ class TestFrontendMediaEmbedHandler(TestCase):
             "https://www.youtube.com/watch?v=O7D-1RG-VRk&t=25", None, None
         )
 
+    def test_expand_db_attributes_many_uses_subclass_expand_db_attributes(self):
+        class CustomMediaEmbedHandler(FrontendMediaEmbedHandler):
+            @staticmethod
+            def expand_db_attributes(attrs):
+                return "custom " + attrs["url"]
+
+        attrs_list = [
+            {"url": "http://www.youtube.com/watch/"},
+            {"url": "http://vimeo.com/1/"},
+        ]
+        self.assertEqual(
+            CustomMediaEmbedHandler.expand_db_attributes_many(attrs_list[:1]),
+            ["custom http://www.youtube.com/watch/"],
+        )
+        self.assertEqual(
+            CustomMediaEmbedHandler.expand_db_attributes_many(attrs_list),
+            ["custom http://www.youtube.com/watch/", "custom http://vimeo.com/1/"],
+        )
+
 
 class TestEntityFeatureChooserUrls(TestCase):
     def test_chooser_urls_exist(self):
@@ -1,8 +1,6 @@
 import datetime
-import json
 
 from django.core.exceptions import ValidationError
-from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import BaseValidator, MaxLengthValidator
 from django.db import models
 from django.utils.encoding import force_str
@@ -19,6 +17,7 @@ from wagtail.rich_text import (
     extract_references_from_rich_text,
     get_text_for_indexing,
 )
+from wagtail.utils.json import CodecJSONDecoder, CodecJSONEncoder, get_json_codec
 
 
 class NoFutureDateValidator(BaseValidator):
@@ -180,7 +179,7 @@ class StreamField(models.Field):
 
     @property
     def json_field(self):
-        return models.JSONField(encoder=DjangoJSONEncoder)
+        return models.JSONField(encoder=CodecJSONEncoder, decoder=CodecJSONDecoder)
 
     def get_internal_type(self):
         return "JSONField"
@@ -288,7 +287,7 @@ class StreamField(models.Field):
         # Now that we change get_prep_value to not do the serialization in favor
         # of get_db_prep_value, we need to add the serialization here too.
         value = self.value_from_object(obj)
-        return json.dumps(self.get_prep_value(value), cls=self.json_field.encoder)
+        return get_json_codec().dumps(self.get_prep_value(value))
 
     def get_searchable_content(self, value):
         return self.stream_block.get_searchable_content(value)
@@ -17,6 +17,7 @@ from wagtail.images.fields import WagtailImageField
 from wagtail.images.formats import get_image_formats
 from wagtail.images.models import Image
 from wagtail.images.permissions import permission_policy as images_permission_policy
+from wagtail.images.warm_renditions import enqueue_warm_renditions
 from wagtail.models import Collection
 from wagtail.search import index as search_index
 
@@ -65,6 +66,10 @@ class BaseImageForm(BaseCollectionMemberForm):
                 self.original_file.storage.delete(self.original_file.name)
                 self.instance.renditions.all().delete()
 
+                # Warm renditions found the old renditions when the image was
+                # saved, so need generating again
+                enqueue_warm_renditions(self.instance)
+
             # Reindex the image to make sure all tags are indexed
             search_index.insert_or_update_object(self.instance)
 
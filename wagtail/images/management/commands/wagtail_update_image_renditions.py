@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from wagtail.images import get_image_model
+from wagtail.images.warm_renditions import get_warm_rendition_registry
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +37,17 @@ class Command(BaseCommand):
             default=50,
             help="Operate in x size chunks (default: %(default)s)",
         )
+        parser.add_argument(
+            "--warm",
+            action="store_true",
+            help="Generate any missing renditions configured in WAGTAILIMAGES_WARM_RENDITIONS for all images, instead of regenerating existing renditions",
+        )
 
     def handle(self, *args, **options):
+        if options["warm"]:
+            self.warm_renditions(options["chunk_size"])
+            return
+
         Rendition = get_image_model().get_rendition_model()
 
         renditions = Rendition.objects.all()
@@ -98,3 +108,47 @@ class Command(BaseCommand):
             )
         else:
             self.stdout.write(self.style.WARNING("Could not process any renditions."))
+
+    def warm_renditions(self, chunk_size):
+        registry = get_warm_rendition_registry()
+        if not registry:
+            self.stdout.write(self.style.WARNING("No warm renditions are configured."))
+            return
+
+        images = get_image_model().objects.select_related("collection")
+        num_images = images.count()
+        if not num_images:
+            self.stdout.write(self.style.WARNING("No images found."))
+            return
+
+        self.stdout.write(
+            self.style.HTTP_INFO(f"Warming renditions for {num_images} image(s)")
+        )
+
+        num_processed = 0
+        for progress_bar_current, image in enumerate(
+            images.iterator(chunk_size=chunk_size), start=1
+        ):
+            _progress_bar = progress_bar(progress_bar_current, num_images)
+            self.stdout.write(_progress_bar[0], ending=_progress_bar[1])
+
+            try:
+                filter_specs = registry.get_filter_specs(image)
+                if filter_specs:
+                    image.get_renditions(*filter_specs)
+            except:  # noqa:E722
+                logger.exception("Error warming renditions for image %d", image.id)
+                self.stderr.write(
+                    self.style.ERROR(f"Failed to warm renditions for image {image.id}")
+                )
+            else:
+                num_processed += 1
+
+        if num_processed:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully warmed renditions for {num_processed} image(s)"
+                )
+            )
+        else:
+            self.stdout.write(self.style.WARNING("Could not warm any renditions."))
@@ -0,0 +1,30 @@
+from django.utils.deprecation import MiddlewareMixin
+
+from wagtail.images.rendition_collector import collect_renditions
+
+
+class RenditionCollectorMiddleware(MiddlewareMixin):
+    """
+    Batches the rendition lookups made by image template tags while rendering
+    each HTML template response, so that all the renditions on a page are found
+    with one cache lookup and one database query.
+
+    Only the content of the response itself is collected. Image tags rendered
+    at any other time, such as into emails, stored HTML or other kinds of
+    response, find their renditions immediately.
+    """
+
+    def process_template_response(self, request, response):
+        if not response.get("Content-Type", "").startswith("text/html"):
+            return response
+
+        with collect_renditions() as collector:
+            response.render()
+
+        if b"wagtail-rendition:" in response.content:
+            content = response.content.decode(response.charset)
+            response.content = collector.render(content).encode(response.charset)
+            if response.has_header("Content-Length"):
+                response.headers["Content-Length"] = str(len(response.content))
+
+        return response
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import concurrent.futures
 import hashlib
 import itertools
 import logging
 import os.path
 import re
+import threading
 import time
 from collections import OrderedDict, defaultdict, namedtuple
 from collections.abc import Iterable
@@ -46,6 +46,10 @@ from wagtail.images.image_operations import (
     TransformOperation,
 )
 from wagtail.images.rect import Rect
+from wagtail.images.rendition_generators import (
+    get_rendition_generator,
+    in_flight_renditions,
+)
 from wagtail.images.utils import to_svg_safe_spec
 from wagtail.models import CollectionMember, ReferenceIndex
 from wagtail.search import index
@@ -67,6 +71,30 @@ IMAGE_FORMAT_EXTENSIONS = {
 }
 
 
+IMAGE_FORMAT_MIME_TYPES = {
+    "avif": "image/avif",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+    "ico": "image/x-icon",
+    "heic": "image/heic",
+}
+
+
+def get_mime_type_for_filename(filename):
+    """
+    Returns the MIME type for a rendition file named ``filename``, based on the
+    extension given to it by ``AbstractImage.generate_rendition_file()``, or
+    ``None`` if the extension isn't recognised.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    for image_format, format_extension in IMAGE_FORMAT_EXTENSIONS.items():
+        if extension == format_extension:
+            return IMAGE_FORMAT_MIME_TYPES[image_format]
+
+
 class SourceImageIOError(IOError):
     """
     Custom exception to distinguish IOErrors that were thrown while opening the source image
@@ -549,7 +577,12 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         try:
             rendition = self.find_existing_rendition(filter)
         except Rendition.DoesNotExist:
-            rendition = self.create_rendition(filter)
+            # Wait for the rendition if another thread is already creating it
+            rendition = in_flight_renditions.create(
+                self,
+                [filter],
+                lambda filters: {filter: self.create_rendition(filter)},
+            )[filter]
             # Reuse this rendition if requested again from this object
             self._add_to_prefetched_renditions(rendition)
 
@@ -626,7 +659,10 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         # Create any renditions not found in prefetched values, cache or database
         not_found = [f for f in filters if f not in renditions]
-        for filter, rendition in self.create_renditions(*not_found).items():
+        created = in_flight_renditions.create(
+            self, not_found, lambda filters: self.create_renditions(*filters)
+        )
+        for filter, rendition in created.items():
             self._add_to_prefetched_renditions(rendition)
             renditions[filter] = rendition
 
@@ -733,8 +769,6 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         Note: If using custom image models, an instance of the custom rendition
         model will be returned.
         """
-        Rendition = self.get_rendition_model()
-
         if not filters:
             return {}
 
@@ -745,25 +779,35 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
             filter = filters[0]
             return {filter: self.create_rendition(filter)}
 
+        generator = get_rendition_generator()
+        return self._save_generated_renditions(
+            filters, generator.generate_renditions(self, list(filters))
+        )
+
+    def _save_generated_renditions(
+        self, filters: Iterable[Filter], renditions: Iterable[AbstractRendition]
+    ) -> dict[Filter, AbstractRendition]:
+        """
+        Save the unsaved instances among ``renditions`` (as returned by a
+        rendition generator backend for the given ``filters``), and return all
+        of them as a ``dict`` keyed by the relevant ``Filter`` instance.
+        """
+        Rendition = self.get_rendition_model()
+
         return_value: dict[Filter, AbstractRendition] = {}
         filter_map: dict[str, Filter] = {f.spec: f for f in filters}
 
-        # Read file contents into memory
-        with self.open_file() as file:
-            original_image_bytes = file.read()
-
+        # Some backends save the renditions themselves, so only unsaved ones
+        # need creating here
         to_create = []
+        for rendition in renditions:
+            if rendition.pk is None:
+                to_create.append(rendition)
+            else:
+                return_value[filter_map[rendition.filter_spec]] = rendition
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            for future in concurrent.futures.as_completed(
-                executor.submit(
-                    self.generate_rendition_instance,
-                    filter,
-                    BytesIO(original_image_bytes),
-                )
-                for filter in filters
-            ):
-                to_create.append(future.result())
+        if not to_create:
+            return return_value
 
         # Rendition generation can take a while. So, if other processes have created
         # identical renditions in the meantime, we should find them to avoid clashes.
@@ -794,6 +838,11 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
                     # Mark for deletion later, so as not to hold up creation
                     files_for_deletion.append(new.file)
 
+        for new in to_create:
+            # bulk_create() doesn't call save(), so set the MIME type here
+            if not new.mime_type:
+                new.mime_type = get_mime_type_for_filename(new.file.name) or ""
+
         for new in Rendition.objects.bulk_create(to_create, ignore_conflicts=True):
             filter = filter_map[new.filter_spec]
             return_value[filter] = new
@@ -805,23 +854,43 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         return return_value
 
     def generate_rendition_instance(
-        self, filter: Filter, source: BytesIO
+        self, filter: Filter, source: BytesIO, *, decoded: DecodedImage = None
     ) -> AbstractRendition:
         """
         Use the supplied ``source`` image to create and return an
         **unsaved** ``Rendition`` instance, with a ``file`` value reflecting
         the supplied ``filter`` value and focal point values from this object.
+
+        If ``decoded`` is given (see ``decode_rendition_source()``), the
+        rendition is generated from that instead of decoding ``source`` again.
         """
         return self.get_rendition_model()(
             image=self,
             filter_spec=filter.spec,
             focal_point_key=filter.get_cache_key(self),
             file=self.generate_rendition_file(
-                filter, source=File(source, name=self.file.name)
+                filter, source=File(source, name=self.file.name), decoded=decoded
             ),
         )
 
-    def generate_rendition_file(self, filter: Filter, *, source: File = None) -> File:
+    def decode_rendition_source(
+        self, source: BytesIO, *, cascade: bool = False, memory_budget: int = None
+    ) -> DecodedImage:
+        """
+        Decode and orient the supplied ``source`` image, returning a
+        ``DecodedImage`` that can be passed to ``generate_rendition_instance()``
+        or ``generate_rendition_file()`` for each of several filters, so that
+        the original only needs to be decoded once.
+        """
+        return DecodedImage.open(
+            File(source, name=self.file.name),
+            cascade=cascade,
+            memory_budget=memory_budget,
+        )
+
+    def generate_rendition_file(
+        self, filter: Filter, *, source: File = None, decoded: DecodedImage = None
+    ) -> File:
         """
         Generates an in-memory image matching the supplied ``filter`` value
         and focal point value from this object, wraps it in a ``File`` object
@@ -832,6 +901,9 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         If the contents of ``self.file`` has already been read into memory, the
         ``source`` keyword can be used to provide a reference to the in-memory
         ``File``, bypassing the need to reload the image contents from storage.
+        If it has already been decoded, the ``decoded`` keyword can be used to
+        provide the ``DecodedImage`` instead, bypassing the need to decode it
+        again.
 
         NOTE: The responsibility of generating the new image from the original
         falls to the supplied ``filter`` object. If you want to do anything
@@ -851,11 +923,11 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         start_time = time.time()
 
         try:
-            generated_image = filter.run(
-                self,
-                SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE),
-                source=source,
-            )
+            output = SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+            if decoded is not None:
+                generated_image = filter.run(self, output, decoded=decoded)
+            else:
+                generated_image = filter.run(self, output, source=source)
 
             logger.debug(
                 "Generated '%s' rendition for image %d in %.1fms",
@@ -942,6 +1014,103 @@ class Image(AbstractImage):
         ]
 
 
+class DecodedImage:
+    """
+    An original image that has been decoded and oriented once, so that several
+    renditions can be generated from it without decoding it again for each.
+
+    If ``cascade`` is enabled, the downscaled copies of the whole image that
+    are made while generating renditions are kept, and smaller renditions are
+    generated from the smallest copy that is still large enough rather than
+    from the full-size original. The memory used by these copies is limited to
+    ``memory_budget`` bytes (if given); copies that would exceed it are not
+    kept.
+    """
+
+    def __init__(
+        self, willow_image, original_format, *, cascade=False, memory_budget=None
+    ):
+        self.willow_image = willow_image
+        self.original_format = original_format
+        self.size = (willow_image.image.width, willow_image.image.height)
+
+        # Cascading from a resized copy doesn't apply to vector images, and
+        # would lose frames from animated images
+        self.cascade = (
+            cascade and original_format != "svg" and not willow_image.has_animation()
+        )
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+
+        # Downscaled copies of the whole image, ordered from smallest to largest
+        self._intermediates = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, source: File, **kwargs):
+        willow_image = willow.Image.open(source)
+        original_format = willow_image.format_name
+
+        # Fix orientation of image
+        return cls(willow_image.auto_orient(), original_format, **kwargs)
+
+    @staticmethod
+    def estimate_memory(size):
+        # Assume four bytes per pixel (RGBA), the most a Pillow image will use
+        return size[0] * size[1] * 4
+
+    def get_source(self, rect: Rect, size: tuple) -> tuple:
+        """
+        Returns a ``(willow_image, rect)`` pair for the image to crop to
+        ``rect`` (in the coordinates of the decoded original) and resize to
+        ``size``, with the rect scaled to the returned image.
+        """
+        with self._lock:
+            intermediates = list(self._intermediates)
+
+        for intermediate in intermediates:
+            width, height = intermediate.image.width, intermediate.image.height
+            scale_x = width / self.size[0]
+            scale_y = height / self.size[1]
+
+            # Only use a copy that would still need downscaling, so that no
+            # detail is lost compared to using the original
+            if rect.width * scale_x >= size[0] and rect.height * scale_y >= size[1]:
+                return intermediate, Rect(
+                    rect.left * scale_x,
+                    rect.top * scale_y,
+                    rect.right * scale_x,
+                    rect.bottom * scale_y,
+                ).round()
+
+        return self.willow_image, rect
+
+    def add_intermediate(self, willow_image, rect: Rect):
+        """
+        Keep ``willow_image``, generated by resizing the crop ``rect`` of the
+        decoded original, as a source for smaller renditions if it is a copy
+        of the whole image.
+        """
+        if not self.cascade or tuple(rect) != (0, 0, *self.size):
+            return
+
+        width, height = willow_image.image.width, willow_image.image.height
+        if width >= self.size[0] and height >= self.size[1]:
+            return
+
+        memory = self.estimate_memory((width, height))
+        with self._lock:
+            if (
+                self.memory_budget is not None
+                and self.memory_used + memory > self.memory_budget
+            ):
+                return
+
+            self.memory_used += memory
+            self._intermediates.append(willow_image)
+            self._intermediates.sort(key=lambda intermediate: intermediate.image.width)
+
+
 class Filter:
     """
     Represents one or more operations that can be applied to an Image to produce a rendition
@@ -1051,117 +1220,129 @@ class Filter:
             with image.get_willow_image() as willow_image:
                 yield willow_image
 
-    def run(self, image: AbstractImage, output: BytesIO, source: File = None):
+    def run(
+        self,
+        image: AbstractImage,
+        output: BytesIO,
+        source: File = None,
+        decoded: DecodedImage = None,
+    ):
+        if decoded is not None:
+            return self.run_decoded(image, output, decoded)
+
         with self.get_willow_image(image, source) as willow:
             original_format = willow.format_name
 
             # Fix orientation of image
-            willow = willow.auto_orient()
-
-            # Transform the image
-            transform = self.get_transform(
-                image, (willow.image.width, willow.image.height)
-            )
-            willow = willow.crop(transform.get_rect().round())
-            willow = willow.resize(transform.size)
+            decoded = DecodedImage(willow.auto_orient(), original_format)
+            return self.run_decoded(image, output, decoded)
+
+    def run_decoded(self, image: AbstractImage, output: BytesIO, decoded: DecodedImage):
+        original_format = decoded.original_format
+
+        # Transform the image
+        transform = self.get_transform(image, decoded.size)
+        rect = transform.get_rect().round()
+        willow, source_rect = decoded.get_source(rect, transform.size)
+        willow = willow.crop(source_rect)
+        willow = willow.resize(transform.size)
+        decoded.add_intermediate(willow, rect)
+
+        # Apply filters
+        env = {
+            "original-format": original_format,
+        }
+        for operation in self.filter_operations:
+            willow = operation.run(willow, image, env) or willow
 
-            # Apply filters
-            env = {
-                "original-format": original_format,
+        # Find the output format to use
+        if "output-format" in env:
+            # Developer specified an output format
+            output_format = env["output-format"]
+        else:
+            # Convert avif, bmp and webp to png, and heic to jpg, by default
+            default_conversions = {
+                "avif": "png",
+                "bmp": "png",
+                "webp": "png",
+                "heic": "jpeg",
             }
-            for operation in self.filter_operations:
-                willow = operation.run(willow, image, env) or willow
 
-            # Find the output format to use
-            if "output-format" in env:
-                # Developer specified an output format
-                output_format = env["output-format"]
-            else:
-                # Convert avif, bmp and webp to png, and heic to jpg, by default
-                default_conversions = {
-                    "avif": "png",
-                    "bmp": "png",
-                    "webp": "png",
-                    "heic": "jpeg",
-                }
-
-                # Convert unanimated GIFs to PNG as well
-                if not willow.has_animation():
-                    default_conversions["gif"] = "png"
-
-                # Allow the user to override the conversions
-                conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
-                default_conversions.update(conversion)
-
-                # Get the converted output format falling back to the original
-                output_format = default_conversions.get(
-                    original_format, original_format
-                )
+            # Convert unanimated GIFs to PNG as well
+            if not willow.has_animation():
+                default_conversions["gif"] = "png"
 
-            if output_format == "jpeg":
-                # Allow changing of JPEG compression quality
-                if "jpeg-quality" in env:
-                    quality = env["jpeg-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
+            # Allow the user to override the conversions
+            conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
+            default_conversions.update(conversion)
 
-                # If the image has an alpha channel, give it a white background
-                if willow.has_alpha():
-                    willow = willow.set_background_color_rgb((255, 255, 255))
+            # Get the converted output format falling back to the original
+            output_format = default_conversions.get(original_format, original_format)
 
-                return willow.save_as_jpeg(
-                    output, quality=quality, progressive=True, optimize=True
-                )
-            elif output_format == "png":
-                return willow.save_as_png(output, optimize=True)
-            elif output_format == "gif":
-                return willow.save_as_gif(output)
-            elif output_format == "webp":
-                # Allow changing of WebP compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_webp(output, lossless=True)
-                elif "webp-quality" in env:
-                    quality = env["webp-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+        if output_format == "jpeg":
+            # Allow changing of JPEG compression quality
+            if "jpeg-quality" in env:
+                quality = env["jpeg-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
 
-                return willow.save_as_webp(output, quality=quality)
-            elif output_format == "avif":
-                # Allow changing of AVIF compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_avif(output, lossless=True)
-                elif "avif-quality" in env:
-                    quality = env["avif-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
-                return willow.save_as_avif(output, quality=quality)
-            elif output_format == "heic":
-                # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
-                # so there is little value in outputting it - for that reason, we make it work if someone
-                # explicitly requests it, but these settings are not documented.
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_heic(output, lossless=True)
-                elif "heic-quality" in env:
-                    quality = env["heic-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
-                return willow.save_as_heic(output, quality=quality)
-            elif output_format == "svg":
-                return willow.save_as_svg(output)
-            elif output_format == "ico":
-                return willow.save_as_ico(output)
-            raise UnknownOutputImageFormatError(
-                f"Unknown output image format '{output_format}'"
+            # If the image has an alpha channel, give it a white background
+            if willow.has_alpha():
+                willow = willow.set_background_color_rgb((255, 255, 255))
+
+            return willow.save_as_jpeg(
+                output, quality=quality, progressive=True, optimize=True
             )
+        elif output_format == "png":
+            return willow.save_as_png(output, optimize=True)
+        elif output_format == "gif":
+            return willow.save_as_gif(output)
+        elif output_format == "webp":
+            # Allow changing of WebP compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_webp(output, lossless=True)
+            elif "webp-quality" in env:
+                quality = env["webp-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+
+            return willow.save_as_webp(output, quality=quality)
+        elif output_format == "avif":
+            # Allow changing of AVIF compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_avif(output, lossless=True)
+            elif "avif-quality" in env:
+                quality = env["avif-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
+            return willow.save_as_avif(output, quality=quality)
+        elif output_format == "heic":
+            # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
+            # so there is little value in outputting it - for that reason, we make it work if someone
+            # explicitly requests it, but these settings are not documented.
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_heic(output, lossless=True)
+            elif "heic-quality" in env:
+                quality = env["heic-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
+            return willow.save_as_heic(output, quality=quality)
+        elif output_format == "svg":
+            return willow.save_as_svg(output)
+        elif output_format == "ico":
+            return willow.save_as_ico(output)
+        raise UnknownOutputImageFormatError(
+            f"Unknown output image format '{output_format}'"
+        )
 
     def get_cache_key(self, image):
         vary_parts = []
@@ -1326,6 +1507,7 @@ class AbstractRendition(ImageFileMixin, models.Model):
     focal_point_key = models.CharField(
         max_length=16, blank=True, default="", editable=False
     )
+    mime_type = models.CharField(max_length=255, blank=True, default="", editable=False)
 
     wagtail_reference_index_ignore = True
 
@@ -1379,6 +1561,19 @@ class AbstractRendition(ImageFileMixin, models.Model):
     def filter(self):
         return Filter(self.filter_spec)
 
+    def get_mime_type(self):
+        """
+        Returns the MIME type of the rendition's file without opening it. For
+        renditions created before the MIME type was stored, this is worked out
+        from the file's extension, and may be ``None``.
+        """
+        return self.mime_type or get_mime_type_for_filename(self.file.name)
+
+    def save(self, *args, **kwargs):
+        if not self.mime_type:
+            self.mime_type = get_mime_type_for_filename(self.file.name) or ""
+        super().save(*args, **kwargs)
+
     @cached_property
     def focal_point(self):
         image_focal_point = self.image.get_focal_point()
@@ -0,0 +1,365 @@
+"""
+Batching of the rendition lookups made by image template tags while a
+template is rendered.
+
+While a ``RenditionCollector`` is active, the ``{% image %}``,
+``{% srcset_image %}`` and ``{% picture %}`` tags output a placeholder rather
+than looking up their renditions immediately. ``RenditionCollector.render()``
+then finds the renditions for all the placeholders in the rendered content with
+one cache lookup and one database query, and replaces each placeholder with the
+HTML the tag would have output.
+
+Image tags whose output is captured by an enclosing tag rather than written
+straight to the response, such as within ``{% cache %}`` or ``{% filter %}``,
+are rendered immediately, so that placeholders aren't cached or altered.
+
+Placeholders carry a signed description of the tag, so that placeholders from
+other collectors can be resolved too, without trusting placeholders that are
+part of other content.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sys
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
+from functools import lru_cache
+
+from django.apps import apps
+from django.core import signing
+from django.db.models import Q
+from django.template.base import Node, VariableNode
+from django.utils.html import escape as escape_html
+from django.utils.safestring import mark_safe
+
+logger = logging.getLogger("wagtail.images")
+
+_active_collector: ContextVar[RenditionCollector | None] = ContextVar(
+    "wagtail_rendition_collector", default=None
+)
+
+
+class PayloadSerializer(signing.JSONSerializer):
+    def dumps(self, obj):
+        # Attribute values may be lazy strings or other objects rendered as text
+        return json.dumps(obj, separators=(",", ":"), default=str).encode("latin-1")
+
+
+class RenditionCollector:
+    # Placeholders are also found once HTML escaped, for example by the
+    # "escape" filter, so that they can be replaced with escaped HTML
+    placeholder_re = re.compile(
+        r"(?P<open><!--|&lt;!--)wagtail-rendition:(?P<token>[0-9a-f]+):(?P<index>\d+):"
+        r"(?P<payload>[A-Za-z0-9_:-]*)--(?:>|&gt;)"
+    )
+
+    signer = signing.Signer(salt="wagtail.images.rendition_collector")
+
+    def __init__(self):
+        # Distinguishes this collector's placeholders from any rendered by
+        # others, for example in fragments cached by the {% cache %} tag
+        self.token = uuid.uuid4().hex
+        self.entries = []
+
+    def add(self, node_class, image, filter_specs, attrs) -> str:
+        """
+        Record that the image tag ``node_class`` is to be rendered for
+        ``image``, and return the placeholder to output in its place.
+        """
+        # Check the filter specs now, so that errors are raised while rendering
+        # the template as they would be without the collector
+        for filter in node_class.get_filters_for_specs(filter_specs):
+            image.clean_filter_for_svg(filter)
+
+        index = len(self.entries)
+        self.entries.append((node_class, image, filter_specs, attrs))
+
+        # Include everything needed to render the tag, in case this placeholder
+        # is resolved by another collector
+        payload = {
+            "tag": node_class.tag_name,
+            "model": image._meta.label_lower,
+            "pk": image.pk,
+            "filter_specs": filter_specs,
+            "attrs": attrs,
+        }
+        signed_payload = self.signer.sign_object(payload, serializer=PayloadSerializer)
+        return mark_safe(
+            f"<!--wagtail-rendition:{self.token}:{index}:{signed_payload}-->"
+        )
+
+    def load_payload(self, signed_payload):
+        """
+        Returns the description of the image tag in a placeholder from another
+        collector, with its image model, or ``None`` if it wasn't output by an
+        image tag of this site.
+        """
+        from wagtail.images.models import AbstractImage
+        from wagtail.images.templatetags.wagtailimages_tags import IMAGE_NODES
+
+        try:
+            payload = self.signer.unsign_object(
+                signed_payload, serializer=PayloadSerializer
+            )
+            model = apps.get_model(payload["model"])
+        except (signing.BadSignature, LookupError, ValueError, KeyError):
+            # Models may be removed after placeholders for them were cached
+            return None
+
+        if not issubclass(model, AbstractImage) or payload["tag"] not in IMAGE_NODES:
+            return None
+
+        return payload, model
+
+    def get_placeholder_key(self, match):
+        # The same key for a placeholder whether or not it was escaped
+        return (match["token"], match["index"], match["payload"])
+
+    def get_entries(self, matches) -> dict[tuple, tuple]:
+        from wagtail.images.templatetags.wagtailimages_tags import IMAGE_NODES
+
+        entries = {}
+        foreign = {}
+        for match in matches:
+            key = self.get_placeholder_key(match)
+            if key in entries or key in foreign:
+                continue
+
+            if match["token"] == self.token:
+                index = int(match["index"])
+                if index < len(self.entries):
+                    entries[key] = self.entries[index]
+            else:
+                loaded = self.load_payload(match["payload"])
+                if loaded is not None:
+                    foreign[key] = loaded
+
+        if foreign:
+            # Fetch the images for placeholders from other collectors, with one
+            # query per image model
+            pks_by_model = defaultdict(set)
+            for payload, model in foreign.values():
+                pks_by_model[model].add(payload["pk"])
+            images = {
+                (model, pk): image
+                for model, pks in pks_by_model.items()
+                for pk, image in model.objects.in_bulk(list(pks)).items()
+            }
+
+            for key, (payload, model) in foreign.items():
+                image = images.get((model, payload["pk"]))
+                if image is not None:
+                    entries[key] = (
+                        IMAGE_NODES[payload["tag"]],
+                        image,
+                        payload["filter_specs"],
+                        payload["attrs"],
+                    )
+
+        return entries
+
+    def prefetch_renditions(self, entries) -> list:
+        """
+        Find the existing renditions needed by ``entries`` in the cache, or
+        failing that the database, and add them to the images' prefetched
+        renditions. Returns the images that renditions were added to.
+        """
+        filters_by_image = {}
+        for node_class, image, filter_specs, attrs in entries:
+            if image._get_prefetched_renditions() is not None:
+                # The renditions were already prefetched, for example by
+                # ImageQuerySet.prefetch_renditions()
+                continue
+
+            _, filters = filters_by_image.setdefault(id(image), (image, {}))
+            for filter in node_class.get_filters_for_specs(filter_specs):
+                filter = image.clean_filter_for_svg(filter)
+                filters[filter.spec] = filter
+
+        lookups_by_model = defaultdict(dict)
+        for image, filters in filters_by_image.values():
+            Rendition = image.get_rendition_model()
+            for filter in filters.values():
+                focal_point_key = filter.get_cache_key(image)
+                cache_key = Rendition.construct_cache_key(
+                    image, focal_point_key, filter.spec
+                )
+                lookups_by_model[Rendition].setdefault(cache_key, []).append(
+                    (image, filter.spec, focal_point_key)
+                )
+
+        found = defaultdict(list)
+        for Rendition, lookups in lookups_by_model.items():
+            # Query the cache first
+            for cache_key, rendition in Rendition.cache_backend.get_many(
+                list(lookups)
+            ).items():
+                for image, _, _ in lookups.pop(cache_key):
+                    image_rendition = copy(rendition)
+                    image_rendition.image = image
+                    found[id(image)].append(image_rendition)
+
+            if not lookups:
+                continue
+
+            # Then look for the rest in the database, all in one query
+            lookup_q = Q()
+            for image_lookups in lookups.values():
+                image, filter_spec, focal_point_key = image_lookups[0]
+                lookup_q |= Q(
+                    image_id=image.pk,
+                    filter_spec=filter_spec,
+                    focal_point_key=focal_point_key,
+                )
+
+            cache_keys = {
+                (image.pk, filter_spec, focal_point_key): cache_key
+                for cache_key, image_lookups in lookups.items()
+                for image, filter_spec, focal_point_key in image_lookups
+            }
+            cache_additions = {}
+            for rendition in Rendition.objects.filter(lookup_q):
+                cache_key = cache_keys[
+                    (
+                        rendition.image_id,
+                        rendition.filter_spec,
+                        rendition.focal_point_key,
+                    )
+                ]
+                for image, _, _ in lookups[cache_key]:
+                    image_rendition = copy(rendition)
+                    image_rendition.image = image
+                    found[id(image)].append(image_rendition)
+                cache_additions[cache_key] = rendition
+
+            if cache_additions:
+                Rendition.cache_backend.set_many(cache_additions)
+
+        for image, _ in filters_by_image.values():
+            image.prefetched_renditions = found[id(image)]
+
+        return [image for image, _ in filters_by_image.values()]
+
+    def render(self, content: str, escape=None) -> str:
+        """
+        Replace the placeholders in ``content`` with the HTML for the image
+        tags they represent, passed through the ``escape`` function if given.
+        """
+        matches = list(self.placeholder_re.finditer(content))
+        if not matches:
+            return content
+
+        entries = self.get_entries(matches)
+        prefetched_images = self.prefetch_renditions(entries.values())
+        html = {}
+        try:
+            for key, entry in entries.items():
+                node_class, image, filter_specs, attrs = entry
+                html[key] = node_class.render_image(
+                    image, node_class.get_filters_for_specs(filter_specs), attrs
+                )
+        finally:
+            for image in prefetched_images:
+                del image.prefetched_renditions
+
+        if escape is not None:
+            html = {key: escape(value) for key, value in html.items()}
+
+        def replace(match):
+            key = self.get_placeholder_key(match)
+            if key not in html:
+                # For example, if the image has been deleted or the placeholder
+                # was signed with another secret key
+                logger.warning(
+                    "Removing an image placeholder that couldn't be resolved: %s",
+                    match[0],
+                )
+                return ""
+
+            value = html[key]
+            if match["open"] != "<!--":
+                value = escape_html(value)
+            return value
+
+        return self.placeholder_re.sub(replace, content)
+
+
+def get_rendition_collector() -> RenditionCollector | None:
+    """
+    Returns the active ``RenditionCollector``, if any.
+    """
+    return _active_collector.get()
+
+
+@lru_cache(maxsize=None)
+def get_pass_through_node_classes() -> tuple:
+    """
+    Returns the template node classes that write the output of the nodes they
+    contain to their own output unchanged.
+    """
+    from django.template.defaulttags import (
+        AutoEscapeControlNode,
+        ForNode,
+        IfNode,
+        WithNode,
+    )
+    from django.template.library import InclusionNode
+    from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+
+    from wagtail.images.templatetags.wagtailimages_tags import IMAGE_NODES
+    from wagtail.templatetags.wagtailcore_tags import IncludeBlockNode
+
+    return (
+        AutoEscapeControlNode,
+        BlockNode,
+        ExtendsNode,
+        ForNode,
+        IfNode,
+        IncludeBlockNode,
+        IncludeNode,
+        InclusionNode,
+        WithNode,
+        *IMAGE_NODES.values(),
+    )
+
+
+def is_output_captured() -> bool:
+    """
+    Returns whether the template node being rendered is within another node
+    that captures its output rather than writing it out unchanged, such as
+    ``{% cache %}``, ``{% filter %}`` or a custom tag.
+    """
+    pass_through_node_classes = get_pass_through_node_classes()
+    frame = sys._getframe(1)
+    while frame is not None:
+        node = frame.f_locals.get("self")
+        if frame.f_code.co_name == "render" and isinstance(node, Node):
+            if isinstance(node, VariableNode):
+                # Filters may change the variable's output
+                if node.filter_expression.filters:
+                    return True
+            elif not isinstance(node, pass_through_node_classes):
+                return True
+        frame = frame.f_back
+    return False
+
+
+@contextmanager
+def collect_renditions():
+    """
+    Activate a ``RenditionCollector`` for the duration of the block. The
+    content rendered within it must be passed to the collector's ``render()``
+    method to replace the placeholders output by image tags.
+    """
+    collector = RenditionCollector()
+    reset_token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(reset_token)
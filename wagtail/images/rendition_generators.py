@@ -0,0 +1,476 @@
+"""
+Backends for generating rendition image files when several renditions of an
+image are created at once, configured through the
+``WAGTAILIMAGES_RENDITION_GENERATOR`` setting.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import concurrent.futures.process
+import copy
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from wagtail.images.models import (
+        AbstractImage,
+        AbstractRendition,
+        DecodedImage,
+        Filter,
+    )
+
+logger = logging.getLogger("wagtail.images")
+
+
+DEFAULT_RENDITION_GENERATOR = {
+    "BACKEND": "wagtail.images.rendition_generators.ThreadPoolRenditionGenerator",
+}
+
+DEFAULT_CASCADE_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+class BaseRenditionGenerator:
+    """
+    Generates the renditions for a batch of filters applied to a single image.
+
+    ``generate_renditions`` returns a list of ``Rendition`` instances. These may
+    be unsaved instances with an in-memory ``file`` (which the caller is
+    responsible for saving), or instances that have already been saved to the
+    database by the generator.
+
+    Unless ``decode_once`` is disabled, the original image is decoded once and
+    shared by all the renditions in the batch. If ``cascade`` is enabled,
+    smaller renditions are generated from the larger ones made before them
+    (see ``DecodedImage``), keeping at most ``memory_budget`` bytes of these
+    intermediate images.
+    """
+
+    def __init__(
+        self,
+        decode_once=True,
+        cascade=False,
+        memory_budget=DEFAULT_CASCADE_MEMORY_BUDGET,
+        **options,
+    ):
+        self.decode_once = decode_once
+        self.cascade = cascade
+        self.memory_budget = memory_budget
+
+    @property
+    def decode_options(self) -> dict:
+        return {
+            "decode_once": self.decode_once,
+            "cascade": self.cascade,
+            "memory_budget": self.memory_budget,
+        }
+
+    def read_original(self, image: AbstractImage) -> bytes:
+        with image.open_file() as file:
+            return file.read()
+
+    def decode_original(
+        self, image: AbstractImage, original_image_bytes: bytes
+    ) -> DecodedImage | None:
+        """
+        Returns the decoded original image to generate all the renditions from,
+        or ``None`` if each rendition should decode the original itself.
+        """
+        if not self.decode_once:
+            return None
+
+        return image.decode_rendition_source(
+            BytesIO(original_image_bytes),
+            cascade=self.cascade,
+            memory_budget=self.memory_budget,
+        )
+
+    def sort_filters(self, image: AbstractImage, filters: list[Filter]) -> list:
+        """
+        Returns ``filters`` in the order their renditions should be generated.
+        When cascading, that is from largest to smallest so that each rendition
+        can be generated from a larger one.
+        """
+        if not self.cascade:
+            return list(filters)
+
+        def get_area(filter):
+            width, height = filter.get_transform(image).size
+            return width * height
+
+        return sorted(filters, key=get_area, reverse=True)
+
+    def generate_rendition_instances(
+        self, image: AbstractImage, filters: list[Filter], original_image_bytes: bytes
+    ) -> list[AbstractRendition]:
+        """
+        Generate unsaved renditions for ``filters`` one after another in the
+        current thread.
+        """
+        decoded = self.decode_original(image, original_image_bytes)
+        return [
+            image.generate_rendition_instance(
+                filter, BytesIO(original_image_bytes), decoded=decoded
+            )
+            for filter in self.sort_filters(image, filters)
+        ]
+
+    def generate_renditions(
+        self, image: AbstractImage, filters: list[Filter]
+    ) -> list[AbstractRendition]:
+        raise NotImplementedError
+
+
+class SequentialRenditionGenerator(BaseRenditionGenerator):
+    """
+    Generates renditions one after another in the current thread.
+    """
+
+    def generate_renditions(self, image, filters):
+        return self.generate_rendition_instances(
+            image, filters, self.read_original(image)
+        )
+
+
+class ThreadPoolRenditionGenerator(BaseRenditionGenerator):
+    """
+    Generates renditions on a pool of threads shared by all requests in the
+    current process, so that the number of renditions being generated at once
+    is bounded by ``max_workers`` however many requests need them.
+    """
+
+    def __init__(self, max_workers=3, **options):
+        super().__init__(**options)
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="wagtail-renditions",
+                )
+            return self._executor
+
+    def generate_renditions(self, image, filters):
+        original_image_bytes = self.read_original(image)
+        decoded = self.decode_original(image, original_image_bytes)
+        futures = [
+            self.executor.submit(
+                image.generate_rendition_instance,
+                filter,
+                BytesIO(original_image_bytes),
+                decoded=decoded,
+            )
+            for filter in self.sort_filters(image, filters)
+        ]
+        return [future.result() for future in futures]
+
+
+def _init_process_worker():
+    import django
+    from django.apps import apps
+
+    # Processes that are spawned (rather than forked) start without Django set up
+    if not apps.ready:
+        django.setup()
+
+
+def _generate_rendition_files(image, filters, original_image_bytes, decode_options):
+    """
+    Generate the rendition files for ``filters`` in a worker process, returning
+    a ``(filter_spec, focal_point_key, filename, content)`` tuple for each.
+    """
+    results = []
+    generator = SequentialRenditionGenerator(**decode_options)
+    for rendition in generator.generate_rendition_instances(
+        image, filters, original_image_bytes
+    ):
+        rendition.file.seek(0)
+        results.append(
+            (
+                rendition.filter_spec,
+                rendition.focal_point_key,
+                rendition.file.name,
+                rendition.file.read(),
+            )
+        )
+    return results
+
+
+class ProcessPoolRenditionGenerator(BaseRenditionGenerator):
+    """
+    Generates renditions on a pool of ``max_workers`` processes (default: the
+    number of CPUs), so that CPU-bound decoding, resizing and encoding isn't
+    limited by the GIL.
+
+    The filters for an image are split between the workers, and each worker is
+    sent the original image once and returns the encoded files for all the
+    filters it was given.
+
+    ``mp_context`` can be set to the name of a ``multiprocessing`` start method
+    (``"spawn"``, ``"fork"`` or ``"forkserver"``) to use instead of the default.
+
+    Daemonic processes (such as the workers of another process pool) can't
+    start child processes, so in those the renditions are generated one after
+    another in the current process instead.
+    """
+
+    def __init__(self, max_workers=None, mp_context=None, **options):
+        super().__init__(**options)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=(
+                        multiprocessing.get_context(self.mp_context)
+                        if self.mp_context
+                        else None
+                    ),
+                    initializer=_init_process_worker,
+                )
+            return self._executor
+
+    def reset_executor(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_worker_image(self, image: AbstractImage) -> AbstractImage:
+        """
+        Return a copy of ``image`` to send to the worker processes, without any
+        related or prefetched objects that would need pickling along with it.
+        """
+        return type(image)(
+            **{
+                field.attname: getattr(image, field.attname)
+                for field in image._meta.concrete_fields
+            }
+        )
+
+    def generate_renditions(self, image, filters):
+        if multiprocessing.current_process().daemon:
+            return SequentialRenditionGenerator(
+                **self.decode_options
+            ).generate_renditions(image, filters)
+
+        Rendition = image.get_rendition_model()
+        original_image_bytes = self.read_original(image)
+        worker_image = self.get_worker_image(image)
+
+        num_chunks = min(len(filters), self.max_workers)
+        try:
+            futures = [
+                self.executor.submit(
+                    _generate_rendition_files,
+                    worker_image,
+                    filters[i::num_chunks],
+                    original_image_bytes,
+                    self.decode_options,
+                )
+                for i in range(num_chunks)
+            ]
+            results = [future.result() for future in futures]
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died, so start a new pool for subsequent renditions
+            self.reset_executor()
+            raise
+
+        return [
+            Rendition(
+                image=image,
+                filter_spec=filter_spec,
+                focal_point_key=focal_point_key,
+                file=ContentFile(content, name=filename),
+            )
+            for result in results
+            for filter_spec, focal_point_key, filename, content in result
+        ]
+
+
+class TaskRenditionGenerator(BaseRenditionGenerator):
+    """
+    Generates renditions in a ``django_tasks`` worker, so that the request
+    handling process doesn't have to read or decode the original image.
+
+    The current thread waits up to ``timeout`` seconds for the task to finish.
+    Any renditions that are still missing after that (for example, because no
+    worker picked up the task in time) are generated in the current process
+    using the ``local_generator`` backend.
+    """
+
+    def __init__(
+        self,
+        timeout=30,
+        poll_interval=0.1,
+        local_generator=DEFAULT_RENDITION_GENERATOR,
+        **options,
+    ):
+        super().__init__(**options)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.local_generator = build_rendition_generator(local_generator)
+
+    def wait_for_result(self, result):
+        deadline = time.monotonic() + self.timeout
+        while not result.is_finished and time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            try:
+                result.refresh()
+            except NotImplementedError:
+                # The task backend can't report on the task's progress
+                return
+
+    def generate_renditions(self, image, filters):
+        from wagtail.images.tasks import generate_renditions_task
+
+        result = generate_renditions_task.enqueue(
+            image._meta.app_label,
+            image._meta.model_name,
+            str(image.pk),
+            [filter.spec for filter in filters],
+        )
+        self.wait_for_result(result)
+
+        lookup_q = Q()
+        for filter in filters:
+            lookup_q |= Q(
+                filter_spec=filter.spec, focal_point_key=filter.get_cache_key(image)
+            )
+        renditions = list(image.renditions.filter(lookup_q))
+
+        found_specs = {rendition.filter_spec for rendition in renditions}
+        missing = [filter for filter in filters if filter.spec not in found_specs]
+        if missing:
+            logger.debug(
+                "Generating %d renditions for image %d locally, as the task did not create them",
+                len(missing),
+                image.pk,
+            )
+            renditions.extend(self.local_generator.generate_renditions(image, missing))
+
+        return renditions
+
+
+def build_rendition_generator(config: dict) -> BaseRenditionGenerator:
+    try:
+        generator_class = import_string(config["BACKEND"])
+    except (KeyError, ImportError) as e:
+        raise ImproperlyConfigured(
+            f"Could not load rendition generator backend from {config!r}: {e}"
+        ) from e
+
+    return generator_class(**config.get("OPTIONS", {}))
+
+
+@lru_cache(maxsize=None)
+def get_rendition_generator() -> BaseRenditionGenerator:
+    return build_rendition_generator(
+        getattr(
+            settings, "WAGTAILIMAGES_RENDITION_GENERATOR", DEFAULT_RENDITION_GENERATOR
+        )
+    )
+
+
+class InFlightRenditions:
+    """
+    Tracks the renditions that are currently being created in this process, so
+    that concurrent requests for the same rendition (the same image, filter spec
+    and focal point) wait for a single generation to finish rather than each
+    decoding the original image and racing to save the result.
+    """
+
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._futures: dict[tuple, concurrent.futures.Future] = {}
+
+    def get_key(self, image: AbstractImage, filter: Filter) -> tuple:
+        return (
+            image._meta.label,
+            image.pk,
+            filter.spec,
+            filter.get_cache_key(image),
+        )
+
+    def create(self, image, filters, create_func) -> dict[Filter, AbstractRendition]:
+        """
+        Call ``create_func`` with the list of ``filters`` that aren't already
+        being created by another thread, and wait for the others to be created.
+        Returns a ``dict`` of renditions keyed by filter, as ``create_func`` must.
+        """
+        keys = {filter: self.get_key(image, filter) for filter in filters}
+        claimed: dict[Filter, concurrent.futures.Future] = {}
+        waiting: dict[Filter, concurrent.futures.Future] = {}
+
+        with self._lock:
+            for filter, key in keys.items():
+                future = self._futures.get(key)
+                if future is None:
+                    claimed[filter] = self._futures[key] = concurrent.futures.Future()
+                else:
+                    waiting[filter] = future
+
+        renditions = {}
+        try:
+            if claimed:
+                renditions = create_func(list(claimed))
+        except BaseException as e:
+            for future in claimed.values():
+                future.set_exception(e)
+            raise
+        else:
+            for filter, future in claimed.items():
+                future.set_result(renditions.get(filter))
+        finally:
+            with self._lock:
+                for filter in claimed:
+                    del self._futures[keys[filter]]
+
+        retry = []
+        for filter, future in waiting.items():
+            try:
+                rendition = future.result(timeout=self.timeout)
+            except Exception:  # noqa: BLE001
+                rendition = None
+
+            if rendition is None:
+                # The other thread failed or is taking too long, so try ourselves
+                retry.append(filter)
+            else:
+                # Don't share the instance between threads, and associate it with
+                # this image instance so that locally-set properties are respected
+                rendition = copy.copy(rendition)
+                rendition.image = image
+                renditions[filter] = rendition
+
+        if retry:
+            renditions.update(create_func(retry))
+
+        return renditions
+
+
+in_flight_renditions = InFlightRenditions()
@@ -1,11 +1,15 @@
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import transaction
 from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from wagtail.images import get_image_model
 from wagtail.tasks import delete_file_from_storage_task
 
+from .rendition_generators import get_rendition_generator
 from .tasks import set_image_focal_point_task
+from .warm_renditions import enqueue_warm_renditions, get_warm_rendition_registry
 
 
 def post_delete_file_cleanup(instance, **kwargs):
@@ -31,11 +35,30 @@ def post_save_image_feature_detection(instance, **kwargs):
             )
 
 
+def post_save_warm_renditions(instance, **kwargs):
+    # Make sure the image is not from a fixture
+    if kwargs["raw"] is False:
+        enqueue_warm_renditions(instance, kwargs.get("update_fields"))
+
+
+@receiver(setting_changed)
+def clear_rendition_generator_cache(*, setting: str, **kwargs: dict) -> None:
+    """
+    Clear the rendition generator backend and warm rendition registry when
+    settings change
+    """
+    if setting == "WAGTAILIMAGES_RENDITION_GENERATOR":
+        get_rendition_generator.cache_clear()
+    elif setting == "WAGTAILIMAGES_WARM_RENDITIONS":
+        get_warm_rendition_registry.cache_clear()
+
+
 def register_signal_handlers():
     Image = get_image_model()
     Rendition = Image.get_rendition_model()
 
     post_save.connect(post_save_image_feature_detection, sender=Image)
+    post_save.connect(post_save_warm_renditions, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Rendition)
     post_delete.connect(post_delete_purge_rendition_cache, sender=Rendition)
@@ -16,3 +16,48 @@ def set_image_focal_point_task(app_label, model_name, pk):
             "focal_point_height",
         ]
     )
+
+
+# Rendition generator backends wait for this task to finish, so don't hold it
+# back until the current transaction (which may be the whole request) commits
+@task(enqueue_on_commit=False)
+def generate_renditions_task(app_label, model_name, pk, filter_specs):
+    from wagtail.images.models import Filter
+
+    model = apps.get_model(app_label, model_name)
+    instance = model.objects.get(pk=pk)
+    _generate_missing_renditions(instance, [Filter(spec=spec) for spec in filter_specs])
+
+
+@task()
+def warm_renditions_task(app_label, model_name, pk):
+    from wagtail.images.models import Filter
+    from wagtail.images.warm_renditions import get_warm_rendition_registry
+
+    model = apps.get_model(app_label, model_name)
+    try:
+        instance = model.objects.get(pk=pk)
+    except model.DoesNotExist:
+        # The image was deleted before the task ran
+        return
+
+    filter_specs = get_warm_rendition_registry().get_filter_specs(instance)
+    if filter_specs:
+        _generate_missing_renditions(
+            instance, [Filter(spec=spec) for spec in filter_specs]
+        )
+
+
+def _generate_missing_renditions(instance, filters):
+    from wagtail.images.rendition_generators import get_rendition_generator
+
+    # Generate the renditions here, rather than passing them to another task
+    generator = get_rendition_generator()
+    generator = getattr(generator, "local_generator", generator)
+
+    existing = instance.find_existing_renditions(*filters)
+    missing = [filter for filter in filters if filter not in existing]
+    if missing:
+        instance._save_generated_renditions(
+            missing, generator.generate_renditions(instance, missing)
+        )
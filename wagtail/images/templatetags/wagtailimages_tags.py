@@ -3,6 +3,10 @@ from django.core.exceptions import ImproperlyConfigured
 from django.urls import NoReverseMatch
 
 from wagtail.images.models import Filter, Picture, ResponsiveImage
+from wagtail.images.rendition_collector import (
+    get_rendition_collector,
+    is_output_captured,
+)
 from wagtail.images.shortcuts import (
     get_rendition_or_not_found,
     get_renditions_or_not_found,
@@ -73,12 +77,7 @@ def image(parser, token):
         error_messages.append("Image tags must be used with at least one filter spec")
 
     if len(error_messages) == 0:
-        Node = {
-            "image": ImageNode,
-            "srcset_image": SrcsetImageNode,
-            "picture": PictureNode,
-        }
-        return Node[tag_name](
+        return IMAGE_NODES[tag_name](
             image_expr,
             filter_specs,
             attrs=attrs,
@@ -99,6 +98,8 @@ register.tag("picture", image)
 
 
 class ImageNode(template.Node):
+    tag_name = "image"
+
     def __init__(
         self,
         image_expr,
@@ -111,8 +112,17 @@ class ImageNode(template.Node):
         self.attrs = attrs or {}
         self.filter_specs = filter_specs
 
+    @classmethod
+    def get_filters_for_specs(cls, filter_specs):
+        return [Filter(spec="|".join(filter_specs))]
+
+    @classmethod
+    def render_image(cls, image, filters, attrs):
+        rendition = get_rendition_or_not_found(image, filters[0])
+        return rendition.img_tag(attrs)
+
     def get_filter(self):
-        return Filter(spec="|".join(self.filter_specs))
+        return self.get_filters_for_specs(self.filter_specs)[0]
 
     def validate_image(self, context):
         try:
@@ -132,33 +142,57 @@ class ImageNode(template.Node):
 
         return image
 
+    def resolve_attrs(self, context):
+        resolved_attrs = {}
+        for key in self.attrs:
+            resolved_attrs[key] = self.attrs[key].resolve(context)
+        return resolved_attrs
+
+    def render_tag(self, image, context):
+        attrs = self.resolve_attrs(context)
+
+        collector = get_rendition_collector()
+        if collector is not None and image.pk is not None and not is_output_captured():
+            # Leave finding the renditions until the rest of the template has
+            # been rendered, so that they can all be found at once
+            return collector.add(type(self), image, self.filter_specs, attrs)
+
+        return self.render_image(
+            image, self.get_filters_for_specs(self.filter_specs), attrs
+        )
+
     def render(self, context):
         image = self.validate_image(context)
 
         if not image:
             return ""
 
-        rendition = get_rendition_or_not_found(
-            image,
-            self.get_filter(),
-        )
-
         if self.output_var_name:
             # return the rendition object in the given variable
-            context[self.output_var_name] = rendition
+            context[self.output_var_name] = get_rendition_or_not_found(
+                image,
+                self.get_filter(),
+            )
             return ""
         else:
             # render the rendition's image tag now
-            resolved_attrs = {}
-            for key in self.attrs:
-                resolved_attrs[key] = self.attrs[key].resolve(context)
-            return rendition.img_tag(resolved_attrs)
+            return self.render_tag(image, context)
 
 
 class SrcsetImageNode(ImageNode):
+    tag_name = "srcset_image"
+
+    @classmethod
+    def get_filters_for_specs(cls, filter_specs):
+        return [Filter(spec=f) for f in Filter.expand_spec(filter_specs)]
+
+    @classmethod
+    def render_image(cls, image, filters, attrs):
+        renditions = get_renditions_or_not_found(image, filters)
+        return ResponsiveImage(renditions, attrs).__html__()
+
     def get_filters(self):
-        filter_specs = Filter.expand_spec(self.filter_specs)
-        return [Filter(spec=f) for f in filter_specs]
+        return self.get_filters_for_specs(self.filter_specs)
 
     def render(self, context):
         image = self.validate_image(context)
@@ -166,45 +200,44 @@ class SrcsetImageNode(ImageNode):
         if not image:
             return ""
 
-        specs = self.get_filters()
-        renditions = get_renditions_or_not_found(image, specs)
-
         if self.output_var_name:
             # Wrap the renditions in ResponsiveImage object, to support both
             # rendering as-is and access to the data.
+            renditions = get_renditions_or_not_found(image, self.get_filters())
             context[self.output_var_name] = ResponsiveImage(renditions)
             return ""
 
-        resolved_attrs = {}
-        for key in self.attrs:
-            resolved_attrs[key] = self.attrs[key].resolve(context)
-
-        return ResponsiveImage(renditions, resolved_attrs).__html__()
+        return self.render_tag(image, context)
 
 
 class PictureNode(SrcsetImageNode):
+    tag_name = "picture"
+
+    @classmethod
+    def render_image(cls, image, filters, attrs):
+        renditions = get_renditions_or_not_found(image, filters)
+        return Picture(renditions, attrs).__html__()
+
     def render(self, context):
         image = self.validate_image(context)
 
         if not image:
             return ""
 
-        renditions = get_renditions_or_not_found(
-            image,
-            self.get_filters(),
-        )
-
         if self.output_var_name:
             # Wrap the renditions in Picture object, to support both
             # rendering as-is and access to the data.
+            renditions = get_renditions_or_not_found(image, self.get_filters())
             context[self.output_var_name] = Picture(renditions)
             return ""
 
-        resolved_attrs = {}
-        for key in self.attrs:
-            resolved_attrs[key] = self.attrs[key].resolve(context)
+        return self.render_tag(image, context)
+
 
-        return Picture(renditions, resolved_attrs).__html__()
+IMAGE_NODES = {
+    node_class.tag_name: node_class
+    for node_class in [ImageNode, SrcsetImageNode, PictureNode]
+}
 
 
 @register.simple_tag()
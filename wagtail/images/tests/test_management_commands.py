@@ -138,3 +138,28 @@ class TestUpdateImageRenditions(TestCase):
         self.assertIn(
             f"Successfully processed {total_renditions} rendition(s)\n", output_string
         )
+
+    @override_settings(
+        WAGTAILIMAGES_WARM_RENDITIONS=[{"FILTER_SPECS": ["width-{100,200}"]}]
+    )
+    def test_warm_renditions(self):
+        output = self.run_command(warm=True)
+        output_string = self.REAESC.sub("", output.read())
+        self.assertEqual(
+            output_string,
+            "Warming renditions for 1 image(s)\n"
+            "Progress: [------------------------------------------------->] 100%\n"
+            "Successfully warmed renditions for 1 image(s)\n",
+        )
+
+        # The existing rendition is left alone
+        self.assertEqual(
+            set(self.image.renditions.values_list("filter_spec", flat=True)),
+            {"original", "width-100", "width-200"},
+        )
+
+    def test_warm_renditions_not_configured(self):
+        output = self.run_command(warm=True)
+        output_string = self.REAESC.sub("", output.read())
+        self.assertEqual(output_string, "No warm renditions are configured.\n")
+        self.assertEqual(self.image.renditions.count(), 1)
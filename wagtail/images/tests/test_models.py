@@ -1,12 +1,16 @@
+import concurrent.futures
 import hashlib
+import multiprocessing
+import threading
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.core import checks, management
 from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
 from django.core.files import File
 from django.core.files.storage import Storage, default_storage, storages
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -18,6 +22,7 @@ from willow.image import Image as WillowImage
 
 from wagtail.images.exceptions import InvalidFilterSpecError
 from wagtail.images.models import (
+    DecodedImage,
     Filter,
     Picture,
     Rendition,
@@ -26,6 +31,13 @@ from wagtail.images.models import (
     get_rendition_storage,
 )
 from wagtail.images.rect import Rect
+from wagtail.images.rendition_generators import (
+    InFlightRenditions,
+    ProcessPoolRenditionGenerator,
+    SequentialRenditionGenerator,
+    ThreadPoolRenditionGenerator,
+    get_rendition_generator,
+)
 from wagtail.models import Collection, GroupCollectionPermission, Page, ReferenceIndex
 from wagtail.search.backends import get_search_backend
 from wagtail.test.dummy_external_storage import (
@@ -1092,6 +1104,352 @@ class TestRenditions(TestCase):
         self.assertEqual(renditions["width-200"].url, filename2)
 
 
+class TestRenditionGenerators(TestCase):
+    SPECS = ("height-66", "width-100", "width-400")
+
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        self.filters = [Filter(spec) for spec in self.SPECS]
+
+    def assertRenditionsCreated(self, result):
+        self.assertEqual(
+            {
+                filter.spec: rendition.filter_spec
+                for filter, rendition in result.items()
+            },
+            {spec: spec for spec in self.SPECS},
+        )
+        self.assertEqual(self.image.renditions.count(), len(self.SPECS))
+
+    def test_default_generator(self):
+        self.assertIsInstance(get_rendition_generator(), ThreadPoolRenditionGenerator)
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={
+            "BACKEND": "wagtail.images.rendition_generators.SequentialRenditionGenerator"
+        }
+    )
+    def test_sequential_generator(self):
+        self.assertIsInstance(get_rendition_generator(), SequentialRenditionGenerator)
+        self.assertRenditionsCreated(self.image.create_renditions(*self.filters))
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={
+            "BACKEND": "wagtail.images.rendition_generators.ThreadPoolRenditionGenerator",
+            "OPTIONS": {"max_workers": 1},
+        }
+    )
+    def test_thread_pool_generator_options(self):
+        generator = get_rendition_generator()
+        self.assertEqual(generator.max_workers, 1)
+        self.assertRenditionsCreated(self.image.create_renditions(*self.filters))
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={
+            "BACKEND": "wagtail.images.rendition_generators.ProcessPoolRenditionGenerator",
+            "OPTIONS": {"max_workers": 2},
+        }
+    )
+    def test_process_pool_generator(self):
+        generator = get_rendition_generator()
+        self.assertIsInstance(generator, ProcessPoolRenditionGenerator)
+        self.addCleanup(generator.reset_executor)
+
+        result = self.image.create_renditions(*self.filters)
+
+        self.assertRenditionsCreated(result)
+        sizes = {
+            rendition.filter_spec: (rendition.width, rendition.height)
+            for rendition in self.image.renditions.all()
+        }
+        self.assertEqual(
+            sizes,
+            {"height-66": (88, 66), "width-100": (100, 75), "width-400": (400, 300)},
+        )
+        for rendition in self.image.renditions.all():
+            with rendition.get_willow_image() as willow_image:
+                self.assertEqual(
+                    willow_image.get_size(), (rendition.width, rendition.height)
+                )
+
+    def test_process_pool_generator_in_daemon_process(self):
+        generator = ProcessPoolRenditionGenerator(max_workers=2)
+        self.addCleanup(generator.reset_executor)
+
+        with mock.patch.object(
+            multiprocessing, "current_process", return_value=mock.Mock(daemon=True)
+        ):
+            renditions = generator.generate_renditions(self.image, self.filters)
+
+        # Daemonic processes can't have children, so no pool was started
+        self.assertIsNone(generator._executor)
+        self.assertEqual(
+            {rendition.filter_spec for rendition in renditions},
+            {"height-66", "width-100", "width-400"},
+        )
+
+    def test_decodes_original_once(self):
+        generator = SequentialRenditionGenerator()
+        with mock.patch.object(
+            DecodedImage,
+            "__init__",
+            autospec=True,
+            side_effect=DecodedImage.__init__,
+        ) as decode:
+            renditions = generator.generate_renditions(self.image, self.filters)
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(
+            {
+                rendition.filter_spec: (rendition.width, rendition.height)
+                for rendition in renditions
+            },
+            {"height-66": (88, 66), "width-100": (100, 75), "width-400": (400, 300)},
+        )
+
+    def test_decode_once_disabled(self):
+        generator = SequentialRenditionGenerator(decode_once=False)
+        with mock.patch.object(
+            DecodedImage,
+            "__init__",
+            autospec=True,
+            side_effect=DecodedImage.__init__,
+        ) as decode:
+            generator.generate_renditions(self.image, self.filters)
+
+        self.assertEqual(decode.call_count, len(self.filters))
+
+    def test_cascade_generates_largest_first(self):
+        generator = SequentialRenditionGenerator(cascade=True)
+        self.assertEqual(
+            [
+                filter.spec
+                for filter in generator.sort_filters(self.image, self.filters)
+            ],
+            ["width-400", "width-100", "height-66"],
+        )
+        self.assertEqual(
+            [
+                filter.spec
+                for filter in SequentialRenditionGenerator().sort_filters(
+                    self.image, self.filters
+                )
+            ],
+            list(self.SPECS),
+        )
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={
+            "BACKEND": "wagtail.images.rendition_generators.TaskRenditionGenerator"
+        }
+    )
+    def test_task_generator(self):
+        with mock.patch.object(
+            ThreadPoolRenditionGenerator, "generate_renditions", autospec=True
+        ) as local_generate:
+            # The immediate task backend runs the task before enqueue() returns
+            with mock.patch(
+                "wagtail.images.rendition_generators.get_rendition_generator",
+                return_value=SequentialRenditionGenerator(),
+            ):
+                result = self.image.create_renditions(*self.filters)
+
+        self.assertRenditionsCreated(result)
+        local_generate.assert_not_called()
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={
+            "BACKEND": "wagtail.images.rendition_generators.TaskRenditionGenerator",
+            "OPTIONS": {"timeout": 0},
+        },
+        TASKS={"default": {"BACKEND": "django_tasks.backends.dummy.DummyBackend"}},
+    )
+    def test_task_generator_falls_back_to_local_generation(self):
+        # The dummy task backend never runs the task
+        self.assertRenditionsCreated(self.image.create_renditions(*self.filters))
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_GENERATOR={"BACKEND": "wagtail.images.DoesNotExist"}
+    )
+    def test_invalid_generator(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_rendition_generator()
+
+
+class TestDecodedImage(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+
+    def decode(self, **kwargs):
+        with self.image.open_file() as f:
+            return self.image.decode_rendition_source(BytesIO(f.read()), **kwargs)
+
+    def generate(self, decoded, spec):
+        return self.image.generate_rendition_file(Filter(spec), decoded=decoded)
+
+    def test_generate_rendition_file(self):
+        decoded = self.decode()
+        self.assertEqual(decoded.size, (640, 480))
+        self.assertEqual(decoded.original_format, "png")
+
+        for spec, size in [("width-400", (400, 300)), ("fill-100x100", (100, 100))]:
+            file = self.generate(decoded, spec)
+            self.assertEqual(WillowImage.open(file).get_size(), size)
+
+        # Without cascading, no intermediate images are kept
+        self.assertEqual(decoded.memory_used, 0)
+
+    def test_cascade(self):
+        decoded = self.decode(cascade=True)
+
+        self.generate(decoded, "width-400")
+        self.assertEqual(decoded.memory_used, DecodedImage.estimate_memory((400, 300)))
+
+        # Smaller renditions are generated from the intermediate image
+        intermediate, rect = decoded.get_source(Rect(0, 0, 640, 480), (100, 75))
+        self.assertEqual(intermediate.get_size(), (400, 300))
+        self.assertEqual(rect, Rect(0, 0, 400, 300))
+
+        intermediate, rect = decoded.get_source(Rect(320, 240, 640, 480), (100, 75))
+        self.assertEqual(intermediate.get_size(), (400, 300))
+        self.assertEqual(rect, Rect(200, 150, 400, 300))
+
+        file = self.generate(decoded, "fill-100x100")
+        self.assertEqual(WillowImage.open(file).get_size(), (100, 100))
+
+        # Larger renditions still come from the original
+        source, rect = decoded.get_source(Rect(0, 0, 640, 480), (500, 375))
+        self.assertIs(source, decoded.willow_image)
+        self.assertEqual(rect, Rect(0, 0, 640, 480))
+
+        # Cropped renditions aren't kept as intermediates
+        self.generate(decoded, "fill-200x200")
+        self.assertEqual(decoded.memory_used, DecodedImage.estimate_memory((400, 300)))
+
+    def test_cascade_memory_budget(self):
+        decoded = self.decode(
+            cascade=True, memory_budget=DecodedImage.estimate_memory((400, 300))
+        )
+
+        self.generate(decoded, "width-400")
+        self.generate(decoded, "width-200")
+
+        # The second intermediate would exceed the budget
+        self.assertEqual(decoded.memory_used, DecodedImage.estimate_memory((400, 300)))
+
+
+class TestInFlightRenditions(TestCase):
+    def setUp(self):
+        self.in_flight = InFlightRenditions(timeout=5)
+        self.image = Image(id=1, title="Test image", width=640, height=480)
+        self.filter = Filter("width-100")
+
+    def wait_for_future(self):
+        """
+        Patch ``Future.result`` to set the returned event when a thread starts
+        waiting for a rendition being created by another thread.
+        """
+        waiting = threading.Event()
+        result = concurrent.futures.Future.result
+
+        def wait(future, *args, **kwargs):
+            waiting.set()
+            return result(future, *args, **kwargs)
+
+        patcher = mock.patch.object(
+            concurrent.futures.Future, "result", autospec=True, side_effect=wait
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return waiting
+
+    def test_concurrent_creation_is_deduplicated(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = {}
+
+        def create(filters):
+            calls.append(filters)
+            started.set()
+            release.wait(timeout=5)
+            return {filter: Rendition(filter_spec=filter.spec) for filter in filters}
+
+        def request(name):
+            results[name] = self.in_flight.create(self.image, [self.filter], create)
+
+        waiting = self.wait_for_future()
+        first = threading.Thread(target=request, args=("first",))
+        first.start()
+        self.assertTrue(started.wait(timeout=5))
+
+        second = threading.Thread(target=request, args=("second",))
+        second.start()
+        # Only let the first thread finish once the second is waiting for it
+        self.assertTrue(waiting.wait(timeout=5))
+        release.set()
+        first.join()
+        second.join()
+
+        # Only one thread generated the rendition
+        self.assertEqual(calls, [[self.filter]])
+        first_rendition = results["first"][self.filter]
+        second_rendition = results["second"][self.filter]
+        self.assertEqual(second_rendition.filter_spec, "width-100")
+        # ...but each gets its own instance
+        self.assertIsNot(first_rendition, second_rendition)
+        self.assertIs(second_rendition.image, self.image)
+
+    def test_waiting_thread_retries_after_failure(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = {}
+
+        def failing_create(filters):
+            calls.append("failing")
+            started.set()
+            release.wait(timeout=5)
+            raise SourceImageIOError("Broken")
+
+        def create(filters):
+            calls.append("retry")
+            return {filter: Rendition(filter_spec=filter.spec) for filter in filters}
+
+        def failing_request():
+            with self.assertRaises(SourceImageIOError):
+                self.in_flight.create(self.image, [self.filter], failing_create)
+
+        def request():
+            results["second"] = self.in_flight.create(self.image, [self.filter], create)
+
+        waiting = self.wait_for_future()
+        first = threading.Thread(target=failing_request)
+        first.start()
+        self.assertTrue(started.wait(timeout=5))
+        second = threading.Thread(target=request)
+        second.start()
+        self.assertTrue(waiting.wait(timeout=5))
+        release.set()
+        first.join()
+        second.join()
+
+        self.assertEqual(calls, ["failing", "retry"])
+        self.assertEqual(results["second"][self.filter].filter_spec, "width-100")
+
+    def test_nothing_left_in_flight(self):
+        self.in_flight.create(
+            self.image, [self.filter], lambda filters: {self.filter: Rendition()}
+        )
+        self.assertEqual(self.in_flight._futures, {})
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
 )
@@ -1,8 +1,14 @@
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.test import TestCase, TransactionTestCase, override_settings
 
-from wagtail.images import get_image_model, signal_handlers
+from wagtail.images import get_image_model, signal_handlers, tasks
+from wagtail.images.models import Filter
+from wagtail.images.rect import Rect
 from wagtail.images.tests.utils import get_test_image_file
+from wagtail.images.warm_renditions import get_warm_rendition_registry
 from wagtail.models import Collection
 
 from .utils import Image
@@ -97,3 +103,100 @@ class TestRawForPreSaveImageFeatureDetection(TestCase):
     def test_image_does_not_exist(self):
         bad_image = Image.objects.get(pk=1)
         self.assertFalse(bad_image.file.storage.exists(bad_image.file.name))
+
+
+@override_settings(
+    WAGTAILIMAGES_WARM_RENDITIONS=[
+        {"FILTER_SPECS": ["width-{100,200}"]},
+        {"FILTER_SPECS": ["fill-50x50"], "COLLECTIONS": ["Heroes"]},
+        {"FILTER_SPECS": ["height-10"], "MODELS": ["tests.CustomImage"]},
+    ]
+)
+class TestWarmRenditions(TestCase):
+    def setUp(self):
+        root_collection = Collection.get_first_root_node()
+        self.heroes = root_collection.add_child(name="Heroes")
+        self.home_heroes = self.heroes.add_child(name="Home page")
+
+    def create_image(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Image.objects.create(
+                title="Test image", file=get_test_image_file(), **kwargs
+            )
+
+    def get_filter_specs(self, image):
+        return set(image.renditions.values_list("filter_spec", flat=True))
+
+    def test_warm_on_upload(self):
+        image = self.create_image()
+        self.assertEqual(self.get_filter_specs(image), {"width-100", "width-200"})
+
+    def test_warm_collection(self):
+        image = self.create_image(collection=self.home_heroes)
+        self.assertEqual(
+            self.get_filter_specs(image), {"width-100", "width-200", "fill-50x50"}
+        )
+
+    def test_warm_on_focal_point_change(self):
+        image = self.create_image(collection=self.heroes)
+        old_rendition = image.get_rendition("fill-50x50")
+
+        image.set_focal_point(Rect(10, 10, 20, 20))
+        with self.captureOnCommitCallbacks(execute=True):
+            image.save(
+                update_fields=[
+                    "focal_point_x",
+                    "focal_point_y",
+                    "focal_point_width",
+                    "focal_point_height",
+                ]
+            )
+
+        image.refresh_from_db()
+        new_rendition = image.renditions.get(
+            filter_spec="fill-50x50",
+            focal_point_key=Filter("fill-50x50").get_cache_key(image),
+        )
+        self.assertNotEqual(new_rendition.pk, old_rendition.pk)
+
+    def test_not_warmed_for_unrelated_fields(self):
+        image = self.create_image()
+        image.renditions.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.save(update_fields=["title"])
+
+        self.assertEqual(image.renditions.count(), 0)
+
+    @override_settings(WAGTAILIMAGES_FEATURE_DETECTION_ENABLED=True)
+    def test_warm_after_feature_detection(self):
+        with mock.patch.object(
+            signal_handlers, "set_image_focal_point_task"
+        ) as set_image_focal_point_task:
+            image = self.create_image()
+
+        # Warming waits for the focal point to be detected
+        set_image_focal_point_task.enqueue.assert_called_once()
+        self.assertEqual(image.renditions.count(), 0)
+
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            mock.patch.object(
+                Image, "get_suggested_focal_point", return_value=Rect(10, 10, 20, 20)
+            ),
+        ):
+            tasks.set_image_focal_point_task.call(
+                image._meta.app_label, image._meta.model_name, str(image.pk)
+            )
+
+        self.assertEqual(self.get_filter_specs(image), {"width-100", "width-200"})
+
+    def test_task_ignores_deleted_image(self):
+        tasks.warm_renditions_task.call("wagtailimages", "image", "0")
+
+    @override_settings(
+        WAGTAILIMAGES_WARM_RENDITIONS=[{"MODELS": ["tests.CustomImage"]}]
+    )
+    def test_invalid_config(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_warm_rendition_registry()
@@ -1,7 +1,14 @@
+import json
+
+from django.http import JsonResponse
 from django.template import Context, Engine, TemplateSyntaxError, Variable
-from django.test import TestCase
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.html import escape
 
+from wagtail.images.middleware import RenditionCollectorMiddleware
 from wagtail.images.models import Image, Rendition
+from wagtail.images.rendition_collector import collect_renditions
 from wagtail.images.templatetags.wagtailimages_tags import ImageNode
 from wagtail.images.tests.utils import (
     get_test_bad_image,
@@ -13,6 +20,7 @@ from wagtail.images.tests.utils import (
 LIBRARIES = {
     "wagtailimages_tags": "wagtail.images.templatetags.wagtailimages_tags",
     "l10n": "django.templatetags.l10n",
+    "cache": "django.templatetags.cache",
 }
 
 
@@ -536,3 +544,205 @@ class PictureTagTestCase(ImagesTestCase):
             </picture>
         """
         self.assertHTMLEqual(rendered, expected)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class RenditionCollectorTestCase(ImagesTestCase):
+    TEMPLATE = (
+        '{% image myimage width-200 class="photo" %}'
+        '{% srcset_image myimage width-{100,300} sizes="50vw" %}'
+        "{% picture svgimage width-{40,80} format-{avif,jpeg} preserve-svg %}"
+        "{% for item in images %}{% image item fill-50x50 %}{% endfor %}"
+    )
+
+    def setUp(self):
+        Rendition.cache_backend.clear()
+        self.context = {
+            "myimage": self.image,
+            "svgimage": self.svg_image,
+            "images": [self.image, Image.objects.get(pk=self.image.pk)],
+        }
+        # Create the renditions, then render them as loaded from the database
+        self.render(self.TEMPLATE, self.context)
+        Rendition.cache_backend.clear()
+        self.expected = self.render(self.TEMPLATE, self.context)
+        Rendition.cache_backend.clear()
+
+    def render_collected(self, string, context):
+        with collect_renditions() as collector:
+            rendered = self.render(string, context)
+        self.assertIn("<!--wagtail-rendition:", rendered)
+        return collector.render(rendered)
+
+    def test_render(self):
+        self.assertEqual(
+            self.render_collected(self.TEMPLATE, self.context), self.expected
+        )
+
+    def test_single_query(self):
+        # All the renditions are found with one query
+        with self.assertNumQueries(1):
+            rendered = self.render_collected(self.TEMPLATE, self.context)
+        self.assertEqual(rendered, self.expected)
+
+        # and added to the cache
+        with self.assertNumQueries(0):
+            rendered = self.render_collected(self.TEMPLATE, self.context)
+        self.assertEqual(rendered, self.expected)
+
+    def test_creates_missing_renditions(self):
+        Rendition.objects.filter(filter_spec="width-300").delete()
+        rendered = self.render_collected(self.TEMPLATE, self.context)
+
+        rendition = self.image.renditions.get(filter_spec="width-300")
+        self.assertIn(f"{rendition.url} 300w", rendered)
+        self.assertNotIn("<!--wagtail-rendition:", rendered)
+
+    def test_bad_image(self):
+        template = "{% image myimage width-200 %}"
+        context = {"myimage": self.bad_image}
+        self.assertEqual(
+            self.render_collected(template, context), self.render(template, context)
+        )
+
+    def test_as_syntax_is_not_deferred(self):
+        with collect_renditions():
+            rendered = self.render(
+                "{% image myimage width-200 as img %}{{ img.url }}",
+                {"myimage": self.image},
+            )
+        self.assertEqual(rendered, get_test_image_filename(self.image, "width-200"))
+
+    def test_placeholder_from_another_collector(self):
+        # For example, rendered while another collector was active
+        with collect_renditions():
+            rendered = self.render(self.TEMPLATE, self.context)
+
+        with collect_renditions() as collector:
+            # One query each for the images and their renditions
+            with self.assertNumQueries(2):
+                self.assertEqual(collector.render(rendered), self.expected)
+
+    def test_escaped_placeholder(self):
+        with collect_renditions() as collector:
+            rendered = self.render(self.TEMPLATE, self.context)
+        self.assertEqual(collector.render(escape(rendered)), escape(self.expected))
+
+    def test_forged_placeholders_are_removed(self):
+        with collect_renditions() as collector:
+            rendered = self.render("{% image myimage width-200 %}", self.context)
+        token, index, payload = rendered[len("<!--wagtail-rendition:") : -3].split(
+            ":", 2
+        )
+        other_model_payload = collector.signer.sign_object(
+            {
+                "tag": "image",
+                "model": "wagtailcore.page",
+                "pk": 1,
+                "filter_specs": "width-200",
+                "attrs": {},
+            }
+        )
+        forged = [
+            # A placeholder with its payload changed, as could be echoed back
+            # by a page, for example in search terms
+            f"<!--wagtail-rendition:{token[::-1]}:{index}:{payload[:-2]}xx-->",
+            f"<!--wagtail-rendition:{token[::-1]}:{index}:not-a-payload-->",
+            f"<!--wagtail-rendition:{token[::-1]}:0:{other_model_payload}-->",
+        ]
+
+        with collect_renditions() as collector:
+            with (
+                self.assertNumQueries(0),
+                self.assertLogs("wagtail.images", "WARNING") as logs,
+            ):
+                self.assertEqual(collector.render("".join(forged)), "")
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn("couldn't be resolved", logs.output[0])
+
+    def test_captured_output_is_not_deferred(self):
+        # Placeholders must not be stored in cached fragments, which may be
+        # output where there's no collector to resolve them, or altered
+        image_tag = '{% image myimage width-200 class="photo" %}'
+        templates = [
+            "{% load cache %}{% cache 500 images %}" + image_tag + "{% endcache %}",
+            "{% filter upper %}" + image_tag + "{% endfilter %}",
+            "{% spaceless %}" + image_tag + "{% endspaceless %}",
+        ]
+        for template in templates:
+            with self.subTest(template=template):
+                with collect_renditions():
+                    rendered = self.render(template, self.context)
+                self.assertNotIn("wagtail-rendition:", rendered.lower())
+
+                # The cached fragment is output without a collector
+                self.assertEqual(self.render(template, self.context), rendered)
+
+    def test_passed_through_output_is_deferred(self):
+        template = (
+            "{% with img=myimage %}{% if img %}{% block content %}"
+            '{% image img width-200 class="photo" %}'
+            "{% endblock %}{% endif %}{% endwith %}"
+        )
+        expected = self.render(template, self.context)
+        self.assertEqual(self.render_collected(template, self.context), expected)
+
+    def test_middleware(self):
+        def view(request):
+            return TemplateResponse(
+                request, RenderedTemplate(self.engine, self.TEMPLATE), self.context
+            )
+
+        request = RequestFactory().get("/")
+        response = view(request)
+        with self.assertNumQueries(1):
+            response = RenditionCollectorMiddleware(view).process_template_response(
+                request, response
+            )
+        self.assertEqual(response.content.decode(), self.expected)
+
+    def test_middleware_ignores_other_content(self):
+        # Image tags rendered other than as part of a template response, such as
+        # into emails or other kinds of responses, are rendered immediately
+        def view(request):
+            self.assertNotIn(
+                "<!--wagtail-rendition:", self.render(self.TEMPLATE, self.context)
+            )
+            return JsonResponse({"html": self.render(self.TEMPLATE, self.context)})
+
+        response = RenditionCollectorMiddleware(view)(RequestFactory().get("/"))
+        self.assertEqual(json.loads(response.content)["html"], self.expected)
+
+    def test_middleware_ignores_non_html_template_responses(self):
+        def view(request):
+            return TemplateResponse(
+                request,
+                RenderedTemplate(self.engine, "{% image myimage width-200 %}"),
+                self.context,
+                content_type="text/plain",
+            )
+
+        request = RequestFactory().get("/")
+        response = RenditionCollectorMiddleware(view).process_template_response(
+            request, view(request)
+        )
+        response.render()
+        self.assertEqual(
+            response.content.decode(),
+            self.render("{% image myimage width-200 %}", self.context),
+        )
+
+
+class RenderedTemplate:
+    """
+    A template from a string, rendered by ``engine`` with autoescaping off, as
+    used by a ``TemplateResponse``.
+    """
+
+    def __init__(self, engine, string):
+        self.template = engine.from_string(string)
+
+    def render(self, context=None, request=None):
+        return self.template.render(Context(context, autoescape=False))
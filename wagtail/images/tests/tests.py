@@ -1,6 +1,7 @@
 import os
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import willow
 from django import forms, template
@@ -10,6 +11,7 @@ from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUpload
 from django.test import TestCase, override_settings
 from django.test.signals import setting_changed
 from django.urls import reverse
+from django.utils.http import http_date
 from taggit.forms import TagField, TagWidget
 from willow.image import (
     AvifImageFile,
@@ -606,6 +608,116 @@ class TestFrontendServeView(TestCase):
         )
         self.assertEqual(response["Cache-Control"], "max-age=3600, public")
 
+    def get_serve_url(self, filter_spec="fill-800x600"):
+        signature = generate_signature(self.image.id, filter_spec)
+        return reverse(
+            "wagtailimages_serve_action_serve",
+            args=(signature, self.image.id, filter_spec),
+        )
+
+    def test_get_conditional_headers(self):
+        response = self.client.get(self.get_serve_url())
+        rendition = self.image.get_rendition("fill-800x600")
+
+        self.assertEqual(response["ETag"], f'"{rendition.pk}-{self.image.file_hash}"')
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_get_does_not_read_modified_time(self):
+        # Clients revalidate with the ETag, so an unconditional request
+        # doesn't need the rendition file's modification time
+        with mock.patch(
+            "django.core.files.storage.FileSystemStorage.get_modified_time"
+        ) as get_modified_time:
+            response = self.client.get(self.get_serve_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)
+        get_modified_time.assert_not_called()
+
+    def test_get_stores_mime_type(self):
+        self.client.get(self.get_serve_url())
+        rendition = self.image.renditions.get(filter_spec="fill-800x600")
+        self.assertEqual(rendition.mime_type, "image/png")
+
+    def test_get_if_none_match(self):
+        etag = self.client.get(self.get_serve_url())["ETag"]
+
+        # A matching ETag is answered without opening the rendition's file
+        with mock.patch(
+            "django.core.files.storage.FileSystemStorage.open"
+        ) as storage_open:
+            response = self.client.get(
+                self.get_serve_url(), headers={"if-none-match": etag}
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Cache-Control"], "max-age=3600, public")
+        storage_open.assert_not_called()
+
+        response = self.client.get(
+            self.get_serve_url(), headers={"if-none-match": '"other"'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_if_modified_since(self):
+        self.client.get(self.get_serve_url())
+        rendition = self.image.get_rendition("fill-800x600")
+        last_modified = http_date(
+            rendition.file.storage.get_modified_time(rendition.file.name).timestamp()
+        )
+
+        response = self.client.get(
+            self.get_serve_url(), headers={"if-modified-since": last_modified}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_range(self):
+        content = b"".join(self.client.get(self.get_serve_url()).streaming_content)
+        size = len(content)
+
+        response = self.client.get(self.get_serve_url(), headers={"range": "bytes=0-9"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 0-9/{size}")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(b"".join(response.streaming_content), content[:10])
+
+        response = self.client.get(self.get_serve_url(), headers={"range": "bytes=10-"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), content[10:])
+
+        response = self.client.get(self.get_serve_url(), headers={"range": "bytes=-10"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), content[-10:])
+
+    def test_get_unsatisfiable_range(self):
+        response = self.client.get(
+            self.get_serve_url(), headers={"range": "bytes=100000000-"}
+        )
+        self.assertEqual(response.status_code, 416)
+        self.assertTrue(response["Content-Range"].startswith("bytes */"))
+
+    def test_get_multiple_ranges_serves_whole_file(self):
+        response = self.client.get(
+            self.get_serve_url(), headers={"range": "bytes=0-9,20-29"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_if_range(self):
+        etag = self.client.get(self.get_serve_url())["ETag"]
+
+        response = self.client.get(
+            self.get_serve_url(), headers={"range": "bytes=0-9", "if-range": etag}
+        )
+        self.assertEqual(response.status_code, 206)
+
+        # The client's partial copy is out of date, so it gets the whole file
+        response = self.client.get(
+            self.get_serve_url(),
+            headers={"range": "bytes=0-9", "if-range": '"other"'},
+        )
+        self.assertEqual(response.status_code, 200)
+
 
 class TestFrontendSendfileView(TestCase):
     def setUp(self):
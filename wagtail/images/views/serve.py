@@ -1,8 +1,12 @@
+import re
+
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import classonlymethod, method_decorator
+from django.utils.http import parse_etags
 from django.views.decorators.cache import cache_control
 from django.views.generic import View
 
@@ -20,6 +24,28 @@ def generate_image_url(image, filter_spec, viewname="wagtailimages_serve", key=N
     return url
 
 
+class FileRange:
+    """
+    A file-like object to stream ``length`` bytes of ``file``, starting at
+    ``start``.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
 class ServeView(View):
     model = get_image_model()
     action = "serve"
@@ -60,13 +86,121 @@ class ServeView(View):
 
         return getattr(self, self.action)(rendition)
 
+    range_re = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+    def get_etag(self, rendition):
+        # The rendition's file never changes, but the rendition is recreated
+        # with a new id when the original image is replaced
+        return f'"{rendition.pk}-{rendition.image.file_hash}"'
+
+    def get_last_modified(self, rendition):
+        try:
+            return int(
+                rendition.file.storage.get_modified_time(
+                    rendition.file.name
+                ).timestamp()
+            )
+        except (NotImplementedError, OSError):
+            return None
+
+    def get_not_modified_response(self, rendition):
+        """
+        Returns a 304 (or 412) response if the request's conditional headers
+        show the client already has the rendition. This only needs to access
+        storage when the request has no If-None-Match header to compare with
+        the ETag, so unconditional requests never ask storage for the file's
+        modification time.
+        """
+        meta = self.request.META
+        last_modified = None
+        if "HTTP_IF_UNMODIFIED_SINCE" in meta or (
+            "HTTP_IF_MODIFIED_SINCE" in meta and "HTTP_IF_NONE_MATCH" not in meta
+        ):
+            last_modified = self.get_last_modified(rendition)
+
+        response = get_conditional_response(
+            self.request, etag=self.get_etag(rendition), last_modified=last_modified
+        )
+        if response is not None:
+            response["ETag"] = self.get_etag(rendition)
+        return response
+
+    def get_byte_range(self, rendition, size):
+        """
+        Returns the ``(start, end)`` positions (inclusive) of the byte range
+        requested by the Range header, ``None`` to serve the whole file, or
+        ``False`` if the range can't be satisfied.
+        """
+        range_header = self.request.META.get("HTTP_RANGE")
+        if not range_header:
+            return None
+
+        # Only honour the range if the client's copy is still current
+        if_range = self.request.META.get("HTTP_IF_RANGE")
+        if if_range and self.get_etag(rendition) not in parse_etags(if_range):
+            return None
+
+        # Requests for multiple ranges, or with an invalid range, get the
+        # whole file
+        match = self.range_re.match(range_header.strip())
+        if not match or not (match[1] or match[2]):
+            return None
+
+        if match[1]:
+            start = int(match[1])
+            if start >= size:
+                return False
+            end = min(int(match[2]), size - 1) if match[2] else size - 1
+            if end < start:
+                return None
+        else:
+            # A suffix range, for the last N bytes
+            if not int(match[2]):
+                return False
+            start = max(size - int(match[2]), 0)
+            end = size - 1
+
+        return start, end
+
+    def get_mime_type(self, rendition):
+        mime_type = rendition.get_mime_type()
+        if mime_type is None:
+            # Renditions from before the MIME type was stored, with an
+            # unrecognised extension
+            with rendition.get_willow_image() as willow_image:
+                mime_type = willow_image.mime_type
+        return mime_type
+
     def serve(self, rendition):
-        with rendition.get_willow_image() as willow_image:
-            mime_type = willow_image.mime_type
+        response = self.get_not_modified_response(rendition)
+        if response is not None:
+            return response
+
+        mime_type = self.get_mime_type(rendition)
 
         # Serve the file
         rendition.file.open("rb")
-        response = FileResponse(rendition.file, content_type=mime_type)
+        size = rendition.file.size
+        byte_range = self.get_byte_range(rendition, size)
+
+        if byte_range is False:
+            rendition.file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+        elif byte_range is not None:
+            start, end = byte_range
+            response = FileResponse(
+                FileRange(rendition.file, start, end - start + 1),
+                content_type=mime_type,
+                status=206,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(end - start + 1)
+        else:
+            response = FileResponse(rendition.file, content_type=mime_type)
+
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = self.get_etag(rendition)
 
         # Add a CSP header to prevent inline execution
         response["Content-Security-Policy"] = "default-src 'none'"
@@ -88,7 +222,12 @@ class SendFileView(ServeView):
     backend = None
 
     def serve(self, rendition):
+        response = self.get_not_modified_response(rendition)
+        if response is not None:
+            return response
+
         response = sendfile(self.request, rendition.file.path, backend=self.backend)
+        response["ETag"] = self.get_etag(rendition)
 
         # Add a CSP header to prevent inline execution
         response["Content-Security-Policy"] = "default-src 'none'"
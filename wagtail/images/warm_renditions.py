@@ -0,0 +1,122 @@
+"""
+The registry of "warm" renditions, which are generated in the background as
+soon as an image is uploaded or its focal point changes, configured through the
+``WAGTAILIMAGES_WARM_RENDITIONS`` setting.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from wagtail.images.tasks import warm_renditions_task
+
+if TYPE_CHECKING:
+    from wagtail.images.models import AbstractImage
+
+# Changes to these fields may change which warm renditions an image needs
+WARM_RENDITION_FIELDS = {
+    "file",
+    "collection",
+    "collection_id",
+    "focal_point_x",
+    "focal_point_y",
+    "focal_point_width",
+    "focal_point_height",
+}
+
+
+class WarmRenditionRegistry:
+    """
+    Holds the filter specs to pre-generate, each optionally restricted to
+    images of the given ``MODELS`` (as ``"app_label.ModelName"``) or in the
+    given ``COLLECTIONS`` (by name, including their descendants).
+    """
+
+    def __init__(self, config: list[dict]):
+        self.entries = []
+        for entry in config:
+            try:
+                filter_specs = list(entry["FILTER_SPECS"])
+            except (KeyError, TypeError) as e:
+                raise ImproperlyConfigured(
+                    f"Invalid WAGTAILIMAGES_WARM_RENDITIONS entry {entry!r}: {e}"
+                ) from e
+
+            models = entry.get("MODELS")
+            collections = entry.get("COLLECTIONS")
+            self.entries.append(
+                (
+                    filter_specs,
+                    {model.lower() for model in models} if models else None,
+                    set(collections) if collections else None,
+                )
+            )
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def get_filter_specs(self, image: AbstractImage) -> list[str]:
+        """
+        Returns the filter specs to pre-generate for ``image``, with any
+        brace-expansions expanded.
+        """
+        from wagtail.images.models import Filter
+
+        model_label = image._meta.label_lower
+        collection_names = None
+
+        filter_specs = []
+        for entry_specs, models, collections in self.entries:
+            if models is not None and model_label not in models:
+                continue
+
+            if collections is not None:
+                if collection_names is None:
+                    collection_names = set(
+                        image.collection.get_ancestors(inclusive=True).values_list(
+                            "name", flat=True
+                        )
+                    )
+                if not collections & collection_names:
+                    continue
+
+            for spec in entry_specs:
+                for expanded_spec in Filter.expand_spec(spec):
+                    if expanded_spec not in filter_specs:
+                        filter_specs.append(expanded_spec)
+
+        return filter_specs
+
+
+@lru_cache(maxsize=None)
+def get_warm_rendition_registry() -> WarmRenditionRegistry:
+    return WarmRenditionRegistry(getattr(settings, "WAGTAILIMAGES_WARM_RENDITIONS", []))
+
+
+def enqueue_warm_renditions(image: AbstractImage, update_fields=None):
+    """
+    Enqueue a task to generate the warm renditions for ``image``, if any are
+    registered and the fields in ``update_fields`` (if given) could affect them.
+
+    If the image's focal point is yet to be detected, this is left until
+    ``set_image_focal_point_task`` saves it.
+    """
+    if not get_warm_rendition_registry():
+        return
+
+    if update_fields is None:
+        if (
+            getattr(settings, "WAGTAILIMAGES_FEATURE_DETECTION_ENABLED", False)
+            and not image.has_focal_point()
+        ):
+            return
+    elif not WARM_RENDITION_FIELDS.intersection(update_fields):
+        return
+
+    warm_renditions_task.enqueue(
+        image._meta.app_label, image._meta.model_name, str(image.pk)
+    )
@@ -6,6 +6,7 @@ from markupsafe import Markup, escape
 from .templatetags.wagtailcore_tags import (
     fullpageurl,
     pageurl,
+    pageurls,
     richtext,
     slugurl,
     wagtail_site,
@@ -23,6 +24,7 @@ class WagtailCoreExtension(Extension):
             {
                 "fullpageurl": jinja2.pass_context(fullpageurl),
                 "pageurl": jinja2.pass_context(pageurl),
+                "pageurls": jinja2.pass_context(pageurls),
                 "slugurl": jinja2.pass_context(slugurl),
                 "wagtail_site": jinja2.pass_context(wagtail_site),
                 "wagtail_version": wagtail_version,
@@ -1,6 +1,15 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
 from django.apps import apps
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, transaction
+from django.db.models.functions import Cast
+from modelcluster.models import ClusterableModel, get_all_child_relations
 
 from wagtail.models import ReferenceIndex
 from wagtail.signal_handlers import disable_reference_index_auto_update
@@ -8,6 +17,56 @@ from wagtail.signal_handlers import disable_reference_index_auto_update
 DEFAULT_CHUNK_SIZE = 1000
 
 
+def get_indexed_queryset(model):
+    """
+    Returns the queryset of objects of ``model`` to index, in primary key order,
+    with their child relations prefetched.
+    """
+    queryset = model.objects.all().order_by("pk")
+    if issubclass(model, ClusterableModel):
+        queryset = queryset.prefetch_related(
+            *(
+                child_relation.get_accessor_name()
+                for child_relation in get_all_child_relations(model)
+            )
+        )
+    return queryset
+
+
+def index_objects(model_label, after_pk=None, upto_pk=None, limit=None):
+    """
+    Indexes the objects of the model with primary keys greater than
+    ``after_pk`` and up to ``upto_pk``, or the first ``limit`` of them.
+    Returns the number of objects indexed and the primary key of the last one.
+    """
+    model = apps.get_model(model_label)
+    queryset = get_indexed_queryset(model)
+    if after_pk is not None:
+        queryset = queryset.filter(pk__gt=after_pk)
+    if upto_pk is not None:
+        queryset = queryset.filter(pk__lte=upto_pk)
+    if limit is not None:
+        queryset = queryset[:limit]
+
+    with transaction.atomic():
+        objects = list(queryset)
+        ReferenceIndex.create_or_update_for_objects(objects)
+
+    return len(objects), objects[-1].pk if objects else None
+
+
+def init_worker():
+    # Worker processes started with "spawn" (rather than "fork") need to set
+    # up Django for themselves
+    if not apps.ready:
+        django.setup()
+
+
+def index_objects_in_worker(model_label, after_pk, upto_pk):
+    count, _ = index_objects(model_label, after_pk, upto_pk)
+    return model_label, upto_pk, count
+
+
 class Command(BaseCommand):
     def write(self, *args, **kwargs):
         """
@@ -27,11 +86,54 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            default=1,
+            type=int,
+            help="Set number of processes to index objects with in parallel",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store",
+            dest="checkpoint",
+            help=(
+                "Record progress in this file, so that an interrupted rebuild "
+                "resumes from where it stopped when run again with the same file"
+            ),
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
 
         chunk_size = options.get("chunk_size")
+        workers = options.get("workers")
+        self.checkpoint_path = options.get("checkpoint")
+
+        if chunk_size < 1:
+            raise CommandError("--chunk_size must be at least 1")
+        if workers < 1:
+            raise CommandError("--workers must be at least 1")
+
+        indexed_models = [
+            model for model in apps.get_models() if ReferenceIndex.is_indexed(model)
+        ]
+
+        if workers == 1 and not self.checkpoint_path:
+            object_count = self.rebuild(indexed_models, chunk_size)
+        else:
+            object_count = self.rebuild_incrementally(
+                indexed_models, chunk_size, workers
+            )
+
+        self.write("Indexed %d objects" % object_count)
+        self.print_newline()
+
+    def rebuild(self, indexed_models, chunk_size):
+        """
+        Rebuild the index from scratch in a single transaction
+        """
         object_count = 0
 
         self.write("Rebuilding reference index")
@@ -42,25 +144,176 @@ class Command(BaseCommand):
                 all_references = ReferenceIndex.objects.all()
                 all_references._raw_delete(using=all_references.db)
 
-            for model in apps.get_models():
-                if not ReferenceIndex.is_indexed(model):
-                    continue
-
+            for model in indexed_models:
                 self.write(str(model))
 
                 # Add items (chunk_size at a time)
-                for chunk in self.print_iter_progress(
-                    self.queryset_chunks(model.objects.all().order_by("pk"), chunk_size)
+                for count in self.print_iter_progress(
+                    self.index_chunks(model, chunk_size)
                 ):
-                    for instance in chunk:
-                        ReferenceIndex.create_or_update_for_object(instance)
-
-                    object_count += len(chunk)
+                    object_count += count
 
                 self.print_newline()
 
-        self.write("Indexed %d objects" % object_count)
+        return object_count
+
+    def index_chunks(self, model, chunk_size):
+        """
+        Index the objects of ``model``, ``chunk_size`` at a time in primary
+        key order, yielding the number indexed in each chunk
+        """
+        last_pk = None
+        while True:
+            count, last_pk = index_objects(model._meta.label, last_pk, limit=chunk_size)
+            if count:
+                yield count
+            if count < chunk_size:
+                return
+
+    def rebuild_incrementally(self, indexed_models, chunk_size, workers):
+        """
+        Update the index chunk by chunk, each in its own transaction, optionally
+        in several processes and recording progress in the checkpoint file.
+        References recorded for objects or models that are no longer indexed
+        are deleted at the end.
+        """
+        checkpoint = self.read_checkpoint()
+        if checkpoint["progress"] or checkpoint["completed"]:
+            self.write("Resuming reference index rebuild")
+        else:
+            self.write("Rebuilding reference index")
+
+        # Split the objects of each model into ranges of primary keys to
+        # index, starting after those indexed before an interruption
+        ranges = []
+        self.pending = {}
+        self.completed = {}
+        for model in indexed_models:
+            label = model._meta.label
+            if label in checkpoint["completed"]:
+                continue
+
+            after_pk = checkpoint["progress"].get(label)
+            if after_pk is not None:
+                after_pk = model._meta.pk.to_python(after_pk)
+
+            self.pending[label] = deque()
+            self.completed[label] = set()
+            for upto_pk in self.get_range_ends(model, after_pk, chunk_size):
+                ranges.append((label, after_pk, upto_pk))
+                self.pending[label].append(upto_pk)
+                after_pk = upto_pk
+
+            if not self.pending[label]:
+                self.complete_range(checkpoint, label)
+
+        object_count = 0
+        if workers == 1:
+            for label, after_pk, upto_pk in self.print_iter_progress(ranges):
+                count, _ = index_objects(label, after_pk, upto_pk)
+                object_count += count
+                self.complete_range(checkpoint, label, upto_pk)
+        else:
+            # Processes forked from this one must not share its connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker
+            ) as executor:
+                futures = [
+                    executor.submit(index_objects_in_worker, *range) for range in ranges
+                ]
+                for future in self.print_iter_progress(as_completed(futures)):
+                    label, upto_pk, count = future.result()
+                    object_count += count
+                    self.complete_range(checkpoint, label, upto_pk)
+
         self.print_newline()
+        self.delete_stale_references(indexed_models)
+
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        return object_count
+
+    def get_range_ends(self, model, after_pk, chunk_size):
+        """
+        Yields the last primary key of each chunk of ``chunk_size`` objects of
+        ``model`` after ``after_pk``
+        """
+        queryset = model.objects.order_by("pk").values_list("pk", flat=True)
+        while True:
+            chunk_queryset = queryset
+            if after_pk is not None:
+                chunk_queryset = queryset.filter(pk__gt=after_pk)
+
+            pks = list(chunk_queryset[:chunk_size])
+            if not pks:
+                return
+
+            after_pk = pks[-1]
+            yield after_pk
+
+    def complete_range(self, checkpoint, label, upto_pk=None):
+        """
+        Record that the range of objects of ``label`` up to ``upto_pk`` has been
+        indexed, moving the model's progress in the checkpoint on past any
+        ranges that have been indexed without a gap
+        """
+        pending = self.pending[label]
+        completed = self.completed[label]
+        if upto_pk is not None:
+            completed.add(upto_pk)
+
+        while pending and pending[0] in completed:
+            checkpoint["progress"][label] = pending.popleft()
+
+        if not pending:
+            checkpoint["progress"].pop(label, None)
+            checkpoint["completed"].append(label)
+
+        self.write_checkpoint(checkpoint)
+
+    def delete_stale_references(self, indexed_models):
+        """
+        Delete references recorded for objects that no longer exist, or for
+        models that are no longer indexed
+        """
+        base_models = {}
+        for model in indexed_models:
+            # References from models using multi-table inheritance are
+            # recorded under their base model
+            parents = model._meta.get_parent_list()
+            base_model = parents[-1] if parents else model
+            base_models[ReferenceIndex._get_base_content_type(model).pk] = base_model
+
+        ReferenceIndex.objects.exclude(base_content_type__in=list(base_models)).delete()
+
+        for base_content_type_id, base_model in base_models.items():
+            ReferenceIndex.objects.filter(
+                base_content_type_id=base_content_type_id
+            ).exclude(
+                object_id__in=base_model._base_manager.values_list(
+                    Cast("pk", output_field=models.CharField()), flat=True
+                )
+            ).delete()
+
+    def read_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                return json.load(f)
+
+        return {"progress": {}, "completed": []}
+
+    def write_checkpoint(self, checkpoint):
+        if not self.checkpoint_path:
+            return
+
+        # Write to a temporary file first, so that an interruption while
+        # writing doesn't leave a corrupt checkpoint
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(checkpoint, f, cls=DjangoJSONEncoder)
+        os.replace(temp_path, self.checkpoint_path)
 
     def print_newline(self):
         self.write("")
@@ -87,20 +340,3 @@ class Command(BaseCommand):
                 self.write(" ", ending="")
 
             self.stdout.flush()
-
-    # Atomic so the count of models doesn't change as it is iterated
-    @transaction.atomic
-    def queryset_chunks(self, qs, chunk_size=DEFAULT_CHUNK_SIZE):
-        """
-        Yield a queryset in chunks of at most ``chunk_size``. The chunk yielded
-        will be a list, not a queryset. Iterating over the chunks is done in a
-        transaction so that the order and count of items in the queryset
-        remains stable.
-        """
-        i = 0
-        while True:
-            items = list(qs[i * chunk_size :][:chunk_size])
-            if not items:
-                break
-            yield items
-            i += 1
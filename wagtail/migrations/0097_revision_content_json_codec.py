@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:02
+
+from django.db import migrations, models
+
+import wagtail.utils.json
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtailcore", "0096_referenceindex_referenceindex_source_object_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="revision",
+            name="content",
+            field=models.JSONField(
+                decoder=wagtail.utils.json.CodecJSONDecoder,
+                encoder=wagtail.utils.json.CodecJSONEncoder,
+                verbose_name="content JSON",
+            ),
+        ),
+    ]
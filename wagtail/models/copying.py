@@ -56,14 +56,15 @@ def _extract_field_data(source, exclude_fields=None):
     return data_dict
 
 
-def _copy_m2m_relations(source, target, exclude_fields=None, update_attrs=None):
+def _get_m2m_fields_to_copy(model, exclude_fields=None):
     """
-    Copies non-ParentalManyToMany m2m relations
+    Returns the non-ParentalManyToMany m2m fields of the model that are copied
+    by _copy_m2m_relations
     """
-    update_attrs = update_attrs or {}
     exclude_fields = exclude_fields or []
+    fields = []
 
-    for field in source._meta.get_fields():
+    for field in model._meta.get_fields():
         # Copy m2m relations. Ignore explicitly excluded fields, reverse relations, and Parental m2m fields.
         if (
             field.many_to_many
@@ -77,20 +78,32 @@ def _copy_m2m_relations(source, target, exclude_fields=None, update_attrs=None):
                     field
                     for field in field.through._meta.get_fields()
                     if isinstance(field, ParentalKey)
-                    and issubclass(source.__class__, field.related_model)
+                    and issubclass(model, field.related_model)
                 ]
                 if through_model_parental_links:
                     continue
             except AttributeError:
                 pass
 
-            if field.name in update_attrs:
-                value = update_attrs[field.name]
+            fields.append(field)
+
+    return fields
+
+
+def _copy_m2m_relations(source, target, exclude_fields=None, update_attrs=None):
+    """
+    Copies non-ParentalManyToMany m2m relations
+    """
+    update_attrs = update_attrs or {}
+
+    for field in _get_m2m_fields_to_copy(source.__class__, exclude_fields):
+        if field.name in update_attrs:
+            value = update_attrs[field.name]
 
-            else:
-                value = getattr(source, field.name).all()
+        else:
+            value = getattr(source, field.name).all()
 
-            getattr(target, field.name).set(value)
+        getattr(target, field.name).set(value)
 
 
 def _copy(source, exclude_fields=None, update_attrs=None):
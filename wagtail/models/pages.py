@@ -4,6 +4,7 @@ import functools
 import logging
 import posixpath
 import uuid
+from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
@@ -25,6 +26,7 @@ from django.urls import NoReverseMatch, reverse
 from django.utils import translation as translation
 from django.utils.encoding import force_bytes, force_str
 from django.utils.functional import Promise, cached_property
+from django.utils.http import RFC3986_SUBDELIMS
 from django.utils.log import log_response
 from django.utils.text import capfirst, slugify
 from django.utils.translation import gettext_lazy as _
@@ -41,6 +43,7 @@ from wagtail.actions.delete_page import DeletePageAction
 from wagtail.actions.move_page import MovePageAction
 from wagtail.actions.publish_page_revision import PublishPageRevisionAction
 from wagtail.actions.unpublish_page import UnpublishPageAction
+from wagtail.actions.update_aliases import UpdatePageAliasesAction
 from wagtail.compat import HTTPMethod
 from wagtail.coreutils import (
     WAGTAIL_APPEND_SLASH,
@@ -58,7 +61,7 @@ from wagtail.signals import (
     page_slug_changed,
     pre_validate_delete,
 )
-from wagtail.url_routing import RouteResult
+from wagtail.url_routing import RouteResult, route_cache
 from wagtail.utils.timestamps import ensure_utc
 
 from .audit_log import BaseLogEntry, BaseLogEntryManager, LogEntryQuerySet
@@ -503,11 +506,16 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                     path_components = [
                         component for component in path.split("/") if component
                     ]
-                    request._wagtail_route_for_request = (
-                        site.root_page.localized.specific.route(
-                            request, path_components
+                    if getattr(settings, "WAGTAIL_ROUTE_CACHE", False):
+                        request._wagtail_route_for_request = route_cache.route(
+                            request, site, path_components
+                        )
+                    else:
+                        request._wagtail_route_for_request = (
+                            site.root_page.localized.specific.route(
+                                request, path_components
+                            )
                         )
-                    )
                 else:
                     request._wagtail_route_for_request = None
             except Http404:
@@ -782,6 +790,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         # always check if this page is a site root, even if it's new.
         if self.is_site_root():
             Site.clear_site_root_paths_cache()
+            Site.clear_site_hostname_index()
 
         # Log
         if is_new:
@@ -1049,7 +1058,9 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         else:
             return self.specific
 
-    def update_aliases(self, *, revision=None, _content=None, _updated_ids=None):
+    def update_aliases(
+        self, *, revision=None, bulk=False, _content=None, _updated_ids=None
+    ):
         """
         Publishes all aliases that follow this page with the latest content from this page.
 
@@ -1057,7 +1068,18 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
 
         :param revision: The revision of the original page that we are updating to (used for logging purposes)
         :type revision: Revision, Optional
+        :param bulk: Update the aliases in bulk with :class:`~wagtail.actions.update_aliases.UpdatePageAliasesAction`,
+            a level of the alias chain at a time, rather than saving each one in turn
+        :type bulk: boolean, Optional
         """
+        if bulk:
+            return UpdatePageAliasesAction(
+                self,
+                revision=revision,
+                content=_content,
+                updated_ids=_updated_ids,
+            ).execute()
+
         specific_self = self.specific
 
         # Only compute this if necessary since it's quite a heavy operation
@@ -1315,6 +1337,42 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         when calling ``super``.
         """
 
+        site_root_path = self._get_url_site_root_path(request)
+
+        if site_root_path is None:
+            return None
+
+        site_id, root_path, root_url, language_code = site_root_path
+
+        # The page may not be routable because wagtail_serve is not registered
+        # This may be the case if Wagtail is used headless
+        try:
+            if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
+                with translation.override(language_code):
+                    page_path = reverse(
+                        "wagtail_serve", args=(self.url_path[len(root_path) :],)
+                    )
+            else:
+                page_path = reverse(
+                    "wagtail_serve", args=(self.url_path[len(root_path) :],)
+                )
+        except NoReverseMatch:
+            return (site_id, None, None)
+
+        # Remove the trailing slash from the URL reverse generates if
+        # WAGTAIL_APPEND_SLASH is False and we're not trying to serve
+        # the root path
+        if not WAGTAIL_APPEND_SLASH and page_path != "/":
+            page_path = page_path.rstrip("/")
+
+        return (site_id, root_url, page_path)
+
+    def _get_url_site_root_path(self, request=None):
+        """
+        Return the ``(site_id, root_path, root_url, language_code)`` values that
+        ``get_url_parts`` should build this page's URL from, or ``None`` if the
+        page is not within any site.
+        """
         possible_sites = self._get_relevant_site_root_paths(request)
 
         if not possible_sites:
@@ -1336,9 +1394,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                         site_id, root_path, root_url, language_code = values
                         break
 
-        use_wagtail_i18n = getattr(settings, "WAGTAIL_I18N_ENABLED", False)
-
-        if use_wagtail_i18n:
+        if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
             # If the active language code is a variant of the page's language, then
             # use that instead
             # This is used when LANGUAGES contain more languages than WAGTAIL_CONTENT_LANGUAGES
@@ -1353,28 +1409,140 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                 # page's language code unchanged
                 pass
 
-        # The page may not be routable because wagtail_serve is not registered
-        # This may be the case if Wagtail is used headless
-        try:
+        return (site_id, root_path, root_url, language_code)
+
+    @staticmethod
+    def _share_site_root_paths(pages):
+        """
+        Cache a single copy of ``Site.get_site_root_paths()`` on each of the
+        given pages that don't already have one, for use when no request is
+        available to cache it on.
+        """
+        site_root_paths = None
+        for page in pages:
+            if not hasattr(page, "_wagtail_cached_site_root_paths"):
+                if site_root_paths is None:
+                    site_root_paths = Site.get_site_root_paths()
+                page._wagtail_cached_site_root_paths = site_root_paths
+
+    @staticmethod
+    def get_url_parts_for_pages(pages, request=None):
+        """
+        Return a list of ``get_url_parts()`` results for the given pages, in
+        the same order.
+
+        Rather than reversing the ``wagtail_serve`` URL for every page, this
+        reverses it once per language and appends each page's path to the
+        resulting prefix, making it considerably faster for long lists of pages
+        such as menus. Pages whose class overrides ``get_url_parts`` are passed
+        to that method individually.
+        """
+        pages = list(pages)
+        use_wagtail_i18n = getattr(settings, "WAGTAIL_I18N_ENABLED", False)
+
+        if request is None:
+            Page._share_site_root_paths(pages)
+
+        # Maps language codes to the URL prefix that wagtail_serve reverses to, or
+        # None if the URL prefix can't be used and each page must be reversed in full
+        prefixes = {}
+
+        def reverse_page_path(path, language_code):
             if use_wagtail_i18n:
                 with translation.override(language_code):
-                    page_path = reverse(
-                        "wagtail_serve", args=(self.url_path[len(root_path) :],)
-                    )
-            else:
-                page_path = reverse(
-                    "wagtail_serve", args=(self.url_path[len(root_path) :],)
+                    return reverse("wagtail_serve", args=(path,))
+            return reverse("wagtail_serve", args=(path,))
+
+        def get_page_path(path, language_code):
+            if language_code not in prefixes:
+                page_path = reverse_page_path(path, language_code)
+                prefix = reverse_page_path("", language_code)
+                # Only rely on the prefix if it produces exactly the same URL
+                # as reversing the full path would
+                if page_path != prefix + quote(path, safe=RFC3986_SUBDELIMS + "/~:@"):
+                    prefix = None
+                prefixes[language_code] = prefix
+                return page_path
+
+            prefix = prefixes[language_code]
+            if prefix is None:
+                return reverse_page_path(path, language_code)
+            return prefix + quote(path, safe=RFC3986_SUBDELIMS + "/~:@")
+
+        results = []
+        for page in pages:
+            if type(page).get_url_parts is not Page.get_url_parts:
+                results.append(page.get_url_parts(request=request))
+                continue
+
+            site_root_path = page._get_url_site_root_path(request)
+            if site_root_path is None:
+                results.append(None)
+                continue
+
+            site_id, root_path, root_url, language_code = site_root_path
+            try:
+                page_path = get_page_path(
+                    page.url_path[len(root_path) :], language_code
                 )
-        except NoReverseMatch:
-            return (site_id, None, None)
+            except NoReverseMatch:
+                results.append((site_id, None, None))
+                continue
 
-        # Remove the trailing slash from the URL reverse generates if
-        # WAGTAIL_APPEND_SLASH is False and we're not trying to serve
-        # the root path
-        if not WAGTAIL_APPEND_SLASH and page_path != "/":
-            page_path = page_path.rstrip("/")
+            if not WAGTAIL_APPEND_SLASH and page_path != "/":
+                page_path = page_path.rstrip("/")
 
-        return (site_id, root_url, page_path)
+            results.append((site_id, root_url, page_path))
+
+        return results
+
+    @staticmethod
+    def get_urls_for_pages(pages, request=None, current_site=None):
+        """
+        Return a list of ``get_url()`` results for the given pages, in the same
+        order, using ``get_url_parts_for_pages`` to compute the URLs together.
+        Pages whose class overrides ``get_url`` are passed to that method
+        individually.
+        """
+        pages = list(pages)
+
+        if current_site is None and request is not None:
+            current_site = Site.find_for_request(request)
+
+        if not pages:
+            return []
+
+        if request is None:
+            Page._share_site_root_paths(pages)
+
+        # Get number of unique sites in root paths
+        # Note: there may be more root paths to sites if there are multiple languages
+        num_sites = len(
+            {root_path[0] for root_path in pages[0]._get_site_root_paths(request)}
+        )
+
+        all_url_parts = Page.get_url_parts_for_pages(pages, request=request)
+
+        urls = []
+        for page, url_parts in zip(pages, all_url_parts):
+            if type(page).get_url is not Page.get_url:
+                urls.append(page.get_url(request=request, current_site=current_site))
+                continue
+
+            if url_parts is None or url_parts[1] is None and url_parts[2] is None:
+                # page is not routable
+                urls.append(None)
+                continue
+
+            site_id, root_url, page_path = url_parts
+            if (
+                current_site is not None and site_id == current_site.id
+            ) or num_sites == 1:
+                urls.append(page_path)
+            else:
+                urls.append(root_url + page_path)
+
+        return urls
 
     def get_full_url(self, request=None):
         """
@@ -1672,11 +1840,13 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         exclude_fields=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
     ):
         """
         Copies a given page
 
         :param log_action: flag for logging the action. Pass None to skip logging. Can be passed an action string. Defaults to ``'wagtail.copy'``.
+        :param bulk: when copying recursively, copy the descendants in batches with a few queries per batch, rather than several per page. Their ``save`` methods aren't called.
         """
         return CopyPageAction(
             self,
@@ -1690,6 +1860,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             process_child_object=process_child_object,
             log_action=log_action,
             reset_translation_key=reset_translation_key,
+            bulk=bulk,
         ).execute(skip_permission_checks=True)
 
     copy.alters_data = True
@@ -2530,9 +2701,9 @@ class PageLogEntryManager(BaseLogEntryManager):
     def get_instance_title(self, instance):
         return instance.specific_deferred.get_admin_display_title()
 
-    def log_action(self, instance, action, **kwargs):
+    def build_log_entry(self, instance, action, **kwargs):
         kwargs.update(page=instance)
-        return super().log_action(instance, action, **kwargs)
+        return super().build_log_entry(instance, action, **kwargs)
 
     def viewable_by_user(self, user):
         from wagtail.permissions import page_permission_policy
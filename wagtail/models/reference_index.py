@@ -115,6 +115,67 @@ class ReferenceIndexQuerySet(models.QuerySet):
         }
 
 
+class ReferenceExtractionPlan:
+    """
+    The fields and child relations of a model that may contain references,
+    found from the model's fields and the block definitions of its StreamFields
+    once, rather than every time references are extracted from an object.
+    """
+
+    FOREIGN_KEY = "foreign_key"
+    GENERIC_FOREIGN_KEY = "generic_foreign_key"
+    CONTENT = "content"
+
+    def __init__(self, model):
+        # A list of (kind, field) tuples, in the order of the model's fields
+        self.fields = []
+
+        # The accessor names of the child relations whose objects may contain
+        # references
+        self.child_relations = []
+
+        # The ParentalKey linking objects of the model to their parent object,
+        # if the model is a child model
+        self.parental_key = None
+
+        for field in model._meta.get_fields():
+            if isinstance(field, ParentalKey) and self.parental_key is None:
+                self.parental_key = field
+
+            if field.is_relation and field.many_to_one:
+                if getattr(field, "wagtail_reference_index_ignore", False):
+                    continue
+
+                if getattr(
+                    field.related_model, "wagtail_reference_index_ignore", False
+                ):
+                    continue
+
+                if isinstance(field, (ParentalKey, GenericRel)):
+                    continue
+
+                if isinstance(field, GenericForeignKey):
+                    self.fields.append((self.GENERIC_FOREIGN_KEY, field))
+                else:
+                    self.fields.append((self.FOREIGN_KEY, field))
+
+            if hasattr(field, "extract_references"):
+                # Skip StreamFields without any blocks that can contain references
+                if isinstance(field, StreamField) and not (
+                    field.stream_block.can_contain_references
+                ):
+                    continue
+
+                self.fields.append((self.CONTENT, field))
+
+        if issubclass(model, ClusterableModel):
+            for child_relation in get_all_child_relations(model):
+                if ReferenceIndex.model_is_indexable(
+                    child_relation.related_model, allow_child_models=True
+                ):
+                    self.child_relations.append(child_relation.get_accessor_name())
+
+
 class ReferenceIndex(models.Model):
     """
     Records references between objects for quick retrieval of object usage.
@@ -195,6 +256,10 @@ class ReferenceIndex(models.Model):
     # by ParentalKey (object references on those are recorded under the parent).
     indexed_models = set()
 
+    # The ReferenceExtractionPlan for each model that references have been
+    # extracted from, keyed by model
+    _extraction_plans = {}
+
     class Meta:
         unique_together = [
             (
@@ -348,46 +413,34 @@ class ReferenceIndex(models.Model):
             content_path (str): The path to the piece of content on the source
                                 object instance where the reference was found
         """
-        # Extract references from fields
-        for field in object._meta.get_fields():
-            if field.is_relation and field.many_to_one:
-                if getattr(field, "wagtail_reference_index_ignore", False):
-                    continue
-
-                if getattr(
-                    field.related_model, "wagtail_reference_index_ignore", False
-                ):
-                    continue
+        plan = cls._get_extraction_plan(type(object))
 
-                if isinstance(field, (ParentalKey, GenericRel)):
-                    continue
-
-                if isinstance(field, GenericForeignKey):
-                    ct_field = object._meta.get_field(field.ct_field)
-                    fk_field = object._meta.get_field(field.fk_field)
-                    ct_value = ct_field.value_from_object(object)
-                    fk_value = fk_field.value_from_object(object)
-
-                    if ct_value is not None and fk_value is not None:
-                        # The content type ID referenced by the GenericForeignKey might be a subclassed
-                        # model, but the reference index requires us to index it under the base model's
-                        # content type, as that's what will be used for lookups. So, we need to convert
-                        # the content type back to a model class so that _get_base_content_type can
-                        # select the appropriate superclass if necessary, before converting back to a
-                        # content type.
-                        model = ContentType.objects.get_for_id(ct_value).model_class()
-                        yield (
-                            cls._get_base_content_type(model).id,
-                            str(fk_value),
-                            field.name,
-                            field.name,
-                        )
-
-                    continue
+        # Extract references from fields
+        for kind, field in plan.fields:
+            if kind == ReferenceExtractionPlan.GENERIC_FOREIGN_KEY:
+                ct_value = object._meta.get_field(field.ct_field).value_from_object(
+                    object
+                )
+                fk_value = object._meta.get_field(field.fk_field).value_from_object(
+                    object
+                )
 
-                if isinstance(field, GenericRel):
-                    continue
+                if ct_value is not None and fk_value is not None:
+                    # The content type ID referenced by the GenericForeignKey might be a subclassed
+                    # model, but the reference index requires us to index it under the base model's
+                    # content type, as that's what will be used for lookups. So, we need to convert
+                    # the content type back to a model class so that _get_base_content_type can
+                    # select the appropriate superclass if necessary, before converting back to a
+                    # content type.
+                    model = ContentType.objects.get_for_id(ct_value).model_class()
+                    yield (
+                        cls._get_base_content_type(model).id,
+                        str(fk_value),
+                        field.name,
+                        field.name,
+                    )
 
+            elif kind == ReferenceExtractionPlan.FOREIGN_KEY:
                 value = field.value_from_object(object)
                 if value is not None:
                     yield (
@@ -397,7 +450,7 @@ class ReferenceIndex(models.Model):
                         field.name,
                     )
 
-            if hasattr(field, "extract_references"):
+            else:
                 value = field.value_from_object(object)
                 if value is not None:
                     yield from (
@@ -413,23 +466,33 @@ class ReferenceIndex(models.Model):
                     )
 
         # Extract references from child relations
-        if isinstance(object, ClusterableModel):
-            for child_relation in get_all_child_relations(object):
-                relation_name = child_relation.get_accessor_name()
-                child_objects = getattr(object, relation_name).all()
-
-                for child_object in child_objects:
-                    yield from (
-                        (
-                            to_content_type_id,
-                            to_object_id,
-                            f"{relation_name}.item.{model_path}",
-                            f"{relation_name}.{str(child_object.pk)}.{content_path}",
-                        )
-                        for to_content_type_id, to_object_id, model_path, content_path in cls._extract_references_from_object(
-                            child_object
-                        )
+        for relation_name in plan.child_relations:
+            child_objects = getattr(object, relation_name).all()
+
+            for child_object in child_objects:
+                yield from (
+                    (
+                        to_content_type_id,
+                        to_object_id,
+                        f"{relation_name}.item.{model_path}",
+                        f"{relation_name}.{str(child_object.pk)}.{content_path}",
+                    )
+                    for to_content_type_id, to_object_id, model_path, content_path in cls._extract_references_from_object(
+                        child_object
                     )
+                )
+
+    @classmethod
+    def _get_extraction_plan(cls, model):
+        """
+        Returns the ReferenceExtractionPlan for the given model, which is only
+        worked out the first time it is needed.
+        """
+        try:
+            return cls._extraction_plans[model]
+        except KeyError:
+            plan = cls._extraction_plans[model] = ReferenceExtractionPlan(model)
+            return plan
 
     @classmethod
     def _get_content_path_hash(cls, content_path):
@@ -462,54 +525,105 @@ class ReferenceIndex(models.Model):
         Args:
             object (Model): The model instance to create/update ReferenceIndex records for
         """
+        cls.create_or_update_for_objects([object])
+
+    @classmethod
+    def create_or_update_for_objects(cls, objects):
+        """
+        Creates or updates ReferenceIndex records for the given objects, finding
+        their existing records with one query, and adding and deleting records
+        with one query each.
+
+        Note: This method must be called within a `django.db.transaction.atomic()` block.
+
+        Args:
+            objects: An iterable of model instances to create/update ReferenceIndex records
+                     for, which may be of different models
+        """
         # For the purpose of this method, a "reference record" is a tuple of
         # (to_content_type_id, to_object_id, model_path, content_path) - the properties that
         # uniquely define a reference
 
-        # Extract new references and construct a set of reference records
-        references = set(cls._extract_references_from_object(object))
+        # Extract new references for each object, keyed by (base_content_type_id, object_id)
+        references_by_object = {}
+        content_types_by_model = {}
+        for object in objects:
+            model = type(object)
+            if model not in content_types_by_model:
+                # Find content types for this model and all of its ancestor classes,
+                # ordered from most to least specific
+                content_types_by_model[model] = [
+                    ContentType.objects.get_for_model(
+                        model_or_object, for_concrete_model=False
+                    )
+                    for model_or_object in ([model] + model._meta.get_parent_list())
+                ]
+            content_types = content_types_by_model[model]
+
+            references_by_object[(content_types[-1].id, str(object.pk))] = (
+                object,
+                content_types,
+                set(cls._extract_references_from_object(object)),
+            )
 
-        # Find content types for this model and all of its ancestor classes,
-        # ordered from most to least specific
-        content_types = [
-            ContentType.objects.get_for_model(model_or_object, for_concrete_model=False)
-            for model_or_object in ([object] + object._meta.get_parent_list())
-        ]
-        content_type = content_types[0]
-        base_content_type = content_types[-1]
-        known_content_type_ids = [ct.id for ct in content_types]
+        if not references_by_object:
+            return
 
         # Find existing references in the database so we know what to add/delete.
-        # Construct a dict mapping reference records to the (content_type_id, id) pair that the
-        # existing database entry is found under
-        existing_references = {
-            (to_content_type_id, to_object_id, model_path, content_path): (
+        # Construct a dict mapping each object to a dict of the reference records to
+        # the (content_type_id, id) pair that the existing database entry is found under
+        object_ids_by_base_content_type = {}
+        for base_content_type_id, object_id in references_by_object:
+            object_ids_by_base_content_type.setdefault(base_content_type_id, []).append(
+                object_id
+            )
+
+        condition = models.Q()
+        for base_content_type_id, object_ids in object_ids_by_base_content_type.items():
+            condition |= models.Q(
+                base_content_type_id=base_content_type_id, object_id__in=object_ids
+            )
+
+        existing_references_by_object = {}
+        for (
+            id,
+            content_type_id,
+            base_content_type_id,
+            object_id,
+            to_content_type_id,
+            to_object_id,
+            model_path,
+            content_path,
+        ) in cls.objects.filter(condition).values_list(
+            "id",
+            "content_type_id",
+            "base_content_type_id",
+            "object_id",
+            "to_content_type",
+            "to_object_id",
+            "model_path",
+            "content_path",
+        ):
+            existing_references_by_object.setdefault(
+                (base_content_type_id, object_id), {}
+            )[(to_content_type_id, to_object_id, model_path, content_path)] = (
                 content_type_id,
                 id,
             )
-            for id, content_type_id, to_content_type_id, to_object_id, model_path, content_path in cls.objects.filter(
-                base_content_type=base_content_type, object_id=object.pk
-            ).values_list(
-                "id",
-                "content_type_id",
-                "to_content_type",
-                "to_object_id",
-                "model_path",
-                "content_path",
-            )
-        }
 
-        # Construct the set of reference records that have been found on the object but are not
-        # already present in the database
-        new_references = references - set(existing_references.keys())
+        new_records = []
+        deleted_reference_ids = []
+        for key, (object, content_types, references) in references_by_object.items():
+            content_type = content_types[0]
+            base_content_type = content_types[-1]
+            known_content_type_ids = [ct.id for ct in content_types]
+            existing_references = existing_references_by_object.get(key, {})
 
-        bulk_create_kwargs = {}
-        if connection.features.supports_ignore_conflicts:
-            bulk_create_kwargs["ignore_conflicts"] = True
+            # Construct the set of reference records that have been found on the object but are not
+            # already present in the database
+            new_references = references - set(existing_references.keys())
 
-        # Create database records for those reference records
-        cls.objects.bulk_create(
-            [
+            new_records.extend(
                 cls(
                     content_type=content_type,
                     base_content_type=base_content_type,
@@ -521,33 +635,37 @@ class ReferenceIndex(models.Model):
                     content_path_hash=cls._get_content_path_hash(content_path),
                 )
                 for to_content_type_id, to_object_id, model_path, content_path in new_references
-            ],
-            **bulk_create_kwargs,
-        )
+            )
 
-        # Delete removed references
-        deleted_reference_ids = []
-        # Look at the reference record and the supporting content_type / id for each existing
-        # reference in the database
-        for reference_data, (content_type_id, id) in existing_references.items():
-            if reference_data in references:
-                # Do not delete this reference, as it is still present in the new set
-                continue
-
-            if content_type_id not in known_content_type_ids:
-                # The content type for the existing record does not match the current model or any
-                # superclass. We can infer that the existing record is for a more specific subclass
-                # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
-                # the existing reference was recorded against <BlogPage id=123>. In this case, do
-                # not treat the missing reference as a deletion - it likely still exists, but on a
-                # relation which can only be seen on the more specific model.
-                continue
-
-            # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
-            deleted_reference_ids.append(id)
+            # Look at the reference record and the supporting content_type / id for each existing
+            # reference in the database
+            for reference_data, (content_type_id, id) in existing_references.items():
+                if reference_data in references:
+                    # Do not delete this reference, as it is still present in the new set
+                    continue
+
+                if content_type_id not in known_content_type_ids:
+                    # The content type for the existing record does not match the current model or any
+                    # superclass. We can infer that the existing record is for a more specific subclass
+                    # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
+                    # the existing reference was recorded against <BlogPage id=123>. In this case, do
+                    # not treat the missing reference as a deletion - it likely still exists, but on a
+                    # relation which can only be seen on the more specific model.
+                    continue
+
+                # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
+                deleted_reference_ids.append(id)
+
+        bulk_create_kwargs = {}
+        if connection.features.supports_ignore_conflicts:
+            bulk_create_kwargs["ignore_conflicts"] = True
+
+        # Create database records for those reference records
+        cls.objects.bulk_create(new_records, **bulk_create_kwargs)
 
         # Perform the deletion
-        cls.objects.filter(id__in=deleted_reference_ids).delete()
+        if deleted_reference_ids:
+            cls.objects.filter(id__in=deleted_reference_ids).delete()
 
     @classmethod
     def remove_for_object(cls, object):
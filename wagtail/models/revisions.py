@@ -3,7 +3,6 @@ import logging
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models import Q
 from django.db.models.expressions import OuterRef, Subquery
@@ -16,6 +15,7 @@ from modelcluster.models import (
 )
 
 from wagtail.log_actions import log
+from wagtail.utils.json import CodecJSONDecoder, CodecJSONEncoder
 from wagtail.utils.timestamps import ensure_utc
 
 from .content_types import get_default_page_content_type
@@ -105,7 +105,9 @@ class Revision(models.Model):
     )
     object_str = models.TextField(default="")
     content = models.JSONField(
-        verbose_name=_("content JSON"), encoder=DjangoJSONEncoder
+        verbose_name=_("content JSON"),
+        encoder=CodecJSONEncoder,
+        decoder=CodecJSONDecoder,
     )
     approved_go_live_at = models.DateTimeField(
         verbose_name=_("approved go live at"), null=True, blank=True, db_index=True
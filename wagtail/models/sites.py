@@ -1,3 +1,5 @@
+import copy
+import uuid
 from collections import namedtuple
 
 from django.apps import apps
@@ -45,6 +47,16 @@ def get_site_for_hostname(hostname, port):
         .select_related("root_page")
     )
 
+    return _choose_best_site_match(sites)
+
+
+def _choose_best_site_match(sites):
+    """
+    Given a list of candidate sites annotated with a ``match`` attribute and
+    sorted by it, return the one that should handle the request.
+    """
+    Site = apps.get_model("wagtailcore.Site")
+
     if sites:
         # if there's a unique match or hostname (with port or default) match
         if len(sites) == 1 or sites[0].match in (
@@ -62,6 +74,87 @@ def get_site_for_hostname(hostname, port):
     raise Site.DoesNotExist()
 
 
+SITE_HOSTNAME_INDEX_VERSION_CACHE_KEY = "wagtail_site_hostname_index_version"
+
+
+class SiteHostnameIndex:
+    """
+    A process-local copy of all Site records, used by ``Site.find_for_request``
+    to resolve a hostname and port without querying the database when the
+    ``WAGTAIL_SITE_HOSTNAME_INDEX`` setting is enabled.
+
+    The index is tagged with a version token held in the shared Django cache;
+    invalidating the index writes a new token, so that every process rebuilds
+    its copy on the next lookup.
+    """
+
+    def __init__(self):
+        # A (version, sites) tuple, replaced as a whole so that concurrent
+        # threads never see a version paired with the wrong list of sites
+        self._index = (None, None)
+
+    def _get_current_version(self):
+        version = cache.get(SITE_HOSTNAME_INDEX_VERSION_CACHE_KEY)
+        if version is None:
+            # Nothing has invalidated the index since the cache was last cleared;
+            # agree on a version with any other processes doing the same
+            cache.add(SITE_HOSTNAME_INDEX_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+            version = cache.get(SITE_HOSTNAME_INDEX_VERSION_CACHE_KEY)
+        return version
+
+    def get_sites(self):
+        Site = apps.get_model("wagtailcore.Site")
+
+        version = self._get_current_version()
+        index_version, sites = self._index
+        if sites is None or version is None or version != index_version:
+            sites = list(Site.objects.select_related("root_page"))
+            self._index = (version, sites)
+        return sites
+
+    def find(self, hostname, port):
+        """
+        Return a copy of the Site that ``get_site_for_hostname(hostname, port)``
+        would return, or raise ``Site.DoesNotExist``.
+        """
+        try:
+            # The port may come straight from the request, where it is a string
+            port = int(port)
+        except (TypeError, ValueError):
+            port = None
+
+        candidates = []
+        for site in self.get_sites():
+            if site.hostname == hostname:
+                if site.port == port:
+                    match = MATCH_HOSTNAME_PORT
+                elif site.is_default_site:
+                    match = MATCH_HOSTNAME_DEFAULT
+                else:
+                    match = MATCH_HOSTNAME
+            elif site.is_default_site:
+                match = MATCH_DEFAULT
+            else:
+                continue
+            candidates.append((match, site))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        sites = []
+        for match, site in candidates:
+            # Hand out copies, so that callers can't modify the shared instances
+            site = copy.deepcopy(site)
+            site.match = match
+            sites.append(site)
+        return _choose_best_site_match(sites)
+
+    def invalidate(self):
+        cache.set(SITE_HOSTNAME_INDEX_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        self._index = (None, None)
+
+
+site_hostname_index = SiteHostnameIndex()
+
+
 class SiteManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().order_by(Lower("hostname"))
@@ -166,7 +259,10 @@ class Site(models.Model):
         port = request.get_port()
         site = None
         try:
-            site = get_site_for_hostname(hostname, port)
+            if getattr(settings, "WAGTAIL_SITE_HOSTNAME_INDEX", False):
+                site = site_hostname_index.find(hostname, port)
+            else:
+                site = get_site_for_hostname(hostname, port)
         except Site.DoesNotExist:
             pass
             # copy old SiteMiddleware behaviour
@@ -270,6 +366,10 @@ class Site(models.Model):
     def clear_site_root_paths_cache():
         cache.delete(SITE_ROOT_PATHS_CACHE_KEY, version=SITE_ROOT_PATHS_CACHE_VERSION)
 
+    @staticmethod
+    def clear_site_hostname_index():
+        site_hostname_index.invalidate()
+
 
 class GroupSitePermissionManager(models.Manager):
     def get_by_natural_key(self, group, site, permission):
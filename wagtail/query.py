@@ -6,7 +6,8 @@ from typing import Any
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import CharField, Prefetch, Q
+from django.db.models import CharField, Prefetch, Q, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Cast, Length, Substr
 from django.db.models.query import ModelIterable
@@ -160,17 +161,24 @@ class SpecificQuerySetMixin:
         )
         return clone
 
-    def specific(self, defer=False):
+    def specific(self, defer=False, reuse_base_fields=False):
         """
         This efficiently gets all the specific items for the queryset, using
         the minimum number of queries.
 
         When the "defer" keyword argument is set to True, only generic
         field values will be loaded and all specific fields will be deferred.
+
+        When the "reuse_base_fields" keyword argument is set to True, the
+        queryset's own query loads the generic field values, and only the
+        fields added by each specific model are then fetched, with one query
+        per specific model.
         """
         clone = self._clone()
         if defer:
             clone._iterable_class = DeferredSpecificIterable
+        elif reuse_base_fields:
+            clone._iterable_class = BaseFieldsSpecificIterable
         else:
             clone._iterable_class = SpecificIterable
         return clone
@@ -182,7 +190,7 @@ class SpecificQuerySetMixin:
         """
         return issubclass(
             self._iterable_class,
-            (SpecificIterable, DeferredSpecificIterable),
+            (SpecificIterable, BaseFieldsSpecificIterable, DeferredSpecificIterable),
         )
 
     def select_related(self, *fields, for_specific_subqueries: bool = False):
@@ -769,6 +777,200 @@ class SpecificIterable(ModelIterable):
                 yield tuple(current_chunk)
 
 
+class BaseFieldsSpecificIterable(SpecificIterable):
+    def __iter__(self):
+        """
+        Fetch the field values of the queryset's model for the items in the
+        queryset, then fetch only the fields that each specific model adds to
+        it, and create the specific items from both. Unlike SpecificIterable,
+        this doesn't select the fields of the queryset's model a second time,
+        and only selects the primary keys from the tables of models that add no
+        fields, to check that the items' rows exist.
+        """
+        qs = self.queryset
+        base_model = qs.model
+        base_attnames = self._get_base_attnames(qs)
+        annotation_aliases = list(qs.query.annotation_select)
+        values_qs = qs.values_list(*base_attnames, *annotation_aliases)
+
+        pk_index = base_attnames.index(base_model._meta.pk.attname)
+        content_type_index = base_attnames.index("content_type_id")
+        annotations_index = len(base_attnames)
+
+        # Gather items in batches to reduce peak memory usage
+        for rows in self._get_chunks(values_qs):
+            rows_by_type = defaultdict(dict)
+            for row in rows:
+                rows_by_type[row[content_type_index]][row[pk_index]] = row
+
+            # Get the specific instances of all items, one model class at a time.
+            items = {}
+            for content_type_id, rows_for_type in rows_by_type.items():
+                # look up model class for this content type, falling back on the original
+                # model (i.e. Page) if the more specific one is missing
+                model = (
+                    ContentType.objects.get_for_id(content_type_id).model_class()
+                    or base_model
+                )
+                items.update(
+                    self._get_specific_items(model, rows_for_type, base_attnames)
+                )
+
+            # Create generic items to supplement missing items
+            missing_rows = [row for row in rows if row[pk_index] not in items]
+            if missing_rows:
+                generic_items = [
+                    base_model.from_db(qs.db, base_attnames, row)
+                    for row in missing_rows
+                ]
+                warnings.warn(
+                    "Specific versions of the following items could not be found. "
+                    "This is most likely because a database migration has removed "
+                    "the relevant table or record since the item was created:\n{}".format(
+                        [
+                            {
+                                "id": p.pk,
+                                "title": getattr(p, "title", str(p)),
+                                "type": p.content_type,
+                            }
+                            for p in generic_items
+                        ]
+                    ),
+                    category=RuntimeWarning,
+                )
+                items.update((item.pk, item) for item in generic_items)
+
+            # Yield all items in the order they occurred in the original query.
+            for row in rows:
+                item = items[row[pk_index]]
+                for annotation, value in zip(
+                    annotation_aliases, row[annotations_index:]
+                ):
+                    setattr(item, annotation, value)
+                yield item
+
+    def _get_base_attnames(self, qs):
+        """
+        Returns the attnames of the fields of the queryset's model that it
+        loads, in the order of the model's fields. The primary key and content
+        type are always loaded, as they are needed to find the specific items.
+        """
+        opts = qs.model._meta
+        field_names, defer = qs.query.deferred_loading
+        attnames = {
+            opts.pk.attname if name == "pk" else opts.get_field(name).attname
+            for name in field_names
+            if "__" not in name
+        }
+        required_attnames = {opts.pk.attname, "content_type_id"}
+        return [
+            field.attname
+            for field in opts.concrete_fields
+            if field.attname in required_attnames
+            or (field.attname not in attnames if defer else field.attname in attnames)
+        ]
+
+    def _get_specific_items(self, model, rows, base_attnames):
+        """
+        Returns a dict of the specific instances of ``model`` for the rows of
+        field values in ``rows``, keyed by primary key.
+        """
+        qs = self.queryset
+        base_model_attnames = {
+            field.attname for field in qs.model._meta.concrete_fields
+        }
+
+        # The fields the specific model adds, other than the links to its parent
+        # models, which have the same value as the primary key
+        parent_link_attnames = set()
+        specific_fields = []
+        if issubclass(model, qs.model):
+            for field in model._meta.concrete_fields:
+                if field.attname in base_model_attnames:
+                    continue
+                if field.remote_field and field.remote_field.parent_link:
+                    parent_link_attnames.add(field.attname)
+                elif not (
+                    qs._defer_streamfields
+                    and field.name in model.get_streamfield_names()
+                ):
+                    specific_fields.append(field)
+        else:
+            model = qs.model
+
+        # Each item's values are taken from its values of the queryset's fields,
+        # followed by its primary key for the parent links, followed by the
+        # values of the specific fields. Find the position in these of the
+        # value of each loaded field, in the order of the model's fields
+        positions = {attname: index for index, attname in enumerate(base_attnames)}
+        positions.update(
+            (attname, len(base_attnames)) for attname in parent_link_attnames
+        )
+        positions.update(
+            (field.attname, len(base_attnames) + 1 + index)
+            for index, field in enumerate(specific_fields)
+        )
+        attnames = [
+            field.attname
+            for field in model._meta.concrete_fields
+            if field.attname in positions
+        ]
+        value_positions = [positions[attname] for attname in attnames]
+
+        def create_item(pk, row, specific_values=()):
+            values = (*row[: len(base_attnames)], pk, *specific_values)
+            return model.from_db(
+                qs.db, attnames, [values[position] for position in value_positions]
+            )
+
+        if qs._specific_select_related_fields:
+            # Fetch instances, rather than values, to get the related objects.
+            # The fields they're related through may be on the queryset's
+            # model, so those are selected again
+            related_field_names = {
+                lookup.split(LOOKUP_SEP, 1)[0]
+                for lookup in qs._specific_select_related_fields
+            }
+            items = {}
+            for item in (
+                model.objects.filter(pk__in=list(rows))
+                .order_by()
+                .only(*(field.name for field in specific_fields), *related_field_names)
+                .select_related(*qs._specific_select_related_fields)
+            ):
+                item.__dict__.update(zip(base_attnames, rows[item.pk]))
+                items[item.pk] = item
+        elif model is qs.model:
+            items = {pk: create_item(pk, row) for pk, row in rows.items()}
+        elif not specific_fields:
+            # Items whose rows are missing from the specific model's table are
+            # created as generic items instead
+            items = {
+                pk: create_item(pk, rows[pk])
+                for pk in model.objects.filter(pk__in=list(rows))
+                .order_by()
+                .values_list("pk", flat=True)
+            }
+        else:
+            # Only select the fields that the specific model adds, so that the
+            # tables of the queryset's model aren't joined
+            items = {
+                pk: create_item(pk, rows[pk], specific_values)
+                for pk, *specific_values in (
+                    model.objects.filter(pk__in=list(rows))
+                    .order_by()
+                    .values_list("pk", *(field.attname for field in specific_fields))
+                )
+            }
+
+        if qs._specific_prefetch_related_lookups:
+            prefetch_related_objects(
+                list(items.values()), *qs._specific_prefetch_related_lookups
+            )
+
+        return items
+
+
 class DeferredSpecificIterable(ModelIterable):
     def __iter__(self):
         for obj in super().__iter__():
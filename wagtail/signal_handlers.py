@@ -1,7 +1,9 @@
 import logging
+from collections import defaultdict
 from contextlib import contextmanager
 
 from asgiref.local import Local
+from django.conf import settings
 from django.core.cache import cache
 from django.db import transaction
 from django.db.models.signals import (
@@ -13,19 +15,40 @@ from django.db.models.signals import (
 )
 
 from wagtail.models import Locale, Page, ReferenceIndex, Site
+from wagtail.search import index
+from wagtail.search.backends import get_search_backends_with_name
+from wagtail.signals import (
+    page_descendants_moved,
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
+from wagtail.url_routing import route_cache
 
 from .tasks import update_reference_index_task
 
 logger = logging.getLogger("wagtail")
 
 
-# Clear the wagtail_site_root_paths from the cache whenever Site records are updated.
+# Clear the wagtail_site_root_paths from the cache and invalidate the hostname index
+# whenever Site records are updated.
 def post_save_site_signal_handler(instance, update_fields=None, **kwargs):
     Site.clear_site_root_paths_cache()
+    Site.clear_site_hostname_index()
+    clear_route_cache()
 
 
 def post_delete_site_signal_handler(instance, **kwargs):
     Site.clear_site_root_paths_cache()
+    Site.clear_site_hostname_index()
+    clear_route_cache()
+
+
+# Discard cached page routes whenever the set of live pages or their URL paths change.
+def clear_route_cache(**kwargs):
+    if getattr(settings, "WAGTAIL_ROUTE_CACHE", False):
+        route_cache.clear()
 
 
 def pre_delete_page_unpublish(sender, instance, **kwargs):
@@ -39,6 +62,33 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
     logger.info('Page deleted: "%s" id=%d', instance.title, instance.id)
 
 
+def update_search_index_on_descendants_moved(pages, **kwargs):
+    # The tree paths of pages are indexed for filtering searches to a section
+    # of the tree, so moved pages are indexed again
+    pages_by_model = defaultdict(list)
+    for page in pages:
+        model = type(page)
+        # Pages whose specific model is missing aren't indexed
+        if (
+            model is page.specific_class
+            and getattr(model, "search_auto_update", True)
+            and index.class_is_indexed(model)
+        ):
+            pages_by_model[model].append(page)
+
+    for backend_name, backend in get_search_backends_with_name(with_auto_update=True):
+        for model, model_pages in pages_by_model.items():
+            try:
+                backend.add_bulk(model, model_pages)
+            except Exception:
+                logger.exception(
+                    "Exception raised while adding moved pages into the '%s' search backend",
+                    backend_name,
+                )
+                if not backend.catch_indexing_errors:
+                    raise
+
+
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     cache.delete("wagtail_locales_display_name")
 
@@ -111,6 +161,12 @@ def register_signal_handlers():
     pre_delete.connect(pre_delete_page_unpublish, sender=Page)
     post_delete.connect(post_delete_page_log_deletion, sender=Page)
 
+    page_published.connect(clear_route_cache)
+    page_unpublished.connect(clear_route_cache)
+    page_slug_changed.connect(clear_route_cache)
+    post_page_move.connect(clear_route_cache)
+    page_descendants_moved.connect(update_search_index_on_descendants_moved)
+
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
 
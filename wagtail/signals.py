@@ -23,9 +23,12 @@ page_slug_changed = Signal()
 # provides args: instance, parent_page_before, parent_page_after, url_path_before, url_path_after
 pre_page_move = Signal()
 
-# provides args: instance, parent_page_before, parent_page_after, url_path_before, url_path_after
+# provides args: instance, parent_page_before, parent_page_after, url_path_before, url_path_after, path_before, path_after
 post_page_move = Signal()
 
+# provides args: instance, pages, url_path_before, url_path_after
+page_descendants_moved = Signal()
+
 
 # Workflow signals
 
@@ -72,3 +75,7 @@ copy_for_translation_done = Signal()
 # Admin signals
 # provides args: page, parent
 init_new_page = Signal()
+
+# Snippet signals
+# provides args: sender (the snippet model)
+snippet_registered = Signal()
@@ -44,6 +44,7 @@ from wagtail.models import (
     WorkflowMixin,
 )
 from wagtail.permissions import ModelPermissionPolicy
+from wagtail.signals import snippet_registered
 from wagtail.snippets.action_menu import SnippetActionMenu
 from wagtail.snippets.models import SnippetAdminURLFinder, get_snippet_models
 from wagtail.snippets.side_panels import SnippetStatusSidePanel
@@ -1195,6 +1196,7 @@ class SnippetViewSet(ModelViewSet):
             )
         snippet_models.append(self.model)
         snippet_models.sort(key=lambda x: x._meta.verbose_name)
+        snippet_registered.send(sender=self.model)
 
     def on_register(self):
         super().on_register()
@@ -1,10 +1,11 @@
 from django.apps import apps
+from django.conf import settings
 from django.db import transaction
 from django.utils.module_loading import import_string
 from django_tasks import task
-from modelcluster.fields import ParentalKey
 
-from wagtail.models import ReferenceIndex
+from wagtail.models import Page, ReferenceIndex, Revision
+from wagtail.signals import page_descendants_moved
 
 
 @task()
@@ -14,16 +15,13 @@ def update_reference_index_task(app_label, model_name, pk):
 
     # If the model is a child model, find the parent instance and index that instead
     while True:
-        parental_keys = list(
-            filter(
-                lambda field: isinstance(field, ParentalKey),
-                instance._meta.get_fields(),
-            )
-        )
-        if not parental_keys:
+        parental_key = ReferenceIndex._get_extraction_plan(
+            instance._meta.model
+        ).parental_key
+        if parental_key is None:
             break
 
-        instance = getattr(instance, parental_keys[0].name)
+        instance = getattr(instance, parental_key.name)
         if instance is None:
             # parent is null, so there is no valid object to record references against
             return
@@ -39,3 +37,59 @@ def delete_file_from_storage_task(deconstructed_storage, path):
     storage = import_string(storage_module)(*storage_args, **storage_kwargs)
 
     storage.delete(path)
+
+
+@task()
+def update_aliases_task(page_id, revision_id):
+    page = Page.objects.filter(pk=page_id).first()
+    if page is None:
+        return
+
+    # If a later revision has been published since, the aliases are updated
+    # to that one instead. If the page has been unpublished, so have they
+    if not page.live or page.live_revision_id != revision_id:
+        return
+
+    revision = Revision.page_revisions.filter(pk=revision_id).first()
+    if revision is None:
+        return
+
+    with transaction.atomic():
+        page.update_aliases(
+            revision=revision,
+            bulk=getattr(settings, "WAGTAIL_BULK_UPDATE_ALIASES", False),
+            _content=revision.content,
+        )
+
+
+@task()
+def update_moved_descendants_task(
+    page_id, path, url_path_before, url_path_after, after_path=None
+):
+    page = Page.objects.filter(pk=page_id).first()
+
+    # If the page has been moved again since, that move's task takes over
+    if page is None or page.path != path or page.url_path != url_path_after:
+        return
+
+    chunk_size = getattr(settings, "WAGTAIL_MOVE_DESCENDANTS_CHUNK_SIZE", 1000)
+    descendants = page.get_descendants().order_by("path")
+    if after_path is not None:
+        descendants = descendants.filter(path__gt=after_path)
+
+    pages = list(descendants.specific(reuse_base_fields=True)[:chunk_size])
+    if not pages:
+        return
+
+    page_descendants_moved.send(
+        sender=page.specific_class or Page,
+        instance=page,
+        pages=pages,
+        url_path_before=url_path_before,
+        url_path_after=url_path_after,
+    )
+
+    if len(pages) == chunk_size:
+        update_moved_descendants_task.enqueue(
+            page_id, path, url_path_before, url_path_after, pages[-1].path
+        )
@@ -30,6 +30,23 @@ def pageurl(context, page, fallback=None):
     return page.get_url(request=context.get("request"))
 
 
+@register.simple_tag(takes_context=True)
+def pageurls(context, pages):
+    """
+    Returns a list of ``(page, url)`` pairs for the given pages, where each URL
+    is the same as ``pageurl`` would output for that page. The URLs are computed
+    together, which is considerably faster than calling ``pageurl`` on each
+    page of a long list.
+    """
+    pages = list(pages)
+    for page in pages:
+        if not isinstance(page, Page):
+            raise ValueError("pageurls tag expected Page objects, got %r" % page)
+
+    urls = Page.get_urls_for_pages(pages, request=context.get("request"))
+    return list(zip(pages, urls))
+
+
 @register.simple_tag(takes_context=True)
 def fullpageurl(context, page, fallback=None):
     """
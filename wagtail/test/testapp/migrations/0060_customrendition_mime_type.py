@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tests", "0059_nopromotepage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customrendition",
+            name="mime_type",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name="customrenditionwithauthor",
+            name="mime_type",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+    ]
@@ -44,6 +44,12 @@ urlpatterns = [
         },
     ),
     path("sitemap-<str:section>.xml", sitemaps_views.sitemap, name="sitemap"),
+    path("pregenerated-sitemap.xml", sitemaps_views.pregenerated_index),
+    path(
+        "pregenerated-sitemap-<int:section>.xml.gz",
+        sitemaps_views.pregenerated_sitemap,
+        name="wagtail.contrib.sitemaps.views.pregenerated_sitemap",
+    ),
     path("testapp/", include(testapp_urls)),
     path("fallback/", lambda request: HttpResponse("ok"), name="fallback"),
 ]
@@ -0,0 +1,178 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from wagtail.models import Page, ReferenceIndex, Revision
+from wagtail.test.benchmark import Benchmark
+from wagtail.test.testapp.models import (
+    BusinessIndex,
+    EventIndex,
+    SimplePage,
+    StreamPage,
+)
+
+
+class BenchExtractReferencesFromLargeStream(Benchmark, TestCase):
+    """
+    Extracts references from a page with a 500 block StreamField, most of
+    whose blocks can't contain references, loaded from its raw data each time
+    as it would be when saved.
+    """
+
+    def setUp(self):
+        stream_data = []
+        for i in range(100):
+            stream_data += [
+                {"type": "text", "value": f"Heading {i}", "id": f"text-{i}"},
+                {
+                    "type": "product",
+                    "value": {"name": f"Product {i}", "price": "£10"},
+                    "id": f"product-{i}",
+                },
+                {
+                    "type": "books",
+                    "value": [
+                        {"type": "title", "value": f"Book {i}", "id": f"title-{i}"},
+                        {"type": "author", "value": "Anon", "id": f"author-{i}"},
+                    ],
+                    "id": f"books-{i}",
+                },
+                {
+                    "type": "title_list",
+                    "value": [
+                        {"type": "item", "value": f"Title {i}", "id": f"item-{i}"}
+                    ],
+                    "id": f"title_list-{i}",
+                },
+                {
+                    "type": "rich_text",
+                    "value": f'<p><a linktype="page" id="{i + 1}">Page {i}</a></p>',
+                    "id": f"rich_text-{i}",
+                },
+            ]
+
+        self.body_field = StreamPage._meta.get_field("body")
+        self.raw_body = self.body_field.get_prep_value(stream_data)
+        self.page = StreamPage(title="Large stream", slug="large-stream")
+
+    def bench(self):
+        self.page.body = self.body_field.to_python(self.raw_body)
+        references = list(ReferenceIndex._extract_references_from_object(self.page))
+        self.assertEqual(len(references), 100)
+
+
+class SpecificPagesBenchMixin:
+    """
+    Fetches the specific instances of 400 pages, either all of one type or of
+    a mix of types, one of which adds no fields to Page.
+    """
+
+    page_types = [SimplePage]
+    reuse_base_fields = False
+
+    def setUp(self):
+        self.parent_page = Page.get_first_root_node().add_child(
+            instance=Page(title="Parent", slug="parent")
+        )
+        for i in range(400):
+            page_type = self.page_types[i % len(self.page_types)]
+            page = page_type(title=f"Page {i}", slug=f"page-{i}")
+            if page_type is SimplePage:
+                page.content = f"Content {i}"
+            self.parent_page.add_child(instance=page)
+
+    def bench(self):
+        pages = list(
+            self.parent_page.get_children().specific(
+                reuse_base_fields=self.reuse_base_fields
+            )
+        )
+        self.assertEqual(len(pages), 400)
+
+
+class BenchSpecificPagesOfOneType(SpecificPagesBenchMixin, Benchmark, TestCase):
+    pass
+
+
+class BenchSpecificPagesOfOneTypeReusingBaseFields(
+    SpecificPagesBenchMixin, Benchmark, TestCase
+):
+    reuse_base_fields = True
+
+
+class BenchSpecificPagesOfMixedTypes(SpecificPagesBenchMixin, Benchmark, TestCase):
+    page_types = [SimplePage, EventIndex, StreamPage, BusinessIndex]
+
+
+class BenchSpecificPagesOfMixedTypesReusingBaseFields(
+    SpecificPagesBenchMixin, Benchmark, TestCase
+):
+    page_types = [SimplePage, EventIndex, StreamPage, BusinessIndex]
+    reuse_base_fields = True
+
+
+class StreamRevisionBenchMixin:
+    """
+    Decodes the content of a revision of a page with a StreamField of 2,500
+    blocks of varied types (over 1 MB of JSON) from its raw data, as it would
+    be when loaded from the database, with the JSON codec ``codec``.
+    """
+
+    codec = "wagtail.utils.json.JSONCodec"
+
+    def setUp(self):
+        settings_override = override_settings(WAGTAIL_JSON_CODEC=self.codec)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        paragraph = "<p>" + "Lorem ipsum dolor sit amet, consectetur elit. " * 14
+        stream_data = []
+        for i in range(500):
+            stream_data += [
+                {"type": "text", "value": f"Heading {i}", "id": f"text-{i}"},
+                {
+                    "type": "rich_text",
+                    "value": f'{paragraph}<a linktype="page" id="{i}">Page</a></p>',
+                    "id": f"rich_text-{i}",
+                },
+                {
+                    "type": "product",
+                    "value": {"name": f"Product {i}", "price": "£10"},
+                    "id": f"product-{i}",
+                },
+                {
+                    "type": "books",
+                    "value": [
+                        {"type": "title", "value": f"Book {i}", "id": f"title-{i}"},
+                        {"type": "author", "value": "Anon", "id": f"author-{i}"},
+                    ],
+                    "id": f"books-{i}",
+                },
+                {
+                    "type": "raw_html",
+                    "value": f"<div class='embed'>{paragraph}</p></div>",
+                    "id": f"raw_html-{i}",
+                },
+            ]
+
+        page = StreamPage(title="Large stream", slug="large-stream", body=stream_data)
+        self.raw_content = json.dumps(page.serializable_data(), cls=DjangoJSONEncoder)
+        self.content_field = Revision._meta.get_field("content")
+        self.body_field = StreamPage._meta.get_field("body")
+
+    def bench(self):
+        content = self.content_field.from_db_value(self.raw_content, None, connection)
+        body = self.body_field.to_python(content["body"])
+        self.assertEqual(len(body), 2500)
+
+
+class BenchStreamRevisionWithStandardLibrary(
+    StreamRevisionBenchMixin, Benchmark, TestCase
+):
+    pass
+
+
+class BenchStreamRevisionWithOrjson(StreamRevisionBenchMixin, Benchmark, TestCase):
+    codec = "wagtail.utils.json.OrjsonCodec"
@@ -5121,6 +5121,69 @@ class TestStreamBlockWithFixtures(TestCase):
             ],
         )
 
+    def test_extract_references_skips_blocks_without_references(self):
+        block = blocks.StreamBlock(
+            [
+                ("page", blocks.PageChooserBlock()),
+                ("heading", blocks.CharBlock()),
+            ]
+        )
+        christmas_page = Page.objects.get(slug="christmas")
+        value = block.to_python(
+            [
+                {"id": "block1", "type": "heading", "value": "Christmas"},
+                {"id": "block2", "type": "page", "value": christmas_page.id},
+            ]
+        )
+
+        self.assertListEqual(
+            list(block.extract_references(value)),
+            [(Page, str(christmas_page.id), "page", "block2")],
+        )
+        # The heading has not been converted from its raw data
+        self.assertIsNone(value._bound_blocks[0])
+
+    def test_can_contain_references(self):
+        class TagBlock(blocks.CharBlock):
+            def extract_references(self, value):
+                yield Page, value, "", ""
+
+        cases = [
+            (blocks.CharBlock(), False),
+            (blocks.PageChooserBlock(), True),
+            (blocks.RichTextBlock(), True),
+            (TagBlock(), True),
+            (blocks.StructBlock([("heading", blocks.CharBlock())]), False),
+            (
+                blocks.StructBlock(
+                    [("heading", blocks.CharBlock()), ("tag", TagBlock())]
+                ),
+                True,
+            ),
+            (blocks.ListBlock(blocks.CharBlock()), False),
+            (blocks.ListBlock(blocks.PageChooserBlock()), True),
+            (blocks.StreamBlock([("heading", blocks.CharBlock())]), False),
+            (
+                blocks.StreamBlock(
+                    [
+                        ("heading", blocks.CharBlock()),
+                        (
+                            "links",
+                            blocks.ListBlock(
+                                blocks.StructBlock(
+                                    [("page", blocks.PageChooserBlock())]
+                                )
+                            ),
+                        ),
+                    ]
+                ),
+                True,
+            ),
+        ]
+        for block, can_contain_references in cases:
+            with self.subTest(block=block):
+                self.assertIs(block.can_contain_references, can_contain_references)
+
 
 class TestPageChooserBlock(TestCase):
     fixtures = ["test.json"]
@@ -36,6 +36,16 @@ class TestCoreGlobalsAndFilters(TestCase):
         page = Page.objects.get(pk=2)
         self.assertEqual(self.render("{{ pageurl(page) }}", {"page": page}), page.url)
 
+    def test_pageurls(self):
+        page = Page.objects.get(pk=2)
+        self.assertEqual(
+            self.render(
+                "{% for p, url in pageurls(pages) %}{{ p.pk }}:{{ url }}{% endfor %}",
+                {"pages": [page]},
+            ),
+            f"{page.pk}:{page.url}",
+        )
+
     def test_fullpageurl(self):
         page = Page.objects.get(pk=2)
         self.assertEqual(
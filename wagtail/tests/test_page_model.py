@@ -1,22 +1,28 @@
 import datetime
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models.signals import post_save
 from django.http import Http404
 from django.test import Client, TestCase, override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone, translation
 from freezegun import freeze_time
 
 from wagtail.actions.copy_for_translation import ParentNotTranslatedError
+from wagtail.actions.copy_page import CopyPageAction
+from wagtail.actions.update_aliases import UpdatePageAliasesAction
 from wagtail.coreutils import get_dummy_request
 from wagtail.locks import BasicLock, ScheduledForPublishLock, WorkflowLock
 from wagtail.models import (
@@ -33,7 +39,7 @@ from wagtail.models import (
     get_page_models,
     get_translatable_models,
 )
-from wagtail.signals import page_published
+from wagtail.signals import page_descendants_moved, page_published, post_page_move
 from wagtail.test.testapp.models import (
     AbstractPage,
     Advert,
@@ -50,6 +56,7 @@ from wagtail.test.testapp.models import (
     EventCategory,
     EventIndex,
     EventPage,
+    EventPageRelatedLink,
     EventPageSpeaker,
     ExcludedCopyPageNote,
     GenericSnippetPage,
@@ -72,7 +79,7 @@ from wagtail.test.testapp.models import (
     TaggedPage,
 )
 from wagtail.test.utils import WagtailTestUtils
-from wagtail.url_routing import RouteResult
+from wagtail.url_routing import RouteResult, route_cache
 
 
 def get_ct(model):
@@ -364,6 +371,92 @@ class TestSiteRouting(TestCase):
             self.assertEqual(Site.find_for_request(request), self.default_site)
 
 
+@override_settings(
+    WAGTAIL_ROUTE_CACHE=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRouteCache(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        route_cache.clear()
+        # Populate the ContentType cache so that it isn't counted in query counts
+        for content_type in ContentType.objects.all():
+            ContentType.objects.get_for_id(content_type.id)
+
+    def route(self, path):
+        request = get_dummy_request(path=path)
+        return Page.route_for_request(request, request.path)
+
+    def test_cached_route(self):
+        result = self.route("/secret-plans/steal-underpants/")
+        self.assertEqual(result.page, EventPage.objects.get(slug="steal-underpants"))
+
+        with self.assertNumQueries(2):
+            # expect queries for site & page
+            result = self.route("/secret-plans/steal-underpants/")
+
+        self.assertIsInstance(result, RouteResult)
+        self.assertIsInstance(result.page, EventPage)
+        self.assertEqual(result.page.slug, "steal-underpants")
+        self.assertEqual((result.args, result.kwargs), ([], {}))
+
+    def test_custom_route_not_cached(self):
+        # EventIndex overrides route(), so paths beneath it are always routed normally
+        self.route("/events/christmas/")
+        with self.assertNumQueries(5):
+            result = self.route("/events/christmas/")
+        self.assertEqual(result.page.url_path, "/home/events/christmas/")
+
+    def test_unpublish_clears_cache(self):
+        self.route("/about-us/")
+        page = SimplePage.objects.get(url_path="/home/about-us/")
+        page.unpublish()
+
+        self.assertIsNone(self.route("/about-us/"))
+
+    def test_slug_change_clears_cache(self):
+        self.route("/about-us/")
+        page = SimplePage.objects.get(url_path="/home/about-us/")
+        page.slug = "about"
+        page.save_revision().publish()
+
+        self.assertIsNone(self.route("/about-us/"))
+        self.assertEqual(self.route("/about/").page, page)
+
+    def test_move_clears_cache(self):
+        self.route("/secret-plans/steal-underpants/")
+        page = Page.objects.get(url_path="/home/secret-plans/steal-underpants/")
+        page.move(Page.objects.get(url_path="/home/about-us/"), pos="last-child")
+
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+        self.assertEqual(self.route("/about-us/steal-underpants/").page, page.specific)
+
+    def test_not_found(self):
+        self.assertIsNone(self.route("/does-not-exist/"))
+
+    def test_stale_entry_overwritten(self):
+        site = Site.objects.get(is_default_site=True)
+        cache_key = route_cache.get_cache_key(site, ["about-us"])
+        page = SimplePage.objects.get(url_path="/home/about-us/")
+        cache.set(cache_key, (page.pk + 1000, page.content_type_id))
+
+        self.assertEqual(self.route("/about-us/").page, page)
+        self.assertEqual(cache.get(cache_key), (page.pk, page.content_type_id))
+
+    def test_stale_entry_deleted_when_not_found(self):
+        site = Site.objects.get(is_default_site=True)
+        cache_key = route_cache.get_cache_key(site, ["about-us"])
+        self.route("/about-us/")
+        self.assertTrue(cache.get(cache_key))
+
+        # Unpublish the page without sending any signals
+        Page.objects.filter(url_path="/home/about-us/").update(live=False)
+
+        self.assertIsNone(self.route("/about-us/"))
+        self.assertIsNone(cache.get(cache_key))
+
+
 class TestRouting(TestCase):
     fixtures = ["test.json"]
 
@@ -477,6 +570,46 @@ class TestRouting(TestCase):
             (second_events_site.id, "http://second-events.example.com", "/christmas/"),
         )
 
+    def assertBulkUrlsMatch(self, pages, request=None):
+        pages = list(pages)
+        self.assertEqual(
+            Page.get_url_parts_for_pages(pages, request=request),
+            [page.get_url_parts(request=request) for page in pages],
+        )
+        self.assertEqual(
+            Page.get_urls_for_pages(pages, request=request),
+            [page.get_url(request=request) for page in pages],
+        )
+
+    def test_urls_for_pages(self):
+        home = Page.objects.get(url_path="/home/")
+        home.add_child(instance=SimplePage(title="Unicode", slug="café", content="x"))
+
+        self.assertBulkUrlsMatch(Page.objects.all())
+        self.assertBulkUrlsMatch(Page.objects.specific())
+        self.assertBulkUrlsMatch(Page.objects.all(), request=get_dummy_request())
+        self.assertEqual(Page.get_urls_for_pages([]), [])
+
+    @override_settings(ALLOWED_HOSTS=["localhost", "events.example.com"])
+    def test_urls_for_pages_with_multiple_sites(self):
+        events_site = Site.objects.create(
+            hostname="events.example.com",
+            root_page=Page.objects.get(url_path="/home/events/"),
+        )
+
+        self.assertBulkUrlsMatch(Page.objects.all())
+        self.assertBulkUrlsMatch(
+            Page.objects.all(), request=get_dummy_request(site=events_site)
+        )
+
+    @override_settings(ROOT_URLCONF="wagtail.test.non_root_urls")
+    def test_urls_for_pages_with_non_root_urlconf(self):
+        self.assertBulkUrlsMatch(Page.objects.all())
+
+    @override_settings(ROOT_URLCONF="wagtail.test.headless_urls")
+    def test_urls_for_pages_headless(self):
+        self.assertBulkUrlsMatch(Page.objects.all())
+
     @override_settings(ROOT_URLCONF="wagtail.test.non_root_urls")
     def test_urls_with_non_root_urlconf(self):
         default_site = Site.objects.get(is_default_site=True)
@@ -951,6 +1084,83 @@ class TestMovePage(TestCase):
         self.assertEqual(christmas.depth, 5)
         self.assertEqual(christmas.url_path, "/home/about-us/events/christmas/")
 
+    @override_settings(WAGTAIL_MOVE_DESCENDANTS_CHUNK_SIZE=3)
+    def test_move_page_sends_descendants_in_chunks(self):
+        about_us_page = SimplePage.objects.get(url_path="/home/about-us/")
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        path_before = events_index.path
+        descendant_ids = set(
+            events_index.get_descendants().values_list("id", flat=True)
+        )
+
+        move_handler = Mock()
+        descendants_handler = Mock()
+        post_page_move.connect(move_handler)
+        page_descendants_moved.connect(descendants_handler)
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                events_index.move(about_us_page, pos="last-child")
+        finally:
+            post_page_move.disconnect(move_handler)
+            page_descendants_moved.disconnect(descendants_handler)
+
+        events_index.refresh_from_db()
+        move_kwargs = move_handler.call_args.kwargs
+        self.assertEqual(move_kwargs["path_before"], path_before)
+        self.assertEqual(move_kwargs["path_after"], events_index.path)
+
+        # The 7 descendants are sent 3 at a time, in tree order
+        chunks = [call.kwargs["pages"] for call in descendants_handler.call_args_list]
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        pages = [page for chunk in chunks for page in chunk]
+        self.assertEqual({page.id for page in pages}, descendant_ids)
+        self.assertEqual(pages, sorted(pages, key=lambda page: page.path))
+        self.assertTrue(all(page.path.startswith(events_index.path) for page in pages))
+        self.assertIsInstance(pages[0], EventPage)
+
+        kwargs = descendants_handler.call_args.kwargs
+        self.assertEqual(kwargs["instance"].id, events_index.id)
+        self.assertEqual(kwargs["url_path_before"], "/home/events/")
+        self.assertEqual(kwargs["url_path_after"], "/home/about-us/events/")
+
+    def test_move_page_reindexes_descendants(self):
+        about_us_page = SimplePage.objects.get(url_path="/home/about-us/")
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        backend = Mock()
+
+        with patch(
+            "wagtail.signal_handlers.get_search_backends_with_name",
+            return_value=[("default", backend)],
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                events_index.move(about_us_page, pos="last-child")
+
+        indexed = {
+            call.args[0]: {page.url_path for page in call.args[1]}
+            for call in backend.add_bulk.call_args_list
+        }
+        self.assertIn(
+            "/home/about-us/events/christmas/",
+            indexed[EventPage],
+        )
+        self.assertEqual(
+            indexed[SingleEventPage], {"/home/about-us/events/saint-patrick/"}
+        )
+
+    def test_move_page_without_children_sends_no_descendants(self):
+        about_us_page = SimplePage.objects.get(url_path="/home/about-us/")
+        christmas = EventPage.objects.get(url_path="/home/events/christmas/")
+
+        handler = Mock()
+        page_descendants_moved.connect(handler)
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                christmas.move(about_us_page, pos="last-child")
+        finally:
+            page_descendants_moved.disconnect(handler)
+
+        handler.assert_not_called()
+
 
 class TestPrevNextSiblings(TestCase):
     fixtures = ["test.json"]
@@ -2316,6 +2526,161 @@ class TestCopyPage(TestCase):
         # check that the copied page child_page_2 does not have a view restriction
         self.assertFalse(PageViewRestriction.objects.filter(page=child_page_2).exists())
 
+    def get_copied_tree(self, page):
+        return [
+            (
+                descendant.depth - page.depth,
+                type(descendant),
+                descendant.title,
+                descendant.draft_title,
+                descendant.url_path[len(page.url_path) :],
+                descendant.live,
+                descendant.has_unpublished_changes,
+                descendant.numchild,
+                descendant.revisions.count(),
+                descendant.latest_revision_id
+                == descendant.revisions.order_by("-created_at", "-id").first().id,
+                [
+                    speaker.first_name
+                    for speaker in getattr(
+                        descendant, "speakers", EventPage.objects.none()
+                    ).all()
+                ],
+                list(
+                    PageLogEntry.objects.filter(page=descendant)
+                    .values_list("action", flat=True)
+                    .order_by("action")
+                ),
+            )
+            for descendant in page.get_descendants().specific()
+        ]
+
+    def test_copy_page_copies_recursively_in_bulk(self):
+        homepage = Page.objects.get(url_path="/home/")
+        christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas_event.title = "Christmas draft"
+        christmas_event.save_revision()
+
+        with CaptureQueriesContext(connection) as queries:
+            copy = homepage.copy(
+                recursive=True, update_attrs={"title": "Copy", "slug": "copy"}
+            )
+        with CaptureQueriesContext(connection) as bulk_queries:
+            bulk_copy = homepage.copy(
+                recursive=True,
+                update_attrs={"title": "Bulk copy", "slug": "bulk-copy"},
+                bulk=True,
+            )
+
+        self.maxDiff = None
+        self.assertEqual(self.get_copied_tree(bulk_copy), self.get_copied_tree(copy))
+        self.assertEqual(bulk_copy.numchild, copy.numchild)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        self.assertLess(len(bulk_queries), len(queries) / 2)
+
+        bulk_christmas_event = EventPage.objects.get(
+            url_path="/bulk-copy/events/christmas/"
+        )
+        self.assertEqual(bulk_christmas_event.title, "Christmas")
+        self.assertEqual(bulk_christmas_event.draft_title, "Christmas draft")
+        self.assertEqual(
+            bulk_christmas_event.get_latest_revision_as_object().title,
+            "Christmas draft",
+        )
+
+    def test_copy_page_copies_recursively_in_bulk_in_batches(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        copy = events_index.copy(
+            recursive=True,
+            update_attrs={"title": "New events index", "slug": "new-events-index"},
+            keep_live=False,
+        )
+
+        with patch.object(CopyPageAction, "bulk_batch_size", 1):
+            bulk_copy = events_index.copy(
+                recursive=True,
+                update_attrs={
+                    "title": "Bulk events index",
+                    "slug": "bulk-events-index",
+                },
+                keep_live=False,
+                bulk=True,
+            )
+
+        self.assertEqual(self.get_copied_tree(bulk_copy), self.get_copied_tree(copy))
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        self.assertFalse(bulk_copy.get_descendants().live().exists())
+
+    def test_copy_page_copies_recursively_in_bulk_keeps_tree_valid_on_failure(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        copy_pages_in_bulk = CopyPageAction._copy_pages_in_bulk
+        batches = []
+
+        def fail_on_second_batch(self, *args, **kwargs):
+            batches.append(args)
+            if len(batches) == 2:
+                raise ValueError("Batch failed")
+            return copy_pages_in_bulk(self, *args, **kwargs)
+
+        with (
+            patch.object(CopyPageAction, "bulk_batch_size", 1),
+            patch.object(CopyPageAction, "_copy_pages_in_bulk", fail_on_second_batch),
+            self.assertRaises(ValueError),
+        ):
+            events_index.copy(
+                recursive=True,
+                update_attrs={
+                    "title": "Bulk events index",
+                    "slug": "bulk-events-index",
+                },
+                bulk=True,
+            )
+
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        bulk_copy = Page.objects.get(url_path="/home/bulk-events-index/")
+        self.assertEqual(bulk_copy.numchild, 1)
+        bulk_copy.add_child(instance=SimplePage(title="New page", content="hello"))
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+    def test_copy_page_copies_recursively_in_bulk_emits_signals(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        published_pages = []
+        saved_pages = []
+
+        def page_published_handler(sender, instance, **kwargs):
+            published_pages.append(instance)
+
+        def post_save_handler(sender, instance, created, **kwargs):
+            if created and isinstance(instance, Page):
+                saved_pages.append(instance)
+
+        page_published.connect(page_published_handler)
+        post_save.connect(post_save_handler)
+        try:
+            bulk_copy = events_index.copy(
+                recursive=True,
+                update_attrs={
+                    "title": "Bulk events index",
+                    "slug": "bulk-events-index",
+                },
+                bulk=True,
+            )
+        finally:
+            page_published.disconnect(page_published_handler)
+            post_save.disconnect(post_save_handler)
+
+        self.assertCountEqual(
+            [page.pk for page in published_pages],
+            [
+                bulk_copy.pk,
+                *bulk_copy.get_descendants().live().values_list("pk", flat=True),
+            ],
+        )
+        self.assertCountEqual(
+            [page.pk for page in saved_pages],
+            [bulk_copy.pk, *bulk_copy.get_descendants().values_list("pk", flat=True)],
+        )
+
 
 class TestCreateAlias(TestCase):
     fixtures = ["test.json"]
@@ -2923,6 +3288,204 @@ class TestUpdateAliases(TestCase):
             ).exists()
         )
 
+    def test_update_aliases_in_bulk(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+        fr_locale = Locale.objects.create(language_code="fr")
+        fr_alias = event_page.create_alias(
+            update_slug="new-event-page-fr",
+            update_locale=fr_locale,
+            reset_translation_key=False,
+        )
+        category = EventCategory.objects.create(name="Festive")
+
+        # Update the title, add a speaker, a related link and a category
+        event_page.title = "Updated title"
+        event_page.draft_title = "A different draft title"
+        event_page.speakers.add(
+            EventPageSpeaker(
+                first_name="Ted",
+                last_name="Crilly",
+            )
+        )
+        event_page.related_links.add(
+            EventPageRelatedLink(title="Parochial house", link_external="/house/")
+        )
+        event_page.categories = [category]
+        event_page.save()
+
+        published_aliases = []
+
+        def page_published_handler(instance, alias=False, **kwargs):
+            published_aliases.append((instance.id, alias))
+
+        page_published.connect(page_published_handler)
+        try:
+            event_page.update_aliases(bulk=True)
+        finally:
+            page_published.disconnect(page_published_handler)
+
+        self.assertEqual(
+            sorted(published_aliases),
+            sorted([(alias.id, True), (alias_alias.id, True), (fr_alias.id, True)]),
+        )
+
+        for page in [alias, alias_alias, fr_alias]:
+            page.refresh_from_db()
+            self.assertEqual(page.title, "Updated title")
+            self.assertEqual(page.draft_title, "Updated title")
+            self.assertEqual(page.speakers.count(), 2)
+            self.assertEqual(page.related_links.get().title, "Parochial house")
+            self.assertEqual(list(page.categories.all()), [category])
+
+        # The slugs and URL paths of the aliases are kept
+        self.assertEqual(alias.slug, "new-event-page")
+        self.assertEqual(alias_alias.url_path, "/home/events/new-event-page-2/")
+
+        # Child objects of aliases that are translations keep their
+        # translation keys, and others are given new ones
+        related_link = event_page.related_links.get()
+        fr_related_link = fr_alias.related_links.get()
+        self.assertEqual(fr_related_link.locale, fr_locale)
+        self.assertEqual(fr_related_link.translation_key, related_link.translation_key)
+        self.assertNotEqual(
+            alias.related_links.get().translation_key, related_link.translation_key
+        )
+
+        # Child objects that haven't changed since the last update are kept
+        related_link_ids = {
+            page.id: page.related_links.get().id
+            for page in [alias, alias_alias, fr_alias]
+        }
+        event_page.categories = []
+        event_page.save()
+        event_page.update_aliases(bulk=True)
+
+        for page in [alias, alias_alias, fr_alias]:
+            self.assertEqual(page.related_links.get().id, related_link_ids[page.id])
+            self.assertFalse(page.categories.exists())
+
+    def test_update_aliases_in_bulk_matches_update_aliases(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+        bulk_alias = event_page.create_alias(update_slug="new-event-page-3")
+        bulk_alias_alias = bulk_alias.create_alias(update_slug="new-event-page-4")
+
+        event_page.title = "Updated title"
+        event_page.location = "Craggy Island"
+        event_page.speakers.add(EventPageSpeaker(first_name="Ted", last_name="Crilly"))
+        event_page.save()
+        with CaptureQueriesContext(connection) as queries:
+            event_page.update_aliases(_updated_ids=[bulk_alias.id, bulk_alias_alias.id])
+        with CaptureQueriesContext(connection) as bulk_queries:
+            event_page.update_aliases(
+                bulk=True, _updated_ids=[alias.id, alias_alias.id]
+            )
+
+        self.assertLess(len(bulk_queries), len(queries))
+
+        def get_fields(page):
+            page = EventPage.objects.get(pk=page.pk)
+            return {
+                field.attname: getattr(page, field.attname)
+                for field in EventPage._meta.concrete_fields
+                if field.attname
+                not in [
+                    "id",
+                    "page_ptr_id",
+                    "path",
+                    "slug",
+                    "url_path",
+                    "translation_key",
+                    "alias_of_id",
+                ]
+            } | {
+                "speakers": [
+                    (speaker.first_name, speaker.last_name)
+                    for speaker in page.speakers.order_by("sort_order", "pk")
+                ]
+            }
+
+        self.assertEqual(get_fields(bulk_alias), get_fields(alias))
+        self.assertEqual(get_fields(bulk_alias_alias), get_fields(alias_alias))
+
+    @override_settings(WAGTAIL_BULK_UPDATE_ALIASES=True)
+    def test_publish_updates_aliases_in_bulk(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "Updated title"
+        with patch.object(
+            UpdatePageAliasesAction, "execute", autospec=True
+        ) as mock_execute:
+            event_page.save_revision().publish()
+
+        mock_execute.assert_called_once()
+        self.assertEqual(mock_execute.call_args.args[0].page, event_page)
+
+        event_page.save_revision().publish()
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Updated title")
+
+    @override_settings(WAGTAIL_DEFER_ALIAS_UPDATES=True)
+    def test_publish_defers_updating_aliases(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "Updated title"
+        with self.captureOnCommitCallbacks() as callbacks:
+            event_page.save_revision().publish()
+
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Christmas")
+
+        for callback in callbacks:
+            callback()
+
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Updated title")
+
+    @override_settings(WAGTAIL_DEFER_ALIAS_UPDATES=True)
+    def test_deferred_alias_update_skips_superseded_revisions(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "First title"
+        with self.captureOnCommitCallbacks() as first_callbacks:
+            event_page.save_revision().publish()
+
+        event_page.title = "Second title"
+        with self.captureOnCommitCallbacks(execute=True):
+            event_page.save_revision().publish()
+
+        # The update for the first revision runs after the second
+        for callback in first_callbacks:
+            callback()
+
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Second title")
+
+    @override_settings(WAGTAIL_DEFER_ALIAS_UPDATES=True)
+    def test_deferred_alias_update_skips_unpublished_pages(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "Updated title"
+        with self.captureOnCommitCallbacks() as callbacks:
+            event_page.save_revision().publish()
+
+        event_page.unpublish()
+
+        # The update runs after the page and its aliases were unpublished
+        for callback in callbacks:
+            callback()
+
+        alias.refresh_from_db()
+        self.assertFalse(alias.live)
+        self.assertEqual(alias.title, "Christmas")
+
 
 class TestCopyForTranslation(TestCase):
     fixtures = ["test.json"]
@@ -4,8 +4,10 @@ from unittest import mock
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
+from django.db import connection
 from django.db.models import Count, Q
 from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
 from wagtail.models import Locale, Page, PageViewRestriction, Site, Workflow
 from wagtail.search.query import MATCH_ALL
@@ -14,6 +16,7 @@ from wagtail.test.testapp.models import (
     EventPage,
     SimplePage,
     SingleEventPage,
+    SingletonPage,
     StreamPage,
 )
 from wagtail.test.utils import WagtailTestUtils
@@ -1200,6 +1203,202 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
             result_2 = list(queryset.all().iterator(chunk_size=3))
             self.assertEqual(result_2, benchmark_result)
 
+    def assertSameSpecificPages(self, pages, expected_pages):
+        self.assertEqual(pages, expected_pages)
+        for page, expected_page in zip(pages, expected_pages):
+            self.assertIs(type(page), type(expected_page))
+            for field in type(page)._meta.concrete_fields:
+                self.assertEqual(
+                    getattr(page, field.attname), getattr(expected_page, field.attname)
+                )
+
+    def test_specific_reusing_base_fields(self):
+        root = Page.objects.get(url_path="/home/")
+        qs = root.get_descendants().specific(reuse_base_fields=True)
+        self.assertTrue(qs.is_specific)
+
+        with self.assertNumQueries(4):
+            # One query for the pages, one query per page type for the fields
+            # it adds: EventIndex, EventPage, SimplePage
+            pages = list(qs)
+
+        self.assertSameSpecificPages(pages, list(root.get_descendants().specific()))
+
+        # The page table is only queried for the pages themselves
+        with CaptureQueriesContext(connection) as queries:
+            list(qs.all())
+        self.assertEqual(
+            [
+                query["sql"].count(Page._meta.db_table) > 0
+                for query in queries.captured_queries
+            ],
+            [True, False, False, False],
+        )
+
+        with self.assertNumQueries(0):
+            for page in pages:
+                self.assertIs(page, page.specific)
+                page.title
+                page.path
+
+    def test_specific_reusing_base_fields_of_specific_model(self):
+        with self.assertNumQueries(1):
+            # There are no more fields to fetch
+            pages = list(EventPage.objects.specific(reuse_base_fields=True))
+
+        self.assertSameSpecificPages(pages, list(EventPage.objects.all()))
+
+    def test_specific_reusing_base_fields_with_annotation(self):
+        with self.assertNumQueries(4):
+            pages = list(
+                Page.objects.live()
+                .specific(reuse_base_fields=True)
+                .annotate(count=Count("pk"))
+                .order_by("path")
+            )
+
+        self.assertSameSpecificPages(
+            pages, list(Page.objects.live().specific().order_by("path"))
+        )
+        for page in pages:
+            self.assertEqual(page.count, 1)
+
+    def test_specific_reusing_base_fields_with_select_related(self):
+        queryset = (
+            Page.objects.type(EventPage)
+            .specific(reuse_base_fields=True)
+            .select_related("feed_image", for_specific_subqueries=True)
+        )
+        with self.assertNumQueries(2):
+            pages = list(queryset)
+
+        self.assertEqual(len(pages), 4)
+        with self.assertNumQueries(0):
+            for page in pages:
+                self.assertTrue(page.feed_image)
+                page.title
+
+    def test_specific_reusing_base_fields_with_select_related_base_field(self):
+        queryset = (
+            Page.objects.live()
+            .specific(reuse_base_fields=True)
+            .select_related("owner", "locale", for_specific_subqueries=True)
+        )
+        with self.assertNumQueries(5):
+            expected_pages = list(
+                Page.objects.live()
+                .specific()
+                .select_related("owner", "locale", for_specific_subqueries=True)
+            )
+
+        # As with specific(), one query for the pages and one per page type
+        with self.assertNumQueries(5):
+            pages = list(queryset)
+
+        self.assertSameSpecificPages(pages, expected_pages)
+        with self.assertNumQueries(0):
+            for page in pages:
+                page.owner
+                page.locale
+
+    def test_specific_reusing_base_fields_with_iterator(self):
+        queryset = Page.objects.live().specific(reuse_base_fields=True)
+        expected_pages = list(Page.objects.live().specific())
+
+        with self.assertNumQueries(4):
+            self.assertSameSpecificPages(list(queryset.iterator()), expected_pages)
+
+        # Each chunk is made specific separately
+        with self.assertNumQueries(6):
+            self.assertSameSpecificPages(
+                list(queryset.iterator(chunk_size=5)), expected_pages
+            )
+
+    def test_specific_reusing_base_fields_with_deferred_fields(self):
+        with self.assertNumQueries(4):
+            pages = list(
+                Page.objects.live()
+                .defer("search_description", "content_type")
+                .specific(reuse_base_fields=True)
+            )
+
+        for page in pages:
+            # The content type is needed to find the specific model, so it
+            # is loaded anyway
+            self.assertEqual(page.get_deferred_fields(), {"search_description"})
+        self.assertSameSpecificPages(pages, list(Page.objects.live().specific()))
+
+    def test_specific_reusing_base_fields_handles_missing_models(self):
+        missing_page_content_type = ContentType.objects.create(
+            app_label="tests", model="missingpage"
+        )
+        Page.objects.filter(url_path="/home/events/").update(
+            content_type=missing_page_content_type
+        )
+
+        pages = list(
+            Page.objects.get(url_path="/home/")
+            .get_children()
+            .specific(reuse_base_fields=True)
+        )
+        self.assertSameSpecificPages(
+            pages,
+            [
+                Page.objects.get(url_path="/home/events/"),
+                Page.objects.get(url_path="/home/about-us/").specific,
+                Page.objects.get(url_path="/home/other/").specific,
+            ],
+        )
+
+    def test_specific_reusing_base_fields_handles_missing_rows(self):
+        with mock.patch(
+            "wagtail.query.ContentType.objects.get_for_id",
+            return_value=ContentType.objects.get_for_model(EventPage),
+        ):
+            with self.assertWarnsRegex(
+                RuntimeWarning,
+                "Specific versions of the following items could not be found",
+            ):
+                pages = list(
+                    Page.objects.get(url_path="/home/")
+                    .get_children()
+                    .specific(reuse_base_fields=True)
+                )
+
+            self.assertSameSpecificPages(
+                pages,
+                [
+                    Page.objects.get(url_path="/home/events/"),
+                    Page.objects.get(url_path="/home/about-us/"),
+                    Page.objects.get(url_path="/home/other/"),
+                ],
+            )
+
+    def test_specific_reusing_base_fields_handles_missing_rows_of_models_without_fields(
+        self,
+    ):
+        home_page = Page.objects.get(url_path="/home/")
+        singleton_page = home_page.add_child(instance=SingletonPage(title="Singleton"))
+        Page.objects.filter(url_path="/home/events/").update(
+            content_type=ContentType.objects.get_for_model(SingletonPage)
+        )
+
+        with self.assertWarnsRegex(
+            RuntimeWarning,
+            "Specific versions of the following items could not be found",
+        ):
+            pages = list(home_page.get_children().specific(reuse_base_fields=True))
+
+        self.assertSameSpecificPages(
+            pages,
+            [
+                Page.objects.get(url_path="/home/events/"),
+                Page.objects.get(url_path="/home/about-us/").specific,
+                Page.objects.get(url_path="/home/other/").specific,
+                singleton_page,
+            ],
+        )
+
 
 class TestSpecificQuerySearch(WagtailTestUtils, TransactionTestCase):
     fixtures = ["test_specific.json"]
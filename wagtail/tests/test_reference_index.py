@@ -1,9 +1,13 @@
+import json
+import os
+import tempfile
 from io import StringIO
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
 from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.db import models, transaction
 from django.test import TestCase
 from django.utils.functional import SimpleLazyObject
 
@@ -12,9 +16,12 @@ from wagtail.documents import get_document_model
 from wagtail.documents.tests.utils import get_test_document_file
 from wagtail.images import get_image_model
 from wagtail.images.tests.utils import get_test_image_file
+from wagtail.management.commands.rebuild_references_index import index_objects
 from wagtail.models import Page, ReferenceIndex
+from wagtail.models.reference_index import ReferenceExtractionPlan
 from wagtail.rich_text import RichText
 from wagtail.test.testapp.models import (
+    AddedStreamFieldWithoutDefaultPage,
     Advert,
     AdvertWithCustomUUIDPrimaryKey,
     EventPage,
@@ -310,6 +317,162 @@ class TestCreateOrUpdateForObject(TestCase):
         refs = ReferenceIndex.get_references_to(related_page)
         self.assertEqual(refs.count(), 1)
 
+    def test_extraction_plan(self):
+        plan = ReferenceIndex._get_extraction_plan(EventPage)
+        self.assertIsNone(plan.parental_key)
+        self.assertIn(
+            (
+                ReferenceExtractionPlan.FOREIGN_KEY,
+                EventPage._meta.get_field("feed_image"),
+            ),
+            plan.fields,
+        )
+        self.assertIn("carousel_items", plan.child_relations)
+
+        plan = ReferenceIndex._get_extraction_plan(EventPageCarouselItem)
+        self.assertEqual(plan.parental_key.name, "page")
+
+        # StreamFields without any blocks that can contain references are skipped
+        plan = ReferenceIndex._get_extraction_plan(AddedStreamFieldWithoutDefaultPage)
+        self.assertNotIn(
+            AddedStreamFieldWithoutDefaultPage._meta.get_field("body"),
+            [field for kind, field in plan.fields],
+        )
+
+
+class TestRebuildReferencesIndex(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        management.call_command("rebuild_references_index", stdout=StringIO())
+        self.expected_references = self.get_references()
+        self.assertTrue(self.expected_references)
+
+        checkpoint_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(checkpoint_dir.cleanup)
+        self.checkpoint_path = os.path.join(checkpoint_dir.name, "checkpoint.json")
+
+    def get_references(self):
+        return set(
+            ReferenceIndex.objects.values_list(
+                "content_type",
+                "base_content_type",
+                "object_id",
+                "to_content_type",
+                "to_object_id",
+                "model_path",
+                "content_path",
+            )
+        )
+
+    def test_create_or_update_for_objects(self):
+        pages = list(EventPage.objects.all())
+        ReferenceIndex.objects.all().delete()
+
+        with transaction.atomic():
+            ReferenceIndex.create_or_update_for_objects(pages)
+
+        self.assertEqual(
+            self.get_references(),
+            {
+                reference
+                for reference in self.expected_references
+                if reference[0] == ContentType.objects.get_for_model(EventPage).id
+            },
+        )
+
+    def test_create_or_update_for_objects_queries(self):
+        advert = Advert.objects.create(text="An advert")
+        objects = [
+            VariousOnDeleteModel.objects.create(text=str(i), on_delete_cascade=advert)
+            for i in range(10)
+        ]
+        ReferenceIndex.objects.all().delete()
+
+        # One query to find the existing references, and one to add the new ones
+        with self.assertNumQueries(2):
+            ReferenceIndex.create_or_update_for_objects(objects)
+
+        self.assertEqual(ReferenceIndex.get_references_to(advert).count(), 10)
+
+    def test_rebuild_with_checkpoint(self):
+        page_content_type = ContentType.objects.get_for_model(Page)
+        ReferenceIndex.objects.filter(content_type__model="eventpage").delete()
+        # A reference from a page that no longer exists
+        ReferenceIndex.objects.create(
+            content_type=page_content_type,
+            base_content_type=page_content_type,
+            object_id="999999",
+            to_content_type=page_content_type,
+            to_object_id="2",
+            model_path="owner",
+            content_path="owner",
+            content_path_hash=ReferenceIndex._get_content_path_hash("owner"),
+        )
+
+        stdout = StringIO()
+        management.call_command(
+            "rebuild_references_index",
+            checkpoint=self.checkpoint_path,
+            chunk_size=2,
+            stdout=stdout,
+        )
+
+        self.assertEqual(self.get_references(), self.expected_references)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+        self.assertIn("Rebuilding reference index", stdout.getvalue())
+
+    def test_resume_after_interruption(self):
+        ReferenceIndex.objects.all().delete()
+        object_count = sum(
+            model.objects.count() for model in ReferenceIndex.indexed_models
+        )
+
+        calls = 0
+
+        def interrupted_index_objects(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls > 5:
+                raise KeyboardInterrupt
+            return index_objects(*args, **kwargs)
+
+        with mock.patch(
+            "wagtail.management.commands.rebuild_references_index.index_objects",
+            side_effect=interrupted_index_objects,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                management.call_command(
+                    "rebuild_references_index",
+                    checkpoint=self.checkpoint_path,
+                    chunk_size=1,
+                    stdout=StringIO(),
+                )
+
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        self.assertTrue(checkpoint["progress"] or checkpoint["completed"])
+
+        stdout = StringIO()
+        management.call_command(
+            "rebuild_references_index",
+            checkpoint=self.checkpoint_path,
+            chunk_size=1,
+            stdout=stdout,
+        )
+
+        # The objects indexed before the interruption are not indexed again
+        self.assertIn("Resuming reference index rebuild", stdout.getvalue())
+        self.assertIn("Indexed %d objects" % (object_count - 5), stdout.getvalue())
+        self.assertEqual(self.get_references(), self.expected_references)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_invalid_workers(self):
+        with self.assertRaisesMessage(
+            management.CommandError, "--workers must be at least 1"
+        ):
+            management.call_command("rebuild_references_index", workers=0)
+
 
 class TestDescribeOnDelete(TestCase):
     fixtures = ["test.json"]
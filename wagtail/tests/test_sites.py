@@ -3,6 +3,7 @@ from django.test import TestCase, override_settings
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
+from wagtail.models.sites import get_site_for_hostname
 
 
 class TestSiteNaturalKey(TestCase):
@@ -152,6 +153,99 @@ class TestFindSiteForRequest(TestCase):
         self.assertEqual(Site.find_for_request(request), self.default_site)
 
 
+@override_settings(
+    WAGTAIL_SITE_HOSTNAME_INDEX=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestFindSiteForRequestWithHostnameIndex(TestFindSiteForRequest):
+    def setUp(self):
+        super().setUp()
+        # The index is process-local, so make sure it doesn't hold sites
+        # left over from rolled-back transactions in other tests
+        Site.clear_site_hostname_index()
+
+    def get_request(self, hostname, port=80):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": hostname, "SERVER_PORT": port})
+        return request
+
+    def test_no_queries_once_populated(self):
+        Site.find_for_request(self.get_request("example.com"))
+
+        with self.assertNumQueries(0):
+            site = Site.find_for_request(self.get_request("example.com"))
+            self.assertEqual(site, self.site)
+            self.assertEqual(site.root_page.pk, 2)
+            self.assertEqual(
+                Site.find_for_request(self.get_request("unknown.com")),
+                self.default_site,
+            )
+
+    def test_returns_copies(self):
+        site = Site.find_for_request(self.get_request("example.com"))
+        site.site_name = "Changed"
+        site.root_page.title = "Changed"
+
+        site = Site.find_for_request(self.get_request("example.com"))
+        self.assertEqual(site.site_name, "")
+        self.assertNotEqual(site.root_page.title, "Changed")
+
+    def test_invalidated_on_site_save(self):
+        self.assertEqual(
+            Site.find_for_request(self.get_request("example.com", 8080)), self.site
+        )
+
+        other_site = Site.objects.create(
+            hostname="example.com", port=8080, root_page=Page.objects.get(pk=2)
+        )
+        self.assertEqual(
+            Site.find_for_request(self.get_request("example.com", 8080)), other_site
+        )
+
+    def test_invalidated_on_site_delete(self):
+        self.assertEqual(
+            Site.find_for_request(self.get_request("example.com")), self.site
+        )
+
+        self.site.delete()
+        self.assertEqual(
+            Site.find_for_request(self.get_request("example.com")), self.default_site
+        )
+
+    def test_invalidated_on_root_page_save(self):
+        Site.find_for_request(self.get_request("example.com"))
+
+        root_page = Page.objects.get(pk=2).specific
+        root_page.title = "New title"
+        root_page.save()
+
+        site = Site.find_for_request(self.get_request("example.com"))
+        self.assertEqual(site.root_page.title, "New title")
+
+    def test_matches_database_lookup(self):
+        Site.objects.create(
+            hostname="example.com", port=8000, root_page=Page.objects.get(pk=2)
+        )
+        Site.objects.create(
+            hostname="other.com", port=8000, root_page=Page.objects.get(pk=2)
+        )
+
+        for hostname, port in [
+            ("example.com", 80),
+            ("example.com", 8000),
+            ("example.com", 1234),
+            ("other.com", 80),
+            ("other.com", 8000),
+            ("localhost", 80),
+            ("unknown.com", 80),
+        ]:
+            with self.subTest(hostname=hostname, port=port):
+                self.assertEqual(
+                    Site.find_for_request(self.get_request(hostname, port)),
+                    get_site_for_hostname(hostname, port),
+                )
+
+
 class TestDefaultSite(TestCase):
     def test_create_default_site(self):
         Site.objects.all().delete()
@@ -4,7 +4,7 @@ import pickle
 from django.apps import apps
 from django.db import connection, models
 from django.template import Context, Template, engines
-from django.test import TestCase, skipUnlessDBFeature
+from django.test import TestCase, override_settings, skipUnlessDBFeature
 from django.utils.safestring import SafeString
 
 from wagtail import blocks
@@ -13,7 +13,7 @@ from wagtail.blocks import StreamBlockValidationError, StreamValue
 from wagtail.fields import StreamField
 from wagtail.images.models import Image
 from wagtail.images.tests.utils import get_test_image_file
-from wagtail.models import Page
+from wagtail.models import Page, Revision
 from wagtail.rich_text import RichText
 from wagtail.signal_handlers import disable_reference_index_auto_update
 from wagtail.test.testapp.models import (
@@ -24,6 +24,7 @@ from wagtail.test.testapp.models import (
     StreamPage,
 )
 from wagtail.test.utils.form_data import nested_form_data, rich_text, streamfield
+from wagtail.utils.json import JSONCodec
 
 
 class TestLazyStreamField(TestCase):
@@ -806,6 +807,49 @@ class TestJSONStreamField(TestCase):
         self.assertEqual(instance.id, self.instance.id)
 
 
+class RecordingJSONCodec(JSONCodec):
+    calls = []
+
+    def dumps(self, value):
+        self.calls.append("dumps")
+        return super().dumps(value)
+
+    def loads(self, value):
+        self.calls.append("loads")
+        return super().loads(value)
+
+
+@override_settings(
+    WAGTAIL_JSON_CODEC="wagtail.tests.test_streamfield.RecordingJSONCodec"
+)
+class TestStreamFieldJSONCodec(TestCase):
+    def setUp(self):
+        RecordingJSONCodec.calls.clear()
+
+    def test_field_uses_codec(self):
+        instance = JSONStreamModel.objects.create(
+            body=[{"type": "text", "value": "foo"}],
+        )
+        self.assertEqual(RecordingJSONCodec.calls, ["dumps"])
+
+        instance = JSONStreamModel.objects.get(pk=instance.pk)
+        self.assertEqual(RecordingJSONCodec.calls, ["dumps", "loads"])
+        self.assertEqual(instance.body[0].value, "foo")
+
+    def test_revision_uses_codec(self):
+        page = StreamPage(title="stream page", body=[("text", "hello")])
+        Page.objects.get(id=2).add_child(instance=page)
+        revision = page.save_revision()
+
+        RecordingJSONCodec.calls.clear()
+        page = Revision.objects.get(pk=revision.pk).as_object()
+
+        # The revision content is decoded, then the StreamField data of the
+        # page it is applied to and the StreamField data within the content
+        self.assertEqual(RecordingJSONCodec.calls, ["loads", "loads", "loads"])
+        self.assertEqual(page.body[0].value, "hello")
+
+
 class TestStreamFieldPickleSupport(TestCase):
     def setUp(self):
         # Find root page
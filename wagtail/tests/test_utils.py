@@ -1,8 +1,13 @@
+import datetime
 import hashlib
+import json
+import math
 import os
 import pickle
 import tempfile
 import unittest
+import uuid
+from decimal import Decimal
 from io import BytesIO
 from pathlib import Path
 
@@ -10,6 +15,7 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.serializers.json import DjangoJSONEncoder
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils.text import slugify
 from django.utils.translation import _trans
@@ -31,6 +37,13 @@ from wagtail.coreutils import (
 )
 from wagtail.models import Page, Site
 from wagtail.utils.file import hash_filelike
+from wagtail.utils.json import (
+    CodecJSONEncoder,
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+)
 from wagtail.utils.templates import template_is_overridden
 from wagtail.utils.utils import deep_update, flatten_choices
 from wagtail.utils.version import get_main_version
@@ -655,3 +668,67 @@ class TestFlattenChoices(SimpleTestCase):
                 "unknown": "Unknown",
             },
         )
+
+
+class TestJSONCodec(SimpleTestCase):
+    def get_codecs(self):
+        codecs = [JSONCodec()]
+        for codec_class in (OrjsonCodec, MsgspecCodec):
+            try:
+                codecs.append(codec_class())
+            except ImportError:
+                pass
+        return codecs
+
+    def test_default_codec(self):
+        get_json_codec.cache_clear()
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        self.assertIsInstance(get_json_codec(), OrjsonCodec)
+
+    @override_settings(WAGTAIL_JSON_CODEC="wagtail.utils.json.JSONCodec")
+    def test_codec_setting(self):
+        self.assertIs(type(get_json_codec()), JSONCodec)
+
+    def test_dumps(self):
+        value = {
+            "date": datetime.date(2025, 1, 2),
+            "time": datetime.datetime(2025, 1, 2, 3, 4, 5, 678901),
+            "price": Decimal("1.50"),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "title": _("Title"),
+        }
+        for codec in self.get_codecs():
+            with self.subTest(codec=type(codec).__name__):
+                self.assertEqual(
+                    codec.dumps(value), json.dumps(value, cls=DjangoJSONEncoder)
+                )
+
+    def test_loads(self):
+        data = '{"text": "caf\\u00e9", "items": [1, 2.5, null, true]}'
+        for codec in self.get_codecs():
+            with self.subTest(codec=type(codec).__name__):
+                expected = {"text": "café", "items": [1, 2.5, None, True]}
+                self.assertEqual(codec.loads(data), expected)
+                self.assertEqual(codec.loads(data.encode()), expected)
+
+    def test_loads_falls_back_to_standard_library(self):
+        for codec in self.get_codecs():
+            with self.subTest(codec=type(codec).__name__):
+                value = codec.loads("[NaN, 1180591620717411303424]")
+                self.assertTrue(math.isnan(value[0]))
+                self.assertEqual(value[1], 2**70)
+
+    def test_loads_invalid_json(self):
+        for codec in self.get_codecs():
+            with self.subTest(codec=type(codec).__name__):
+                with self.assertRaises(ValueError):
+                    codec.loads("<p>Not JSON</p>")
+
+    def test_encoder_formatting_options(self):
+        self.assertEqual(
+            json.dumps({"a": 1}, cls=CodecJSONEncoder, indent=2), '{\n  "a": 1\n}'
+        )
+        self.assertEqual(json.dumps({"a": 1}, cls=CodecJSONEncoder), '{"a": 1}')
@@ -260,6 +260,33 @@ class TestPageUrlTags(TestCase):
             tpl.render(template.Context({"page": 123}))
 
 
+class TestPageUrlsTag(TestCase):
+    fixtures = ["test.json"]
+
+    def test_pageurls(self):
+        pages = Page.objects.filter(depth=3).order_by("path")
+        tpl = template.Template(
+            """{% load wagtailcore_tags %}{% pageurls pages as links %}"""
+            """{% for page, url in links %}<a href="{{ url }}">{{ page.pk }}</a>{% endfor %}"""
+        )
+        result = tpl.render(
+            template.Context({"pages": pages, "request": get_dummy_request()})
+        )
+        self.assertEqual(
+            result,
+            "".join(f'<a href="{page.url}">{page.pk}</a>' for page in pages),
+        )
+
+    def test_pageurls_with_non_page(self):
+        tpl = template.Template(
+            """{% load wagtailcore_tags %}{% pageurls pages as links %}"""
+        )
+        with self.assertRaisesMessage(
+            ValueError, "pageurls tag expected Page objects, got 'foo'"
+        ):
+            tpl.render(template.Context({"pages": ["foo"]}))
+
+
 class TestWagtailSiteTag(TestCase):
     fixtures = ["test.json"]
 
@@ -1,3 +1,13 @@
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.http import Http404
+from django.utils import translation
+
+from wagtail.coreutils import safe_md5
+
+
 class RouteResult:
     """
     An object to be returned from Page.route, which encapsulates
@@ -14,3 +24,126 @@ class RouteResult:
 
     def __getitem__(self, index):
         return (self.page, self.args, self.kwargs)[index]
+
+
+ROUTE_CACHE_VERSION_CACHE_KEY = "wagtail_route_cache_version"
+ROUTE_CACHE_TIMEOUT = 3600
+
+
+class RouteCache:
+    """
+    Maps (site, language, URL path) to the ID and content type of the page
+    that ``Page.route`` resolved it to, so that subsequent requests for the same
+    path can fetch the specific page in a single query instead of walking the
+    tree one path component at a time. Used by ``Page.route_for_request`` when
+    the ``WAGTAIL_ROUTE_CACHE`` setting is enabled.
+
+    Only routes that resolve through the default ``Page.route`` implementation
+    at every level of the tree are cached; paths that pass through a page type
+    with a custom ``route`` method (such as ``RoutablePageMixin``) are always
+    routed normally.
+
+    Entries are namespaced by a version token held in the cache, which is
+    replaced whenever pages are published, unpublished, moved or renamed.
+    """
+
+    def get_version(self):
+        version = cache.get(ROUTE_CACHE_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(ROUTE_CACHE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+            version = cache.get(ROUTE_CACHE_VERSION_CACHE_KEY)
+        return version
+
+    def get_cache_key(self, site, path_components):
+        version = self.get_version()
+        if version is None:
+            return None
+
+        path = "/".join(path_components)
+        path_hash = safe_md5(path.encode(), usedforsecurity=False).hexdigest()
+        return "wagtail_route:%s:%s:%s:%s" % (
+            version,
+            site.pk,
+            translation.get_language(),
+            path_hash,
+        )
+
+    def get_cached_route(self, cached):
+        page_id, content_type_id = cached
+        try:
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+        except ContentType.DoesNotExist:
+            return None
+        if model is None:
+            return None
+
+        page = model.objects.filter(pk=page_id, live=True).first()
+        if page is None:
+            return None
+        return RouteResult(page)
+
+    def is_cacheable(self, root_page, result, path_components):
+        from wagtail.models import Page
+
+        if type(result) is not RouteResult or result.args or result.kwargs:
+            return False
+
+        # The page must be the one that plain slug-based routing would reach
+        page = result.page
+        expected_url_path = root_page.url_path + "".join(
+            component + "/" for component in path_components
+        )
+        if page.url_path != expected_url_path:
+            return False
+
+        # ...and no page along the way may have customised the routing
+        content_type_ids = (
+            Page.objects.ancestor_of(page, inclusive=True)
+            .filter(depth__gte=root_page.depth)
+            .values_list("content_type_id", flat=True)
+        )
+        for content_type_id in content_type_ids:
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None or model.route is not Page.route:
+                return False
+
+        return True
+
+    def route(self, request, site, path_components):
+        """
+        Return the ``RouteResult`` for ``path_components`` on ``site``, as
+        ``site.root_page.localized.specific.route()`` would. Can raise
+        ``Http404`` in the same circumstances.
+        """
+        cache_key = self.get_cache_key(site, path_components)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached:
+            result = self.get_cached_route(cached)
+            if result is not None:
+                return result
+
+        root_page = site.root_page.localized.specific
+        try:
+            result = root_page.route(request, path_components)
+        except Http404:
+            if cached:
+                # The cached page no longer resolves, so forget it
+                cache.delete(cache_key)
+            raise
+
+        # Overwrite any cached page that no longer resolves with the result
+        if cache_key is not None and cached is not False:
+            if self.is_cacheable(root_page, result, path_components):
+                value = (result.page.pk, result.page.content_type_id)
+            else:
+                # Remember that this path needs to be routed normally, so that
+                # it isn't checked again on every request
+                value = False
+            cache.set(cache_key, value, ROUTE_CACHE_TIMEOUT)
+        return result
+
+    def clear(self):
+        cache.set(ROUTE_CACHE_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+route_cache = RouteCache()
@@ -0,0 +1,121 @@
+"""
+The JSON codec used for StreamField data and revision content, which can be
+large enough for decoding it to be a noticeable part of serving a page.
+
+The codec is chosen with the ``WAGTAIL_JSON_CODEC`` setting, a dotted path to a
+``JSONCodec`` subclass. By default, JSON is decoded with orjson or msgspec if
+either is installed, and with the standard library otherwise.
+"""
+
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON with the standard library's ``json`` module,
+    encoding dates, times, decimals and UUIDs with ``DjangoJSONEncoder``.
+    """
+
+    encoder = DjangoJSONEncoder
+
+    def dumps(self, value):
+        return json.dumps(value, cls=self.encoder)
+
+    def loads(self, value):
+        return json.loads(value)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Decodes JSON with orjson. JSON that orjson doesn't accept, such as ``NaN``
+    or integers outside the 64-bit range, is decoded by the standard library
+    instead. Values are encoded by ``JSONCodec``, so that the JSON written is
+    unchanged.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+
+    def loads(self, value):
+        try:
+            return self.orjson.loads(value)
+        except self.orjson.JSONDecodeError:
+            return super().loads(value)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Decodes JSON with msgspec. JSON that msgspec doesn't accept is decoded by
+    the standard library instead. Values are encoded by ``JSONCodec``, so that
+    the JSON written is unchanged.
+    """
+
+    def __init__(self):
+        import msgspec
+
+        self.decoder = msgspec.json.Decoder()
+        self.decode_error = msgspec.DecodeError
+
+    def loads(self, value):
+        try:
+            return self.decoder.decode(value)
+        except self.decode_error:
+            return super().loads(value)
+
+
+@lru_cache(maxsize=None)
+def get_json_codec():
+    """
+    Returns the codec set by the ``WAGTAIL_JSON_CODEC`` setting, or the fastest
+    of the built-in codecs whose library is installed.
+    """
+    codec_path = getattr(settings, "WAGTAIL_JSON_CODEC", None)
+    if codec_path is not None:
+        return import_string(codec_path)()
+
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            pass
+
+    return JSONCodec()
+
+
+@receiver(setting_changed)
+def reset_json_codec(*, setting, **kwargs):
+    if setting == "WAGTAIL_JSON_CODEC":
+        get_json_codec.cache_clear()
+
+
+class CodecJSONEncoder(DjangoJSONEncoder):
+    """
+    A JSON encoder class for ``JSONField`` that encodes values with the JSON
+    codec.
+    """
+
+    def encode(self, o):
+        # Formatting options, such as those used to show JSON in forms, are
+        # left to the standard library
+        if self.indent is not None or self.sort_keys or not self.ensure_ascii:
+            return super().encode(o)
+        return get_json_codec().dumps(o)
+
+
+class CodecJSONDecoder(json.JSONDecoder):
+    """
+    A JSON decoder class for ``JSONField`` that decodes values with the JSON
+    codec.
+    """
+
+    def decode(self, s):
+        return get_json_codec().loads(s)